@@ -0,0 +1,45 @@
+"""
+Small helpers shared by the benchmark scripts.
+
+The scripts only depend on the standard library and on mathworld itself, so
+they can be run offline from the repository root, e.g.
+
+    python benchmarks/bench_line.py
+"""
+
+import os
+import sys
+import timeit
+
+# Make the in-tree package importable without installing it
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+
+def measure(function, number: int = 100, repeat: int = 5) -> float:
+    """
+    Time a callable with timeit.
+
+    Args:
+        function: The callable to time, called without arguments.
+        number (int): The number of calls per timing run.
+        repeat (int): The number of timing runs.
+
+    Returns:
+        float: The best time per call, in seconds.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def report(title: str, rows: list[tuple[str, float, float]]):
+    """
+    Print a before/after table.
+
+    Args:
+        title (str): The title of the table.
+        rows (list[tuple[str, float, float]]): Tuples of (case, before, after) times in seconds.
+    """
+    print(title)
+    print(f"{'case':<40}{'before':>14}{'after':>14}{'speedup':>10}")
+    for case, before, after in rows:
+        print(f"{case:<40}{before * 1e6:>11.1f} us{after * 1e6:>11.1f} us{before / after:>9.1f}x")
@@ -0,0 +1,31 @@
+"""
+Scoring points against lines with the symbolic Point API and with PointArray.
+"""
+
+from _common import measure, report
+
+import random
+
+from mathworld import Point, Line
+from mathworld.arrays import PointArray
+
+
+def main():
+    random.seed(0)
+    points = [Point(random.randint(-1000, 1000), random.randint(-1000, 1000)) for _ in range(1000)]
+    array = PointArray.from_points(points)
+    line = Line("y = 2*x/3 + 1")
+
+    rows = [
+        ('distanceLine, 1000 points', measure(lambda: [p.distanceLine(line) for p in points], number=1, repeat=3),
+         measure(lambda: array.distance_to_line(line), number=100)),
+        ('ison(Line), 1000 points', measure(lambda: [p.ison(line) for p in points], number=1, repeat=3),
+         measure(lambda: array.on_line(line), number=100)),
+        ('distancePoint, 1000 points', measure(lambda: [p.distancePoint(points[0]) for p in points], number=1, repeat=3),
+         measure(lambda: array.distance_to_point(points[0]), number=100)),
+    ]
+    report('Point vs PointArray', rows)
+
+
+if __name__ == '__main__':
+    main()
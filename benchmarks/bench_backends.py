@@ -0,0 +1,45 @@
+"""
+The same construction workload with the SymPy and the numeric backend.
+
+For each pair of random integer points the workload builds the segment
+(line and perpendicular bisector), a parallel and a perpendicular through a
+third point, intersects the line with a fixed line and measures a distance.
+"""
+
+from _common import measure
+
+import random
+
+from mathworld import Point, Line, Segment, SYMPY, NUMERIC
+
+
+def workload(points: list[tuple[int, int, int, int]], backend: str):
+    reference = Line("y = -x/3 + 2", backend=backend)
+    for x1, y1, x2, y2 in points:
+        p1, p2 = Point(x1, y1, backend=backend), Point(x2, y2, backend=backend)
+        segment = Segment(p1, p2)
+        segment.line.findParallel(p1)
+        segment.line.findPerpendicular(p2)
+        if not segment.line.isParallel(reference):
+            segment.line.intersection(reference)
+        p1.distanceLine(reference)
+
+
+def main():
+    random.seed(0)
+    points = []
+    while len(points) < 200:
+        x1, y1, x2, y2 = (random.randint(-100, 100) for _ in range(4))
+        if x1 != x2:
+            points.append((x1, y1, x2, y2))
+
+    exact = measure(lambda: workload(points, SYMPY), number=1, repeat=3)
+    numeric = measure(lambda: workload(points, NUMERIC), number=1, repeat=3)
+
+    print('Construction workload, 200 segments')
+    print(f"{'sympy':<10}{exact * 1e3:>10.1f} ms")
+    print(f"{'numeric':<10}{numeric * 1e3:>10.1f} ms  ({exact / numeric:.0f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Many small systems solved before (a loop over solve_system) and after
+(mathworld.batch.solve_systems_batch with one worker per CPU). The input
+repeats every system four times, as our pipelines do; the batch solves each
+distinct system once.
+
+    python benchmarks/bench_batch.py [number of systems]
+"""
+
+import os
+import sys
+
+from _common import measure, report
+
+from mathworld import clear_parse_cache, solve_system
+from mathworld.batch import solve_systems_batch
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    distinct = [[f'{i + 2}*x + y = {i % 7}', f'x - {i % 5 + 1}*y = 1'] for i in range(n // 4)]
+    systems = distinct * 4
+
+    def loop():
+        clear_parse_cache()
+        return [solve_system(system, ['x', 'y']) for system in systems]
+
+    def batch(workers):
+        return lambda: list(solve_systems_batch(systems, ['x', 'y'], workers=workers))
+
+    workers = os.cpu_count() or 1
+    rows = [(f'{n} systems, 1 process', measure(loop, number=1, repeat=3), measure(batch(1), number=1, repeat=3))]
+    if workers > 1:
+        rows.append((f'{n} systems, {workers} processes', rows[0][1], measure(batch(workers), number=1, repeat=3)))
+    report('Batch solving', rows)
+
+
+if __name__ == '__main__':
+    main()
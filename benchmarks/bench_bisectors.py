@@ -0,0 +1,55 @@
+"""
+Line.findBisector and Line.isBisector before (distance equations handed to
+sp.solve, sp.simplify on square roots) and after (closed form on the
+normalized coefficients).
+"""
+
+from _common import measure, report
+
+import sympy as sp
+
+from mathworld import Line, Point
+
+
+def legacy_find_bisector(self: Line, line: Line) -> tuple:
+    x, y = sp.symbols('x y')
+    distance_self = (self.a * x + self.b * y + self.c) / sp.sqrt(self.a**2 + self.b**2)
+    distance_line = (line.a * x + line.b * y + line.c) / sp.sqrt(line.a**2 + line.b**2)
+    variable = y if not self.isVertical() else x
+    solutions = (sp.solve(sp.Eq(distance_self, distance_line), variable) +
+                 sp.solve(sp.Eq(distance_self, -distance_line), variable))
+    return tuple(Line(sp.Eq(variable, solution)) for solution in solutions)
+
+
+def legacy_is_bisector(self: Line, line1: Line, line2: Line) -> bool:
+    intersection_point = line1.intersection(line2)
+    if not self.isVertical():
+        test_point = Point(intersection_point.x + 1, intersection_point.y + self.slope)
+    else:
+        test_point = Point(intersection_point.x, intersection_point.y + 1)
+    return sp.simplify(test_point.distanceLine(line1) - test_point.distanceLine(line2)) == 0
+
+
+def main():
+    cases = [
+        ('axes', Line('y = 0'), Line('x = 0')),
+        ('rational slopes', Line('y = 2*x + 1'), Line('y = -x/3 + 4')),
+        ('vertical and oblique', Line('x = 2'), Line('y = 3*x/4 - 1')),
+    ]
+    rows = []
+    for name, line1, line2 in cases:
+        rows.append((f'findBisector, {name}', measure(lambda: legacy_find_bisector(line1, line2), number=3),
+                     measure(lambda: line1.findBisector(line2), number=50)))
+    for name, line1, line2 in cases:
+        bisector = line1.findBisector(line2)[0]
+        rows.append((f'isBisector, {name}', measure(lambda: legacy_is_bisector(bisector, line1, line2), number=3),
+                     measure(lambda: bisector.isBisector(line1, line2), number=50)))
+
+    line1, line2 = Line('y = 2*x + 1', backend='numeric'), Line('y = -x/3 + 4', backend='numeric')
+    rows.append(('findBisector, numeric', measure(lambda: legacy_find_bisector(line1.to_exact(), line2.to_exact()), number=3),
+                 measure(lambda: line1.findBisector(line2), number=2000)))
+    report('Line bisectors', rows)
+
+
+if __name__ == '__main__':
+    main()
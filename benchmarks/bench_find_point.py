@@ -0,0 +1,38 @@
+"""
+Point.findPoint before (circle equation handed to sp.solve) and after (closed
+form on top of Circle.intersection).
+"""
+
+from _common import measure, report
+
+import sympy as sp
+
+from mathworld import Point, Line, Circle
+
+
+def legacy_find_point(line: Line, point: Point, distance) -> tuple:
+    circle_eq = sp.Eq((sp.Symbol('x') - point.x)**2 +
+                      (sp.Symbol('y') - point.y)**2, distance**2)
+    return sp.solve([circle_eq, line.equation], (sp.Symbol('x'), sp.Symbol('y')))
+
+
+def main():
+    cases = [
+        ('point on the line', Line("y = -x + 5"), Point(3, 2), sp.Integer(2)),
+        ('point off the line', Line("y = 2*x + 1"), Point(1, 2), sp.sqrt(2)),
+        ('rational slope', Line("3*y = x + 1"), Point(0, 0), sp.Integer(4)),
+    ]
+    rows = []
+    for name, line, point, distance in cases:
+        rows.append((f'findPoint, {name}', measure(lambda: legacy_find_point(line, point, distance), number=5),
+                     measure(lambda: Point.findPoint(line, point, distance), number=200)))
+
+    circle = Circle(Point(0, 0), 5)
+    other = Circle(Point(6, 0), 5)
+    rows.append(('Circle.intersection(Circle)', measure(lambda: sp.solve([circle.equation, other.equation]), number=5),
+                 measure(lambda: circle.intersection(other), number=200)))
+    report('Point.findPoint', rows)
+
+
+if __name__ == '__main__':
+    main()
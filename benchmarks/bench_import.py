@@ -0,0 +1,90 @@
+"""
+Startup time of the package, measured in fresh interpreters, with the
+breakdown of the slowest imports from `python -X importtime`.
+
+"before" imports mathworld.elements and builds every module constant, which
+is what `import mathworld` used to do; "after" is the lazy package import.
+With --max-ms the script exits with status 1 if `import mathworld` takes
+longer than the given time, so it can guard against regressions, e.g.
+
+    python benchmarks/bench_import.py --max-ms 50
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from _common import report
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def startup_time(code: str, repeat: int = 5) -> float:
+    """
+    Best wall time of some import code, over fresh interpreters.
+
+    Args:
+        code (str): The code to time, run at the start of each interpreter.
+        repeat (int): The number of interpreters.
+
+    Returns:
+        float: The best time, in seconds.
+    """
+    environment = dict(os.environ, PYTHONPATH=SRC)
+    timed = f"import time\nstart = time.perf_counter()\n{code}\nprint(time.perf_counter() - start)"
+    return min(float(subprocess.run([sys.executable, '-c', timed], env=environment, capture_output=True,
+                                    text=True, check=True).stdout) for _ in range(repeat))
+
+
+def import_breakdown(module: str = 'mathworld', count: int = 5) -> list[str]:
+    """
+    The slowest imports triggered by importing a module, from `python -X importtime`.
+
+    Args:
+        module (str): The module to import.
+        count (int): The number of lines to return.
+
+    Returns:
+        list[str]: The importtime lines with the largest cumulative times.
+    """
+    environment = dict(os.environ, PYTHONPATH=SRC)
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], env=environment,
+                            capture_output=True, text=True, check=True).stderr
+    lines = [line for line in stderr.splitlines() if line.startswith('import time:')][1:]
+    # Skip the imports of the interpreter startup, which end with the site module
+    sites = [i for i, line in enumerate(lines) if line.split('|')[2].strip() == 'site']
+    lines = lines[sites[-1] + 1:] if sites else lines
+    return sorted(lines, key=lambda line: -int(line.split('|')[1]))[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='fail if `import mathworld` takes longer than this')
+    arguments = parser.parse_args()
+
+    eager = ("import mathworld.elements as elements\n"
+             "[getattr(elements, name) for name in ('ORIGIN', 'X_AXIS', 'Y_AXIS', 'BISECTOR_1_3', 'BISECTOR_2_4')]")
+    lazy = startup_time("import mathworld")
+    rows = [
+        ('import mathworld', startup_time(eager), lazy),
+        ('from mathworld import use_backend', startup_time(eager),
+         startup_time("from mathworld import use_backend")),
+        ('from mathworld import Line, X_AXIS', startup_time(eager),
+         startup_time("from mathworld import Line, X_AXIS")),
+    ]
+    report('Package import', rows)
+
+    print()
+    print('Slowest imports of `import mathworld` (-X importtime, self | cumulative us):')
+    for line in import_breakdown():
+        print(' ', line)
+
+    if arguments.max_ms is not None and lazy * 1e3 > arguments.max_ms:
+        print(f"import mathworld took {lazy * 1e3:.1f} ms, more than {arguments.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
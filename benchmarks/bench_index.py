@@ -0,0 +1,64 @@
+"""
+Queries against a collection before (Point.ison / distanceLine on every
+element) and after (mathworld.index).
+"""
+
+import math
+import random
+
+from _common import measure, report
+
+from mathworld import Point, Line, Segment
+from mathworld.index import PointIndex, SegmentIndex, LineIndex
+
+
+def main():
+    random.seed(0)
+    segments = []
+    for _ in range(20000):
+        x, y = random.randint(0, 10000), random.randint(0, 10000)
+        segments.append(Segment(Point(x, y), Point(x + random.randint(-30, 30), y + random.randint(-30, 30))))
+    points = [segment.point1 for segment in segments]
+    lines = [Line.from_coefficients(random.randint(-5, 5), random.randint(1, 5), random.randint(-1000, 1000))
+             for _ in range(5000)]
+    # Lines in general position: every line has its own direction
+    general = [Line.from_coefficients(random.uniform(-1, 1), random.uniform(-1, 1), random.uniform(-1000, 1000),
+                                      backend='numeric') for _ in range(2000)]
+    query = segments[1234].middle
+    numeric = Point(5000.5, 4321.25, backend='numeric')
+
+    segment_index, point_index, line_index = SegmentIndex(segments), PointIndex(points), LineIndex(lines)
+    general_index = LineIndex(general)
+    floats = [(float(p.x), float(p.y)) for p in points]
+
+    rows = [
+        ('segments containing a point (exact)',
+         measure(lambda: [s for s in segments if query.ison(s)], number=1, repeat=1),
+         measure(lambda: segment_index.locate(query), number=100)),
+        ('nearest segment',
+         measure(lambda: min(segments, key=lambda s: _distance(numeric, s)), number=1, repeat=3),
+         measure(lambda: segment_index.nearest(numeric), number=100)),
+        ('5 nearest points',
+         measure(lambda: sorted(floats, key=lambda p: math.hypot(p[0] - 5000.5, p[1] - 4321.25))[:5], number=3),
+         measure(lambda: point_index.nearest(numeric, k=5), number=1000)),
+        ('nearest line',
+         measure(lambda: min(lines, key=numeric.distanceLine), number=1, repeat=3),
+         measure(lambda: line_index.nearest(numeric), number=1000)),
+        ('nearest line, general position',
+         measure(lambda: min(general, key=numeric.distanceLine), number=3),
+         measure(lambda: general_index.nearest(numeric), number=1000)),
+    ]
+    report('Spatial index', rows)
+
+
+def _distance(point, segment):
+    x, y = float(point.x), float(point.y)
+    x1, y1, x2, y2 = (float(v) for v in (segment.point1.x, segment.point1.y, segment.point2.x, segment.point2.y))
+    dx, dy = x2 - x1, y2 - y1
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0 else max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length))
+    return math.hypot(x - x1 - t * dx, y - y1 - t * dy)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+All intersecting pairs among random short segments: pairwise checks against
+the sweep of mathworld.algorithms.segment_intersections.
+"""
+
+from _common import measure
+
+import itertools
+import random
+
+from mathworld import Point, Segment, NUMERIC
+from mathworld.algorithms import segment_intersections, _segment_data, _segments_intersect
+
+
+def pairwise(segments: list[Segment]) -> list[tuple[int, int]]:
+    data = _segment_data(segments)
+    return [(i, j) for i, j in itertools.combinations(range(len(data)), 2)
+            if _segments_intersect(data[i], data[j])]
+
+
+def random_segments(n: int) -> list[Segment]:
+    segments = []
+    for _ in range(n):
+        x, y = random.uniform(0, 1000), random.uniform(0, 1000)
+        segments.append(Segment(Point(x, y, backend=NUMERIC),
+                                Point(x + random.uniform(-20, 20), y + random.uniform(-20, 20), backend=NUMERIC)))
+    return segments
+
+
+def main():
+    random.seed(0)
+    print(f"{'segments':>10}{'pairwise':>14}{'sweep':>14}")
+    for n in (500, 2000, 10000):
+        segments = random_segments(n)
+        sweep = measure(lambda: segment_intersections(segments), number=1, repeat=1)
+        if n <= 2000:
+            assert pairwise(segments) == segment_intersections(segments)
+            naive = f"{measure(lambda: pairwise(segments), number=1, repeat=1):>12.2f} s"
+        else:
+            naive = f"{'-':>14}"
+        print(f"{n:>10}{naive}{sweep:>12.2f} s")
+
+
+if __name__ == '__main__':
+    main()
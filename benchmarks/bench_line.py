@@ -0,0 +1,80 @@
+"""
+Per-line construction cost of Line, before and after the coefficient-first engine.
+
+"before" is a verbatim copy of the previous Line.__init__ algorithm (sp.solve,
+string round-trip, lcm over ordered terms, simplify), kept here as reference.
+"""
+
+from _common import measure, report
+
+import sympy as sp
+
+from mathworld import Line, Point
+from mathworld.equations import equation, expression
+
+
+def legacy_line(_equation: sp.Equality) -> tuple:
+    # Previous Line.__init__, returning (a, b, c, slope, intercept)
+    if 'y' in str(_equation):
+        _equation = sp.Eq(expression('y'), expression(
+            str(sp.solve(_equation, 'y')[0])))
+        lhs, rhs = _equation.lhs, _equation.rhs
+        lcm_denoms = sp.lcm([term.as_numer_denom()[1]
+                            for term in (lhs - rhs).as_ordered_terms()])
+        implicit = sp.Eq(((lhs - rhs) * lcm_denoms).simplify(), 0)
+        slope = sp.simplify(sp.diff(_equation.rhs, sp.Symbol('x')))
+        intercept = sp.solve(_equation, 'y')[0].subs('x', 0)
+        x, y = sp.symbols('x y')
+        a = implicit.lhs.as_coefficients_dict().get(x, 0)
+        b = implicit.lhs.as_coefficients_dict().get(y, 0)
+        c = implicit.lhs.as_coefficients_dict().get(1, 0)
+    else:
+        _equation = sp.Eq(expression('x'), expression(
+            str(sp.solve(_equation, 'x')[0])))
+        lhs, rhs = _equation.lhs, _equation.rhs
+        lcm_denoms = sp.lcm([term.as_numer_denom()[1]
+                            for term in (lhs - rhs).as_ordered_terms()])
+        implicit = sp.Eq(((lhs - rhs) * lcm_denoms).simplify(), 0)
+        a = implicit.lhs.as_coefficients_dict().get(sp.Symbol('x'), 0)
+        b = sp.Integer(0)
+        c = implicit.lhs.as_coefficients_dict().get(1, 0)
+        slope, intercept = sp.oo, None
+    return a, b, c, slope, intercept
+
+
+def legacy_find_line(point1: Point, point2: Point) -> tuple:
+    slope = (point2.y - point1.y) / (point2.x - point1.x)
+    intercept = point1.y - slope * point1.x
+    return legacy_line(sp.Eq(expression('y'), slope * expression('x') + intercept))
+
+
+CASES = {
+    'integer': equation('y = 2*x + 3'),
+    'rational': equation('3*y - 1 = 2*x/5'),
+    'float-derived': sp.Eq(sp.Symbol('y'), sp.Rational('0.25') * sp.Symbol('x') - sp.Rational('1.5')),
+    'vertical': equation('2*x = 7'),
+    'radical': sp.Eq(sp.Symbol('y'), sp.sqrt(2) * sp.Symbol('x') + 1),
+}
+
+
+def main():
+    rows = []
+    for name, eq in CASES.items():
+        new = Line(eq)
+        # Both engines must agree before comparing their cost (the previous
+        # engine reported a = 0 for irrational slopes, so skip that case)
+        assert name == 'radical' or legacy_line(eq) == (new.a, new.b, new.c, new.slope, new.intercept), name
+        rows.append((f'Line(Eq) {name}', measure(lambda: legacy_line(eq), number=20),
+                     measure(lambda: Line(eq), number=200)))
+
+    p1, p2 = Point(1, 2), Point(4, 7)
+    rows.append(('Line.findLine(p1, p2)', measure(lambda: legacy_find_line(p1, p2), number=20),
+                 measure(lambda: Line.findLine(p1, p2), number=200)))
+    rows.append(('Line.from_coefficients(2, -3, 5)', measure(lambda: legacy_line(sp.Eq(2 * sp.Symbol('x') - 3 * sp.Symbol('y') + 5, 0)), number=20),
+                 measure(lambda: Line.from_coefficients(2, -3, 5), number=200)))
+
+    report('Line construction', rows)
+
+
+if __name__ == '__main__':
+    main()
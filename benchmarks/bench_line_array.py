@@ -0,0 +1,66 @@
+"""
+Bulk queries on many lines: pairs of Line objects compared one by one
+(isParallel, isPerpendicular, intersection) and the grouping and blocked
+intersections of LineArray.
+
+    python benchmarks/bench_line_array.py
+"""
+
+from _common import measure, report
+
+import time
+
+import numpy as np
+
+from mathworld import Line
+from mathworld.arrays import LineArray
+
+
+def random_array(n: int, seed: int = 0) -> LineArray:
+    # Integer directions, as in floor plans and street grids, with many parallel lines
+    generator = np.random.default_rng(seed)
+    a = generator.integers(-5, 6, n).astype(float)
+    b = generator.integers(-5, 6, n).astype(float)
+    b[(a == 0) & (b == 0)] = 1
+    return LineArray(a, b, generator.integers(-1000, 1001, n))
+
+
+def pairs(lines: list[Line], test) -> list[tuple[int, int]]:
+    return [(i, j) for i, line1 in enumerate(lines) for j in range(i + 1, len(lines)) if test(line1, lines[j])]
+
+
+def main(n: int = 300):
+    array = random_array(n)
+    lines = array.to_lines()
+
+    rows = [
+        (f'parallel classes, {n} lines',
+         measure(lambda: pairs(lines, Line.isParallel), number=1, repeat=3),
+         measure(lambda: array.parallel_groups(), number=20)),
+        (f'perpendicular classes, {n} lines',
+         measure(lambda: pairs(lines, Line.isPerpendicular), number=1, repeat=3),
+         measure(lambda: array.perpendicular_directions(), number=20)),
+        (f'coincident duplicates, {n} lines',
+         measure(lambda: pairs(lines, lambda line1, line2: line1.intersection(line2) is line1), number=1, repeat=3),
+         measure(lambda: array.coincident_groups(), number=20)),
+        (f'all-pairs intersections, {n} lines',
+         measure(lambda: [line1.intersection(line2) for i, line1 in enumerate(lines) for line2 in lines[i + 1:]],
+                 number=1, repeat=3),
+         measure(lambda: list(array.intersections()), number=5)),
+    ]
+    report('Line pairs vs LineArray', rows)
+    print()
+
+    # The quadratic path is infeasible at these sizes: LineArray only
+    for size in (10 ** 5, 10 ** 6):
+        array = random_array(size, seed=1)
+        for name, operation in (('directions', array.directions),
+                                ('perpendicular_directions', array.perpendicular_directions),
+                                ('unique', array.unique)):
+            start = time.perf_counter()
+            operation()
+            print(f'{name}, {size} lines: {time.perf_counter() - start:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Loading a CSV file of points before (reading every row and calling
+Point(x, y) on the strings) and after (mathworld.loaders), and the peak
+memory of each approach.
+
+    python benchmarks/bench_loaders.py [number of points]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from _common import report
+
+import mathworld.arrays  # noqa: F401, keeps the NumPy import out of the measures
+from mathworld import Point
+from mathworld.loaders import load_points, load_point_arrays
+
+
+def legacy(path):
+    with open(path, newline='') as file:
+        rows = list(csv.reader(file))[1:]
+    return [Point(x, y) for x, y in rows]
+
+
+def streamed(path):
+    count = 0
+    for result in load_points(path):
+        count += result.ok
+    return count
+
+
+def blocks(path):
+    return sum(len(block) for block in load_point_arrays(path))
+
+
+def peak(function, path) -> tuple[float, float]:
+    # (seconds, peak MiB) of one run
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'points.csv')
+        with open(path, 'w') as file:
+            file.write('x,y\n')
+            for _ in range(n):
+                file.write(f'{random.randint(-1000, 1000)},{random.randint(-100000, 100000) / 100}\n')
+
+        legacy_time, legacy_memory = peak(legacy, path)
+        rows = []
+        for name, function in (('load_points', streamed), ('load_point_arrays', blocks)):
+            elapsed, memory = peak(function, path)
+            rows.append((f'{n} points, {name}', legacy_time, elapsed))
+            print(f'{name}: peak {memory:.1f} MiB, legacy peak {legacy_memory:.1f} MiB')
+        report('Loading a CSV file', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+A rendering frame that calls the same constructions several times, with the
+memoization of mathworld.memo disabled (before) and enabled (after).
+
+Every frame rebuilds its Point and Line objects, as a renderer reading the
+coordinates of a model does: the entries are shared through the canonical
+values of the arguments, not through the objects.
+
+    python benchmarks/bench_memo.py
+"""
+
+from _common import measure, report
+
+import random
+
+import sympy as sp
+
+from mathworld import Point, Line, configure_memo, clear_memo
+
+
+def frame(coordinates: list[tuple], repeats: int = 3, backend: str | None = None) -> list:
+    points = [Point(x, y, backend) for x, y in coordinates]
+    lines = [Line.findLine(p1, p2) for p1, p2 in zip(points, points[1:]) if p1.x != p2.x]
+    results = []
+    for _ in range(repeats):
+        for line, other, point in zip(lines, lines[1:], points):
+            results.append(line.findPerpendicular(point))
+            results.append(line.findParallel(point))
+            results.append(line.intersection(other))
+            results.append(point.distanceLine(line))
+        results.append(lines[0].findBisector(lines[1]))
+    return results
+
+
+def main(n: int = 40):
+    generator = random.Random(0)
+    exact = [(sp.Rational(generator.randint(-99, 99), generator.randint(1, 5)), generator.randint(-99, 99))
+             for _ in range(n)]
+    radical = [(generator.randint(-9, 9) * sp.sqrt(2), generator.randint(-9, 9)) for _ in range(n // 4)]
+    numeric = [(generator.uniform(-99, 99), generator.uniform(-99, 99)) for _ in range(n)]
+
+    rows = []
+    for name, coordinates, backend in (('rational', exact, None), ('radical', radical, None),
+                                       ('numeric', numeric, 'numeric')):
+        configure_memo(enabled=False)
+        before = frame(coordinates, backend=backend)
+        before_time = measure(lambda: frame(coordinates, backend=backend), number=1, repeat=3)
+
+        configure_memo(enabled=True)
+        clear_memo()
+        assert frame(coordinates, backend=backend) == before, name
+        rows.append((f'frame, {name} coordinates', before_time,
+                     measure(lambda: frame(coordinates, backend=backend), number=1, repeat=3)))
+        configure_memo(enabled=False)
+    report('Frame time without and with memoization', rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Memory per object of Point and Line, before (attributes in a per-instance
+__dict__, duplicate coordinates tuple, eager quadrant, slope and intercept)
+and after (__slots__, derived attributes computed on access).
+
+The memory is measured with tracemalloc and includes the coordinates and
+coefficients owned by each object, e.g.
+
+    python benchmarks/bench_memory.py --count 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+import _common  # noqa: F401, puts the in-tree package on sys.path
+import sympy as sp
+
+from mathworld import Point, Line
+
+
+class LegacyPoint():
+    # The attributes a Point used to keep in its __dict__
+    def __init__(self, x, y, backend):
+        self.backend = backend
+        self.x, self.y = x, y
+        self.cordinates = self.x, self.y
+        if x > 0 and y > 0:
+            self.quadrant = 1
+        elif x < 0 and y > 0:
+            self.quadrant = 2
+        elif x < 0 and y < 0:
+            self.quadrant = 3
+        elif x > 0 and y < 0:
+            self.quadrant = 4
+
+
+class LegacyLine():
+    # The attributes a Line used to keep in its __dict__
+    def __init__(self, a, b, c, backend):
+        self.backend = backend
+        self.a, self.b, self.c = a, b, c
+        self._equation = self._implicitEquation = None
+        self.slope = -a / b
+        self.intercept = -c / b
+
+
+def allocated(build, count: int) -> float:
+    """
+    Bytes allocated per object by build(i), over count objects kept alive together.
+
+    Args:
+        build: Callable building the i-th object.
+        count (int): The number of objects.
+
+    Returns:
+        float: The allocated bytes per object.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [build(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1_000_000, help='number of objects per case')
+    count = parser.parse_args().count
+
+    rows = [
+        ('numeric Point',
+         allocated(lambda i: LegacyPoint(i + 0.5, -i - 0.25, 'numeric'), count),
+         allocated(lambda i: Point(i + 0.5, -i - 0.25, backend='numeric'), count)),
+        ('exact Point',
+         allocated(lambda i: LegacyPoint(sp.Integer(i), sp.Rational(1, i + 2), 'sympy'), count),
+         allocated(lambda i: Point(sp.Integer(i), sp.Rational(1, i + 2), backend='sympy'), count)),
+        ('numeric Line',
+         allocated(lambda i: LegacyLine(0.6, 0.8, i + 0.5, 'numeric'), count),
+         allocated(lambda i: Line.from_coefficients(0.6, 0.8, i + 0.5, backend='numeric'), count)),
+        ('exact Line',
+         allocated(lambda i: LegacyLine(sp.Integer(-i), sp.Integer(1), sp.Integer(i + 1), 'sympy'), count),
+         allocated(lambda i: Line.from_coefficients(-i, 1, i + 1, backend='sympy'), count)),
+    ]
+
+    print(f'Memory per object, {count} objects per case')
+    print(f"{'case':<40}{'before':>14}{'after':>14}{'saving':>10}")
+    for case, before, after in rows:
+        print(f"{case:<40}{before:>12.0f} B{after:>12.0f} B{1 - after / before:>9.0%}")
+        print(f"{'  total':<40}{before * count / 2**20:>11.1f} MB{after * count / 2**20:>11.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+A construction evaluated for many (t, k) parameter pairs before (the
+symbolic result re-evaluated with subs for every pair) and after
+(mathworld.parametric.Construction, derived once and compiled with lambdify).
+
+    python benchmarks/bench_parametric.py
+"""
+
+import numpy as np
+import sympy as sp
+from _common import measure, report
+
+from mathworld import Point, Line, Segment
+from mathworld.parametric import Construction
+
+REFERENCE = Line('y = 3 - x')
+
+
+def construction(t, k):
+    line = Line.findLine(point1=Point(t, 2 * t), slope=k)
+    point = line.intersection(REFERENCE)
+    return point, Point(0, 0).distanceLine(line), Segment(Point(t, 2 * t), point).length
+
+
+def main():
+    compiled = Construction(construction)
+    t, k = compiled.symbols
+    point, distance, length = compiled.result
+    expressions = (point.x, point.y, distance, length)
+
+    pairs = [(sp.Rational(i, 7), sp.Rational(i % 11 + 2, 3)) for i in range(50)]
+    legacy = measure(lambda: [[expression.subs({t: ti, k: ki}).evalf() for expression in expressions]
+                              for ti, ki in pairs], number=1, repeat=3) / len(pairs)
+
+    rows = [('compile once (before: one pair)', legacy, measure(lambda: Construction(construction), number=1, repeat=3))]
+    for n in (1000, 1000000):
+        ts, ks = np.linspace(0, 10, n), np.linspace(2, 5, n)
+        rows.append((f'{n} pairs, per pair', legacy, measure(lambda: compiled(ts, ks), number=1, repeat=3) / n))
+    report('Parametric construction (before: subs per pair)', rows)
+
+
+if __name__ == '__main__':
+    main()
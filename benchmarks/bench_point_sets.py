@@ -0,0 +1,64 @@
+"""
+Algorithms on point sets: nested loops over Point objects, as written before
+mathworld.algorithms had them, against convex_hull, closest_pair and delaunay.
+
+"before" finds the closest pair with distancePoint on every pair and the hull
+by testing every pair of points as a hull edge with the exact orientation
+predicate.
+
+    python benchmarks/bench_point_sets.py
+"""
+
+from _common import measure, report
+
+import itertools
+import random
+import time
+
+import numpy as np
+
+from mathworld import Point
+from mathworld.algorithms import convex_hull, closest_pair, delaunay
+from mathworld.arrays import PointArray
+from mathworld.predicates import orientation
+
+
+def legacy_closest_pair(points: list[Point]) -> tuple[int, int]:
+    return min(itertools.combinations(range(len(points)), 2),
+               key=lambda pair: points[pair[0]].distancePoint(points[pair[1]]))
+
+
+def legacy_hull(points: list[Point]) -> set[int]:
+    vertices = set()
+    for i, j in itertools.permutations(range(len(points)), 2):
+        if all(orientation(points[i], points[j], point) >= 0 for point in points):
+            vertices |= {i, j}
+    return vertices
+
+
+def main(n: int = 100):
+    generator = random.Random(0)
+    points = [Point(generator.randint(-999, 999), generator.randint(-999, 999)) for _ in range(n)]
+
+    assert set(convex_hull(points)) == legacy_hull(points)
+    rows = [
+        (f'closest pair, {n} points', measure(lambda: legacy_closest_pair(points), number=1, repeat=1),
+         measure(lambda: closest_pair(points), number=5)),
+        (f'convex hull, {n} points', measure(lambda: legacy_hull(points), number=1, repeat=1),
+         measure(lambda: convex_hull(points), number=5)),
+    ]
+    report('Nested loops vs mathworld.algorithms', rows)
+    print()
+
+    rng = np.random.default_rng(0)
+    for size, triangulate in ((10 ** 5, True), (10 ** 6, False)):
+        array = PointArray(rng.uniform(-1, 1, size), rng.uniform(-1, 1, size))
+        operations = [convex_hull, closest_pair] + ([delaunay] if triangulate else [])
+        for operation in operations:
+            start = time.perf_counter()
+            operation(array)
+            print(f'{operation.__name__}, PointArray of {size} points: {time.perf_counter() - start:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
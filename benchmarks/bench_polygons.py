@@ -0,0 +1,81 @@
+"""
+Polygons assembled from Segment objects, as before Polygon and Triangle
+existed, against the compact vertex columns of Polygon and the vectorized
+PointArray.in_polygon.
+
+"before" builds the sides with their eager line and perpendicular bisector,
+sums the shoelace terms of the endpoints, intersects perpendicular bisectors
+for the circumcenter and casts a ray per query point; "after" uses Polygon,
+the closed-form Triangle centers and PointArray.in_polygon.
+
+    python benchmarks/bench_polygons.py
+"""
+
+from _common import measure, report
+
+import math
+import random
+
+import numpy as np
+
+from mathworld import Point, Segment, Polygon, Triangle
+from mathworld.arrays import PointArray
+
+
+def legacy_polygon(points: list[Point]) -> list[Segment]:
+    return Segment.precompute_all([Segment(point, points[i - len(points) + 1]) for i, point in enumerate(points)])
+
+
+def legacy_area(sides: list[Segment]):
+    return abs(sum(side.point1.x * side.point2.y - side.point2.x * side.point1.y for side in sides)) / 2
+
+
+def legacy_contains(sides: list[Segment], x: float, y: float) -> bool:
+    # Even-odd ray casting over the sides
+    inside = False
+    for side in sides:
+        x1, y1, x2, y2 = side.point1.x, side.point1.y, side.point2.x, side.point2.y
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def zone(n: int, backend: str | None = None) -> list[Point]:
+    # A star-shaped zone with n vertices, as a district boundary
+    generator = random.Random(0)
+    radii = [generator.randint(50, 100) for _ in range(n)]
+    return [Point(round(r * math.cos(2 * math.pi * k / n)), round(r * math.sin(2 * math.pi * k / n)), backend)
+            for k, r in enumerate(radii)]
+
+
+def main(n: int = 20, queries: int = 10 ** 5):
+    rows = []
+    points = zone(n)
+    rows.append((f'polygon + area, {n} exact vertices',
+                 measure(lambda: legacy_area(legacy_polygon(points)), number=1, repeat=3),
+                 measure(lambda: Polygon(points).area, number=20)))
+
+    generator = random.Random(1)
+    triangles = [[Point(generator.randint(-99, 99), generator.randint(-99, 99)) for _ in range(3)] for _ in range(20)]
+    rows.append(('circumcenter x20, exact',
+                 measure(lambda: [Segment(p1, p2).perpendicularBisector.intersection(Segment(p2, p3).perpendicularBisector)
+                                  for p1, p2, p3 in triangles], number=1, repeat=3) / 20,
+                 measure(lambda: [Triangle(*triangle).circumcenter for triangle in triangles], number=5) / 20))
+
+    sides = legacy_polygon(zone(n, 'numeric'))
+    polygon = Polygon(zone(n, 'numeric'))
+    rng = np.random.default_rng(0)
+    array = PointArray(rng.uniform(-100, 100, queries), rng.uniform(-100, 100, queries))
+    sample = list(zip(array.x[:1000].tolist(), array.y[:1000].tolist()))
+    assert [legacy_contains(sides, x, y) for x, y in sample] == array[:1000].in_polygon(polygon).tolist()
+    rows.append((f'point in polygon, per point, {n} sides',
+                 measure(lambda: [legacy_contains(sides, x, y) for x, y in sample], number=1, repeat=3) / 1000,
+                 measure(lambda: array.in_polygon(polygon), number=1, repeat=3) / queries))
+    report('Segments vs Polygon', rows)
+
+    seconds = measure(lambda: array.in_polygon(polygon), number=1, repeat=3)
+    print(f'\nPointArray.in_polygon: {60 * queries / seconds / 1e6:.0f} million points per minute ({n} sides)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Exact predicates before and after mathworld.predicates.
+
+On rational values "before" is the same code without the float filter (every
+determinant computed with integers). On irrational values "before" is a copy
+of the previous implementations: sp.simplify for Point.ison(Line), min/max of
+SymPy values for Point.ison(Segment) and slope comparisons for
+isParallel/isPerpendicular.
+
+    python benchmarks/bench_predicates.py
+"""
+
+import random
+from contextlib import contextmanager
+
+import sympy as sp
+from _common import measure, report
+
+import mathworld.predicates as predicates
+from mathworld import Point, Line, Segment
+
+
+@contextmanager
+def without_filter():
+    _filter = predicates._filter
+    predicates._filter = lambda values, determinant: None
+    try:
+        yield
+    finally:
+        predicates._filter = _filter
+
+
+def legacy_ison_line(point: Point, line: Line) -> bool:
+    return sp.simplify(line.a * point.x + line.b * point.y + line.c) == 0
+
+
+def legacy_ison_segment(point: Point, segment: Segment) -> bool:
+    min_x = min(segment.point1.x, segment.point2.x)
+    max_x = max(segment.point1.x, segment.point2.x)
+    min_y = min(segment.point1.y, segment.point2.y)
+    max_y = max(segment.point1.y, segment.point2.y)
+    return legacy_ison_line(point, segment.line) and min_x <= point.x <= max_x and min_y <= point.y <= max_y
+
+
+def rational_cases(n: int) -> list:
+    generator = random.Random(0)
+    value = lambda: sp.Rational(generator.randint(-10 ** 6, 10 ** 6), generator.randint(1, 9))
+    points = [Point(value(), value()) for _ in range(n)]
+    lines = [Line.from_coefficients(value(), value(), value()) for _ in range(n)]
+    segments = [Segment(p1, p2) for p1, p2 in zip(points, points[1:])]
+    # Points on the lines and on the segments, which the float filter can not decide
+    on_lines = [Point(point.x, -(line.a * point.x + line.c) / line.b) for point, line in zip(points, lines)]
+    middles = [segment.middle for segment in segments]
+    triples = list(zip(points, points[1:], points[2:]))
+    return [
+        ('ison(Line)', lambda: [point.ison(line) for point, line in zip(points, lines)]),
+        ('ison(Line), on the line', lambda: [point.ison(line) for point, line in zip(on_lines, lines)]),
+        ('ison(Segment)', lambda: [point.ison(segment) for point, segment in zip(points[2:], segments)]),
+        ('ison(Segment), middle', lambda: [point.ison(segment) for point, segment in zip(middles, segments)]),
+        ('isParallel', lambda: [line1.isParallel(line2) for line1, line2 in zip(lines, lines[1:])]),
+        ('isPerpendicular', lambda: [line1.isPerpendicular(line2) for line1, line2 in zip(lines, lines[1:])]),
+        ('orientation', lambda: [predicates.orientation(*triple) for triple in triples]),
+    ]
+
+
+def radical_cases(n: int) -> list:
+    generator = random.Random(0)
+    value = lambda: generator.randint(1, 9) * sp.sqrt(generator.choice([2, 3, 5])) + generator.randint(-9, 9)
+    points = [Point(value(), value()) for _ in range(n)]
+    lines = [Line.from_coefficients(value(), 1, value()) for _ in range(n)]
+    segments = [Segment(p1, p2) for p1, p2 in zip(points, points[1:])]
+    for segment in segments:
+        segment.line
+    return [
+        ('ison(Line)', lambda: [legacy_ison_line(point, line) for point, line in zip(points, lines)],
+         lambda: [point.ison(line) for point, line in zip(points, lines)]),
+        ('ison(Segment)', lambda: [legacy_ison_segment(point, segment) for point, segment in zip(points, segments)],
+         lambda: [point.ison(segment) for point, segment in zip(points, segments)]),
+        ('isParallel', lambda: [line1.slope == line2.slope for line1, line2 in zip(lines, lines[1:])],
+         lambda: [line1.isParallel(line2) for line1, line2 in zip(lines, lines[1:])]),
+    ]
+
+
+def main(n: int = 200):
+    rows = []
+    for name, operation in rational_cases(n):
+        with without_filter():
+            before = operation()
+            before_time = measure(operation, number=5) / n
+        assert operation() == before, name
+        rows.append((f'{name} x{n}', before_time, measure(operation, number=5) / n))
+    report('Predicates on rational values: integer evaluation -> float filter', rows)
+    print()
+
+    rows = []
+    for name, legacy, operation in radical_cases(n // 10):
+        assert [bool(value) for value in legacy()] == operation(), name
+        rows.append((f'{name} x{n // 10}', measure(legacy, number=1, repeat=3) / (n // 10),
+                     measure(operation, number=1, repeat=3) / (n // 10)))
+    report('Predicates on radical values: SymPy comparisons -> float filter', rows)
+
+
+if __name__ == '__main__':
+    main()
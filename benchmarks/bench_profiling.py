@@ -0,0 +1,36 @@
+"""
+Overhead of the profiling instrumentation: the undecorated functions
+("before") against the instrumented ones with profiling disabled and enabled.
+"""
+
+from _common import measure, report
+
+from mathworld import Point, Line, expression
+from mathworld.profiling import profile
+
+
+def main():
+    line1, line2 = Line('y = 2*x + 1'), Line('y = -x/3 + 4')
+    point = Point(1, 3)
+    numeric1, numeric2 = line1.to_numeric(), line2.to_numeric()
+
+    cases = [
+        ('Line.intersection', lambda: Line.intersection.__wrapped__(line1, line2),
+         lambda: line1.intersection(line2)),
+        ('Line.intersection, numeric', lambda: Line.intersection.__wrapped__(numeric1, numeric2),
+         lambda: numeric1.intersection(numeric2)),
+        ('Point.ison(Line)', lambda: Point.ison.__wrapped__(point, line1), lambda: point.ison(line1)),
+        ('expression (cached)', lambda: expression.__wrapped__('2*x + 1'), lambda: expression('2*x + 1')),
+    ]
+
+    rows = []
+    for name, plain, instrumented in cases:
+        rows.append((f'{name}, disabled', measure(plain, number=2000), measure(instrumented, number=2000)))
+    with profile():
+        for name, plain, instrumented in cases:
+            rows.append((f'{name}, enabled', measure(plain, number=2000), measure(instrumented, number=2000)))
+    report('Profiling overhead (before: undecorated)', rows)
+
+
+if __name__ == '__main__':
+    main()
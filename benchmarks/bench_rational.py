@@ -0,0 +1,78 @@
+"""
+Exact operations on integer and rational coordinates before (every value
+combined as a SymPy object) and after (the integer fast path of mathworld._rational,
+converting only the results back to SymPy).
+
+"before" runs the same code with the fast path disabled, which is the
+previous SymPy implementation of every operation.
+
+    python benchmarks/bench_rational.py
+"""
+
+import random
+from contextlib import contextmanager
+
+import sympy as sp
+from _common import measure, report
+
+import mathworld.elements as elements
+from mathworld import Point, Line, Segment
+
+
+@contextmanager
+def sympy_only():
+    # Every value is reported as not rational, so the SymPy code runs
+    integers = elements.integers
+    elements.integers = lambda *values: None
+    try:
+        yield
+    finally:
+        elements.integers = integers
+
+
+def points(n: int, rational: bool) -> list[Point]:
+    generator = random.Random(0)
+    value = (lambda: sp.Rational(generator.randint(-999, 999), generator.randint(1, 12))) if rational \
+        else (lambda: generator.randint(-999, 999))
+    return [Point(value(), value()) for _ in range(n)]
+
+
+def workload(points: list[Point]) -> dict:
+    lines = [Line.findLine(p1, p2) for p1, p2 in zip(points, points[1:]) if p1.x != p2.x]
+    pairs = list(zip(lines, lines[1:]))
+    segments = [Segment(p1, p2) for p1, p2 in zip(points, points[2:])]
+    for segment in segments:
+        segment.line
+    return {
+        'findLine': lambda: [Line.findLine(p1, p2) for p1, p2 in zip(points, points[1:])],
+        'findLine(point, slope)': lambda: [Line.findLine(point, slope=3) for point in points],
+        'from_coefficients': lambda: [Line.from_coefficients(point.x, point.y, 7) for point in points],
+        'intersection': lambda: [line1.intersection(line2) for line1, line2 in pairs],
+        'findParallel': lambda: [line.findParallel(point) for line, point in zip(lines, points)],
+        'findPerpendicular': lambda: [line.findPerpendicular(point) for line, point in zip(lines, points)],
+        'isParallel': lambda: [line1.isParallel(line2) for line1, line2 in pairs],
+        'isPerpendicular': lambda: [line1.isPerpendicular(line2) for line1, line2 in pairs],
+        'ison(Line)': lambda: [point.ison(line) for line, point in zip(lines, points)],
+        'ison(Segment)': lambda: [point.ison(segment) for segment, point in zip(segments, points)],
+        'distancePoint': lambda: [p1.distancePoint(p2) for p1, p2 in zip(points, points[1:])],
+    }
+
+
+def main(n: int = 200):
+    for kind in ('integer', 'rational'):
+        operations = workload(points(n, kind == 'rational'))
+        rows = []
+        for name, operation in operations.items():
+            after = operation()
+            with sympy_only():
+                before = operation()
+                before_time = measure(operation, number=3)
+            # Both paths must give the same results before comparing their cost
+            assert after == before, name
+            rows.append((f'{name} x{n}', before_time / n, measure(operation, number=3) / n))
+        report(f'Exact operations per item, {kind} coordinates', rows)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Frame time of an interactive scene when one point is dragged, before (every
+construction rebuilt from scratch, as without dependency tracking) and after
+(mathworld.Scene, which recomputes only the constructions depending on the
+moved point).
+
+    python benchmarks/bench_scene.py [number of points]
+"""
+
+import sys
+
+from _common import measure, report
+
+from mathworld import Scene, Point, Line, Segment
+
+
+def constructions(points: list[Point]) -> list:
+    # The whole scene computed eagerly: for every pair of consecutive points the
+    # segment, its middle and perpendicular bisector, the parallel to the bisector
+    # through the first point and the intersection with the next bisector
+    results = []
+    segments = [Segment(p1, p2) for p1, p2 in zip(points, points[1:])]
+    bisectors = [segment.perpendicularBisector for segment in segments]
+    for segment, bisector, next_bisector in zip(segments, bisectors, bisectors[1:]):
+        results += [segment.middle, bisector.findParallel(points[0]), bisector.intersection(next_bisector)]
+    return results
+
+
+def build(scene: Scene, inputs: list) -> list:
+    segments = [scene.segment(p1, p2) for p1, p2 in zip(inputs, inputs[1:])]
+    bisectors = [scene.perpendicularBisector(segment) for segment in segments]
+    results = []
+    for segment, bisector, next_bisector in zip(segments, bisectors, bisectors[1:]):
+        results += [scene.middle(segment), scene.findParallel(bisector, inputs[0]),
+                    scene.intersection(bisector, next_bisector)]
+    return results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rows = []
+    for backend in ('numeric', 'sympy'):
+        points = [Point(i, (i * i) % 17, backend) for i in range(n)]
+        scene = Scene()
+        inputs = [scene.point(point.x, point.y, backend) for point in points]
+        results = build(scene, inputs)
+        scene.refresh()
+        assert [node.value for node in results] == constructions(points)
+
+        # A point in the middle of the scene, dragged back and forth
+        dragged = inputs[n // 2]
+        positions = [Point(n // 2, 3, backend), Point(n // 2, 5, backend)]
+        frame = iter(range(10 ** 9))
+
+        def drag():
+            dragged.set(positions[next(frame) % 2])
+            scene.refresh()
+
+        def rebuild():
+            points[n // 2] = positions[next(frame) % 2]
+            constructions(points)
+
+        rows.append((f'{backend}, {len(scene)} nodes', measure(rebuild, number=1, repeat=3),
+                     measure(drag, number=10, repeat=3)))
+    report(f'Frame time when dragging one of {n} points', rows)
+
+
+if __name__ == '__main__':
+    main()
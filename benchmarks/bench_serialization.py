@@ -0,0 +1,71 @@
+"""
+Pickle size and round-trip time of lines before (the default pickling of
+every slot, including the cached equations) and after (Line.__reduce__ with
+the canonical coefficients only), and the compact formats of
+mathworld.serialization.
+
+    python benchmarks/bench_serialization.py [number of lines]
+"""
+
+import copyreg
+import io
+import pickle
+import sys
+import time
+
+import _common  # noqa: F401, puts the in-tree package on sys.path
+import sympy as sp
+
+from mathworld import Line, Point, Segment
+from mathworld.serialization import dumps, loads, to_json, from_json
+
+
+class LegacyPickler(pickle.Pickler):
+    # Pickles the elements as before __reduce__: every slot or attribute is saved
+    def reducer_override(self, element):
+        if isinstance(element, (Line, Point, Segment)):
+            return copyreg.__newobj__, (type(element),), object.__getstate__(element)
+        return NotImplemented
+
+
+def legacy_dumps(elements) -> bytes:
+    output = io.BytesIO()
+    LegacyPickler(output, protocol=pickle.HIGHEST_PROTOCOL).dump(elements)
+    return output.getvalue()
+
+
+def round_trip(dump, load, elements) -> tuple[int, float]:
+    # (size in bytes, seconds of one dump and load)
+    start = time.perf_counter()
+    data = dump(elements)
+    load(data)
+    return len(data), time.perf_counter() - start
+
+
+def lines(n: int, derived: bool) -> list[Line]:
+    result = [Line.from_coefficients(i % 7 + 1, -(i % 5 + 2), sp.Rational(i, 3)) for i in range(n)]
+    if derived:
+        for line in result:
+            line.equation, line.implicitEquation, line.slope
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    cases = [(f'{n} lines', lines(n, False)),
+             # Unpickling the cached equations re-evaluates them: kept small
+             (f'{n // 50} lines, equations accessed', lines(n // 50, True))]
+
+    new_dumps = lambda elements: pickle.dumps(elements, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"{'case':<45}{'bytes/line':>12}{'seconds':>10}")
+    for name, elements in cases:
+        for method, dump, load in (('pickle before', legacy_dumps, pickle.loads),
+                                   ('pickle after', new_dumps, pickle.loads),
+                                   ('serialization.dumps', dumps, loads),
+                                   ('serialization.to_json', to_json, from_json)):
+            size, elapsed = round_trip(dump, load, elements)
+            print(f"{name + ', ' + method:<45}{size / len(elements):>12.1f}{elapsed:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
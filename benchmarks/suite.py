@@ -0,0 +1,317 @@
+"""
+Benchmark suite covering the element constructors and geometric operations.
+
+Every benchmark runs an operation on a batch of inputs of a given kind:
+
+    integer    small integers
+    rational   fractions p/q
+    float      Python floats, i.e. SymPy Floats in the exact backend
+    symbolic   expressions of a free symbol
+
+Timings use timeit with automatic calibration and keep the best of several
+runs. The parse cache is disabled while the suite runs, so that string
+inputs are always parsed (use --parse-cache to keep it). Operations that do
+not support a kind of input are reported as unsupported.
+
+    python benchmarks/suite.py                          # run everything
+    python benchmarks/suite.py -k intersection --quick  # a subset, batch size 1
+    python benchmarks/suite.py --json results.json      # export the results
+    python benchmarks/suite.py --compare results.json   # exit with 1 on regressions
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+
+import _common  # noqa: F401, puts the in-tree package on sys.path
+import sympy as sp
+
+import mathworld
+from mathworld import PARSE_CACHE, Point, Line, Segment, configure_parse_cache, solve_equation, solve_system
+
+KINDS = ('integer', 'rational', 'float', 'symbolic')
+BATCH_SIZES = (1, 10, 100)
+
+_X, _Y = sp.symbols('x y')
+_SYMBOL = sp.Symbol('a', positive=True)
+
+# name -> function building the timed callable from (kind, batch size)
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """
+    Register a benchmark.
+
+    The decorated function receives the kind of input and the batch size, prepares
+    its inputs and returns the callable to time, which processes the whole batch.
+
+    Args:
+        name (str): The name of the benchmark.
+    """
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def number(kind: str, i: int) -> sp.Expr | int | float:
+    """
+    The i-th input value of a kind, never zero.
+
+    Args:
+        kind (str): One of KINDS.
+        i (int): The index of the value.
+
+    Returns:
+        sp.Expr | int | float: The value.
+    """
+    if kind == 'integer':
+        return i % 9 + 2
+    elif kind == 'rational':
+        return sp.Rational(2 * i + 1, i % 5 + 3)
+    elif kind == 'float':
+        return (i % 9 + 2) / 3
+    return _SYMBOL + i % 9 + 1
+
+
+def text(kind: str, i: int) -> str:
+    """
+    The i-th input value of a kind, written as in an equation string.
+    """
+    value = number(kind, i)
+    return f'({value})'
+
+
+def points(kind: str, n: int, offset: int = 0) -> list[Point]:
+    return [Point(number(kind, i + offset), number(kind, 2 * i + offset + 1)) for i in range(n)]
+
+
+def lines(kind: str, n: int, offset: int = 0) -> list[Line]:
+    return [Line.from_coefficients(-number(kind, i + offset), 1, -number(kind, i + offset + 3)) for i in range(n)]
+
+
+@benchmark('Line.__init__(str)')
+def _line_from_string(kind, n):
+    equations = [f'y = {text(kind, i)}*x + {text(kind, i + 3)}' for i in range(n)]
+    return lambda: [Line(equation) for equation in equations]
+
+
+@benchmark('Line.__init__(Equality)')
+def _line_from_equality(kind, n):
+    equations = [sp.Eq(_Y, number(kind, i) * _X + number(kind, i + 3)) for i in range(n)]
+    return lambda: [Line(equation) for equation in equations]
+
+
+@benchmark('Line.findLine')
+def _find_line(kind, n):
+    pairs = list(zip(points(kind, n), points(kind, n, offset=5)))
+    return lambda: [Line.findLine(point1, point2) for point1, point2 in pairs]
+
+
+@benchmark('Line.intersection')
+def _intersection(kind, n):
+    pairs = list(zip(lines(kind, n), lines(kind, n, offset=4)))
+    return lambda: [line1.intersection(line2) for line1, line2 in pairs]
+
+
+@benchmark('Line.findParallel')
+def _find_parallel(kind, n):
+    pairs = list(zip(lines(kind, n), points(kind, n, offset=2)))
+    return lambda: [line.findParallel(point) for line, point in pairs]
+
+
+@benchmark('Line.findPerpendicular')
+def _find_perpendicular(kind, n):
+    pairs = list(zip(lines(kind, n), points(kind, n, offset=2)))
+    return lambda: [line.findPerpendicular(point) for line, point in pairs]
+
+
+@benchmark('Line.findBisector')
+def _find_bisector(kind, n):
+    pairs = list(zip(lines(kind, n), lines(kind, n, offset=4)))
+    return lambda: [line1.findBisector(line2) for line1, line2 in pairs]
+
+
+@benchmark('Line.isBisector')
+def _is_bisector(kind, n):
+    triples = [(line1.findBisector(line2)[0], line1, line2)
+               for line1, line2 in zip(lines(kind, n), lines(kind, n, offset=4))]
+    return lambda: [bisector.isBisector(line1, line2) for bisector, line1, line2 in triples]
+
+
+@benchmark('Point.findPoint')
+def _find_point(kind, n):
+    cases = [(line, Point(number(kind, i), line.slope * number(kind, i) + line.intercept), number(kind, i + 1))
+             for i, line in enumerate(lines(kind, n))]
+    return lambda: [Point.findPoint(line, point, distance) for line, point, distance in cases]
+
+
+@benchmark('Point.ison(Line)')
+def _ison_line(kind, n):
+    pairs = list(zip(points(kind, n), lines(kind, n)))
+    return lambda: [point.ison(line) for point, line in pairs]
+
+
+@benchmark('Point.ison(Segment)')
+def _ison_segment(kind, n):
+    cases = [(segment.middle, segment) for segment in
+             (Segment(point1, point2) for point1, point2 in zip(points(kind, n), points(kind, n, offset=5)))]
+    return lambda: [point.ison(segment) for point, segment in cases]
+
+
+@benchmark('Segment.__init__')
+def _segment(kind, n):
+    pairs = list(zip(points(kind, n), points(kind, n, offset=5)))
+    return lambda: [Segment(point1, point2) for point1, point2 in pairs]
+
+
+@benchmark('solve_equation')
+def _solve_equation(kind, n):
+    equations = [f'x**2 - {text(kind, i)}*x - {text(kind, i + 1)} = 0' for i in range(n)]
+    return lambda: [solve_equation(equation) for equation in equations]
+
+
+@benchmark('solve_system')
+def _solve_system(kind, n):
+    systems = [[f'{text(kind, i)}*x + y = {text(kind, i + 1)}', f'x - {text(kind, i + 2)}*y = 1'] for i in range(n)]
+    return lambda: [solve_system(system, ['x', 'y']) for system in systems]
+
+
+def measure(function, repeat: int) -> tuple[float, float, int]:
+    """
+    Time a callable with automatic calibration.
+
+    Args:
+        function: The callable to time.
+        repeat (int): The number of timing runs.
+
+    Returns:
+        tuple[float, float, int]: The best and mean time per call in seconds, and the calls per run.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [time / number for time in timer.repeat(repeat=repeat, number=number)]
+    return min(times), sum(times) / len(times), number
+
+
+def run(names: list[str], kinds: list[str], batch_sizes: list[int], repeat: int) -> list[dict]:
+    """
+    Run the benchmarks.
+
+    Args:
+        names (list[str]): The benchmarks to run.
+        kinds (list[str]): The kinds of input.
+        batch_sizes (list[int]): The batch sizes.
+        repeat (int): The number of timing runs of each benchmark.
+
+    Returns:
+        list[dict]: One result per benchmark, kind and batch size.
+    """
+    results = []
+    for name in names:
+        for kind in kinds:
+            for batch in batch_sizes:
+                result = {'name': name, 'kind': kind, 'batch': batch}
+                try:
+                    function = BENCHMARKS[name](kind, batch)
+                    function()
+                except Exception as error:
+                    result['error'] = f'{type(error).__name__}: {error}'
+                else:
+                    best, mean, number = measure(function, repeat)
+                    result.update(best=best, mean=mean, per_item=best / batch, number=number, repeat=repeat)
+                results.append(result)
+                print(format_result(result), flush=True)
+    return results
+
+
+def format_result(result: dict) -> str:
+    case = f"{result['name']} [{result['kind']}, {result['batch']}]"
+    if 'error' in result:
+        return f"{case:<50}{'unsupported':>14}  {result['error'][:60]}"
+    return f"{case:<50}{result['best'] * 1e6:>11.1f} us{result['per_item'] * 1e6:>11.1f} us/item"
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """
+    Find the benchmarks slower than in a baseline export.
+
+    Args:
+        results (list[dict]): The current results.
+        baseline (dict): A JSON export of a previous run.
+        threshold (float): The slowdown ratio above which a benchmark is a regression.
+
+    Returns:
+        list[str]: A description of every regression.
+    """
+    previous = {(result['name'], result['kind'], result['batch']): result
+                for result in baseline['results'] if 'error' not in result}
+    regressions = []
+    for result in results:
+        old = previous.get((result['name'], result['kind'], result['batch']))
+        if old is None or 'error' in result:
+            continue
+        ratio = result['best'] / old['best']
+        if ratio > threshold:
+            regressions.append(f"{format_result(result)}  {ratio:.2f}x slower than {old['best'] * 1e6:.1f} us")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', dest='pattern', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--kinds', default=','.join(KINDS), help='comma-separated kinds of input')
+    parser.add_argument('--batch-sizes', default=','.join(map(str, BATCH_SIZES)), help='comma-separated batch sizes')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per benchmark')
+    parser.add_argument('--quick', action='store_true', help='batch size 1 and 3 timing runs')
+    parser.add_argument('--parse-cache', action='store_true', help='keep the parse cache enabled')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='compare with the results in this file')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='slowdown ratio reported as a regression by --compare')
+    arguments = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if arguments.pattern.lower() in name.lower()]
+    kinds = arguments.kinds.split(',')
+    batch_sizes = [1] if arguments.quick else [int(size) for size in arguments.batch_sizes.split(',')]
+    repeat = 3 if arguments.quick else arguments.repeat
+
+    # Turned off here and back on at the end, unless it was already off
+    disable = PARSE_CACHE.enabled and not arguments.parse_cache
+    if disable:
+        configure_parse_cache(enabled=False)
+    try:
+        results = run(names, kinds, batch_sizes, repeat)
+    finally:
+        if disable:
+            configure_parse_cache(enabled=True)
+
+    if arguments.json:
+        export = {
+            'mathworld': mathworld.__version__,
+            'sympy': sp.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'results': results,
+        }
+        with open(arguments.json, 'w') as file:
+            json.dump(export, file, indent=2)
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            regressions = compare(results, json.load(file), arguments.threshold)
+        if regressions:
+            print(f'\n{len(regressions)} regression(s):')
+            for regression in regressions:
+                print(' ', regression)
+            sys.exit(1)
+        print('\nNo regressions')
+
+
+if __name__ == '__main__':
+    main()
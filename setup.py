@@ -21,6 +21,10 @@ setup(
     install_requires=[
         "sympy>=1.13.3",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.22"],
+        "scipy": ["numpy>=1.22", "scipy>=1.8"],
+    },
 
     classifiers=[
         "Development Status :: 3 - Alpha",
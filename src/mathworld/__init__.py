@@ -1,4 +1,62 @@
 __author__ = 'Tobia Petrolini'
 __version__ = '0.1.1'
 
-from .elements import *
+import importlib
+
+# Public names and the submodule defining them. Submodules are imported on
+# first access, so that `import mathworld` does not load SymPy.
+_EXPORTS = {
+    'CacheInfo': 'cache',
+    'LRUCache': 'cache',
+    'SYMPY': 'backend',
+    'NUMERIC': 'backend',
+    'get_backend': 'backend',
+    'set_backend': 'backend',
+    'get_tolerance': 'backend',
+    'set_tolerance': 'backend',
+    'use_backend': 'backend',
+    'resolve_backend': 'backend',
+    'sp': 'equations',
+    'PARSE_CACHE': 'equations',
+    'parse_cache_info': 'equations',
+    'clear_parse_cache': 'equations',
+    'configure_parse_cache': 'equations',
+    'expression': 'equations',
+    'equation': 'equations',
+    'read': 'equations',
+    'sympy_value': 'equations',
+    'float_value': 'equations',
+    'solve_equation': 'equations',
+    'solve_system': 'equations',
+    'MEMO_CACHES': 'memo',
+    'memo_info': 'memo',
+    'clear_memo': 'memo',
+    'configure_memo': 'memo',
+    'Point': 'elements',
+    'Line': 'elements',
+    'Segment': 'elements',
+    'Circle': 'elements',
+    'ORIGIN': 'elements',
+    'X_AXIS': 'elements',
+    'Y_AXIS': 'elements',
+    'BISECTOR_1_3': 'elements',
+    'BISECTOR_2_4': 'elements',
+    'Polygon': 'polygons',
+    'Triangle': 'polygons',
+    'Scene': 'scene',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = '_rational.py'
+
+# Exact integer arithmetic for the exact backend.
+#
+# Most coordinates and coefficients are integers or short decimals. The helpers
+# below write them as Python ints over a common denominator, so that the hot
+# paths of elements.py can compute with machine-speed integer arithmetic (no
+# SymPy objects and no gcd per operation, as Fraction would do) and convert only
+# their results back to SymPy. integers returns None when a value is symbolic
+# or irrational, and the caller then falls back to SymPy.
+
+import math
+from fractions import Fraction
+
+import sympy as sp
+
+# SymPy classes of the integers, including the singletons 0, 1 and -1
+INTEGER_TYPES = (sp.Integer, type(sp.S.Zero), type(sp.S.One), type(sp.S.NegativeOne))
+
+
+def ratio(value) -> tuple[int, int] | None:
+    """
+    Write a rational number as the quotient of two integers.
+
+    Floats are read from their decimal representation, as sympy_value does.
+
+    Args:
+        value: An int, float, Fraction or SymPy expression.
+
+    Returns:
+        tuple[int, int] | None: The numerator and the positive denominator, None if the value is not rational.
+    """
+    kind = type(value)
+    if kind is int:
+        return value, 1
+    elif kind in INTEGER_TYPES:
+        return int(value.p), 1
+    elif isinstance(value, sp.Basic):
+        return (int(value.p), int(value.q)) if value.is_Rational else None
+    elif kind is float:
+        return Fraction(str(value)).as_integer_ratio() if math.isfinite(value) else None
+    elif kind is Fraction:
+        return value.numerator, value.denominator
+    return None
+
+
+def integers(*values) -> tuple[list[int], int] | None:
+    """
+    Write rational numbers as integers over their least common denominator.
+
+    Args:
+        *values: ints, floats, Fractions or SymPy expressions, as in ratio.
+
+    Returns:
+        tuple[list[int], int] | None: The numerators and the positive common denominator,
+        None if a value is not rational.
+    """
+    numerators, denominators = [], []
+    for value in values:
+        if type(value) is int:
+            numerators.append(value)
+            denominators.append(1)
+            continue
+        value = ratio(value)
+        if value is None:
+            return None
+        numerators.append(value[0])
+        denominators.append(value[1])
+
+    common = math.lcm(*denominators)
+    if common == 1:
+        return numerators, 1
+    return [numerator * (common // denominator) for numerator, denominator in zip(numerators, denominators)], common
+
+
+def to_sympy(numerator: int, denominator: int = 1) -> sp.Integer | sp.Rational:
+    """
+    Convert the quotient of two integers to SymPy.
+
+    Args:
+        numerator (int): The numerator.
+        denominator (int): The nonzero denominator.
+
+    Returns:
+        sp.Integer | sp.Rational: The quotient as a SymPy number.
+    """
+    if denominator == 1:
+        return sp.Integer(numerator)
+    return sp.Rational(numerator, denominator)
+
+
+def canonical_coefficients(a: int, b: int, c: int) -> tuple[sp.Integer, sp.Integer, sp.Integer]:
+    """
+    Normalize the integer coefficients of ax + by + c = 0 as _canonical_coefficients does.
+
+    Dividing by b and clearing the denominators, as _canonical_coefficients does,
+    is the same as dividing by the greatest common divisor with the sign of b
+    (or of a for vertical lines).
+
+    Returns:
+        tuple[sp.Integer, sp.Integer, sp.Integer]: The canonical coefficients a, b and c.
+
+    Raises:
+        ValueError: If a and b are both zero.
+    """
+    if a == 0 and b == 0:
+        raise ValueError("a and b cannot both be zero")
+    divisor = math.gcd(a, b, c)
+    if b < 0 or (b == 0 and a < 0):
+        divisor = -divisor
+    return sp.Integer(a // divisor), sp.Integer(b // divisor), sp.Integer(c // divisor)
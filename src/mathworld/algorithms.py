@@ -0,0 +1,652 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'algorithms.py'
+
+import heapq
+import math
+import random
+import sys
+from fractions import Fraction
+from functools import cmp_to_key
+from itertools import combinations
+from typing import Sequence, TYPE_CHECKING
+
+from .elements import Point, Segment, sp
+from .polygons import Triangle
+
+if TYPE_CHECKING:
+    from .arrays import PointArray
+
+
+def _rational(value, name: str = 'value') -> int | Fraction:
+    # Exact Python value of a coordinate, so that predicates never round
+    if isinstance(value, int):
+        return value
+    elif isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"{name} must be finite, got {value}")
+        return int(value) if value.is_integer() else Fraction(value)
+    elif isinstance(value, sp.Expr):
+        if value.is_Integer:
+            return int(value)
+        elif value.is_Rational:
+            return Fraction(int(value.p), int(value.q))
+        elif value.is_Float:
+            return _rational(float(value), name)
+    raise ValueError(f"{name} must be a rational number, got {value}")
+
+
+def _orientation(ax, ay, bx, by, cx, cy):
+    # Twice the signed area of abc: positive if c is on the left of a -> b
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _in_box(ax, ay, bx, by, cx, cy) -> bool:
+    return min(ax, bx) <= cx <= max(ax, bx) and min(ay, by) <= cy <= max(ay, by)
+
+
+def _segments_intersect(s: tuple, t: tuple) -> bool:
+    # Closed segments (x1, y1, x2, y2) share at least one point
+    ax, ay, bx, by = s
+    cx, cy, dx, dy = t
+    d1 = _orientation(cx, cy, dx, dy, ax, ay)
+    d2 = _orientation(cx, cy, dx, dy, bx, by)
+    d3 = _orientation(ax, ay, bx, by, cx, cy)
+    d4 = _orientation(ax, ay, bx, by, dx, dy)
+
+    if ((d1 > 0 > d2) or (d1 < 0 < d2)) and ((d3 > 0 > d4) or (d3 < 0 < d4)):
+        return True
+    return ((d1 == 0 and _in_box(cx, cy, dx, dy, ax, ay)) or
+            (d2 == 0 and _in_box(cx, cy, dx, dy, bx, by)) or
+            (d3 == 0 and _in_box(ax, ay, bx, by, cx, cy)) or
+            (d4 == 0 and _in_box(ax, ay, bx, by, dx, dy)))
+
+
+def _crossing(s: tuple, t: tuple) -> tuple | None:
+    # The single common point of two closed segments, None if there is none
+    # or if they are collinear
+    ax, ay, bx, by = s
+    cx, cy, dx, dy = t
+    rx, ry = bx - ax, by - ay
+    qx, qy = dx - cx, dy - cy
+
+    denominator = rx * qy - ry * qx
+    if denominator == 0:
+        return None
+
+    t_numerator = (cx - ax) * qy - (cy - ay) * qx
+    u_numerator = (cx - ax) * ry - (cy - ay) * rx
+    if denominator < 0:
+        denominator, t_numerator, u_numerator = -denominator, -t_numerator, -u_numerator
+    if not (0 <= t_numerator <= denominator and 0 <= u_numerator <= denominator):
+        return None
+
+    ratio = Fraction(t_numerator) / denominator
+    x, y = ax + ratio * rx, ay + ratio * ry
+    # Keep integral points as int, so that they hash and compare like the endpoints
+    return (int(x) if x == int(x) else x), (int(y) if y == int(y) else y)
+
+
+def _scale(rows: list[tuple]) -> list[tuple[int, ...]]:
+    # Exact rows of coordinates multiplied by their common denominator, so that
+    # the predicates only use integer arithmetic
+    scale = 1
+    for values in rows:
+        for value in values:
+            if isinstance(value, Fraction):
+                scale = math.lcm(scale, value.denominator)
+    if scale == 1:
+        return [tuple(int(value) for value in values) for values in rows]
+    return [tuple(int(value * scale) for value in values) for values in rows]
+
+
+def _segment_data(segments: list[Segment]) -> list[tuple]:
+    # Exact endpoints of every segment, ordered from left to right (bottom to top
+    # if vertical) and scaled by a common denominator
+    data = []
+    for x1, y1, x2, y2 in _scale([(_rational(segment.point1.x, 'x'), _rational(segment.point1.y, 'y'),
+                                   _rational(segment.point2.x, 'x'), _rational(segment.point2.y, 'y'))
+                                  for segment in segments]):
+        data.append((x1, y1, x2, y2) if (x1, y1) <= (x2, y2) else (x2, y2, x1, y1))
+    return data
+
+
+def _point_data(points) -> list[tuple[int, int]]:
+    # Exact coordinates of Point objects, or of the rows of a PointArray, scaled by a common denominator
+    if _is_array(points):
+        return _scale([(_rational(x, 'x'), _rational(y, 'y'))
+                       for x, y in zip(points.x.tolist(), points.y.tolist())])
+    return _scale([(_rational(point.x, 'x'), _rational(point.y, 'y')) for point in points])
+
+
+def _is_array(points) -> bool:
+    # PointArray can only exist if NumPy is installed and mathworld.arrays imported
+    arrays = sys.modules.get('mathworld.arrays')
+    return arrays is not None and isinstance(points, arrays.PointArray)
+
+
+def segment_intersections(segments: list[Segment]) -> list[tuple[int, int]]:
+    """
+    Find every pair of intersecting segments with a Bentley-Ottmann sweep.
+
+    A vertical sweep line moves from left to right, stopping at the endpoints
+    and at the crossings discovered between segments that become adjacent
+    along it, so only neighbouring segments are ever tested. Every predicate
+    is evaluated exactly on the rational coordinates, which makes touching,
+    vertical, overlapping and zero-length segments safe. The cost is
+    O((n + k) log n) events for n segments and k intersection points.
+
+    Args:
+        segments (list[Segment]): The segments, with rational or float coordinates.
+
+    Returns:
+        list[tuple[int, int]]: The sorted pairs (i, j), i < j, of indices of intersecting segments.
+
+    Raises:
+        ValueError: If a coordinate is symbolic or irrational.
+    """
+    data = _segment_data(segments)
+
+    starts = {}
+    events = []
+    for index, (x1, y1, x2, y2) in enumerate(data):
+        starts.setdefault((x1, y1), []).append(index)
+        events.append((x1, y1))
+        events.append((x2, y2))
+
+    queued = set(events)
+    events = list(queued)
+    heapq.heapify(events)
+
+    def direction(i: int, j: int) -> int:
+        # Order of two segments leaving the same point: by slope, vertical last
+        xi1, yi1, xi2, yi2 = data[i]
+        xj1, yj1, xj2, yj2 = data[j]
+        cross = (yi2 - yi1) * (xj2 - xj1) - (yj2 - yj1) * (xi2 - xi1)
+        return (cross > 0) - (cross < 0)
+
+    by_direction = cmp_to_key(direction)
+
+    def find_event(i: int, j: int, point: tuple):
+        crossing = _crossing(data[i], data[j])
+        if crossing is not None and crossing > point and crossing not in queued:
+            queued.add(crossing)
+            heapq.heappush(events, crossing)
+
+    # Segments crossed by the sweep line, from bottom to top just after the current event
+    status = []
+    pairs = set()
+
+    while events:
+        point = heapq.heappop(events)
+        px, py = point
+
+        # The segments containing the event point are contiguous in the status:
+        # find the first one not below it and the first one above it
+        lo, hi = 0, len(status)
+        while lo < hi:
+            middle = (lo + hi) // 2
+            if _orientation(*data[status[middle]], px, py) > 0:
+                lo = middle + 1
+            else:
+                hi = middle
+        hi = lo
+        while hi < len(status) and _orientation(*data[status[hi]], px, py) == 0:
+            hi += 1
+
+        containing = status[lo:hi]
+        starting = starts.get(point, [])
+
+        for i, j in combinations(containing + starting, 2):
+            pairs.add((i, j) if i < j else (j, i))
+
+        # Segments going on after the event, reordered as they leave the point
+        continuing = [index for index in containing + starting
+                      if (data[index][2], data[index][3]) != point]
+        continuing.sort(key=by_direction)
+        status[lo:hi] = continuing
+
+        if continuing:
+            upper = lo + len(continuing)
+            if lo > 0:
+                find_event(status[lo - 1], continuing[0], point)
+            if upper < len(status):
+                find_event(continuing[-1], status[upper], point)
+        elif 0 < lo < len(status):
+            find_event(status[lo - 1], status[lo], point)
+
+    return sorted(pairs)
+
+
+def convex_hull(points: Sequence[Point] | PointArray) -> list[int]:
+    """
+    Find the convex hull of a set of points with Andrew's monotone chain.
+
+    The points are sorted by x and the lower and upper chains are built in one
+    pass each, in O(n log n). Point objects are compared exactly on their
+    rational coordinates. A PointArray is computed with floats: the points
+    inside the quadrilateral of the extreme points are discarded first with
+    vectorized tests, so that only the few remaining ones go through the chain.
+
+    Args:
+        points (Sequence[Point] | PointArray): The points, with rational or float coordinates.
+
+    Returns:
+        list[int]: The indices of the vertices of the hull in counterclockwise order,
+        from the lowest of the leftmost points, without collinear vertices
+        (an np.ndarray for a PointArray).
+
+    Raises:
+        ValueError: If a coordinate of a Point is symbolic or irrational.
+    """
+    if _is_array(points):
+        return _convex_hull_array(points)
+
+    data = _point_data(points)
+    order = sorted(range(len(data)), key=data.__getitem__)
+    return _monotone_chain(order, [x for x, _ in data], [y for _, y in data])
+
+
+def _monotone_chain(order: list[int], x: list, y: list) -> list[int]:
+    # Hull of the points sorted by (x, y): lower chain from left to right, then
+    # upper chain back, dropping every vertex that does not turn left.
+    # Duplicates are adjacent in the order, only the first of them is kept.
+    order = [index for k, index in enumerate(order)
+             if k == 0 or (x[index], y[index]) != (x[order[k - 1]], y[order[k - 1]])]
+    if len(order) < 3:
+        return order
+
+    def chain(indices) -> list[int]:
+        hull = []
+        for index in indices:
+            px, py = x[index], y[index]
+            while len(hull) >= 2:
+                ax, ay, bx, by = x[hull[-2]], y[hull[-2]], x[hull[-1]], y[hull[-1]]
+                if (bx - ax) * (py - ay) - (by - ay) * (px - ax) > 0:
+                    break
+                hull.pop()
+            hull.append(index)
+        return hull
+
+    return chain(order)[:-1] + chain(reversed(order))[:-1]
+
+
+def _convex_hull_array(points: PointArray):
+    import numpy as np
+
+    x, y = points.x, points.y
+    if len(x) > 8:
+        # Akl-Toussaint heuristic: the extreme points in x, y, x + y and x - y
+        # bound a polygon whose strict interior has no vertex of the hull
+        extremes = [int(function(values)) for values in (x, y, x + y, x - y) for function in (np.argmin, np.argmax)]
+        # In counterclockwise order around their own centroid, which is inside their hull
+        cx, cy = x[extremes].mean(), y[extremes].mean()
+        corners = sorted(set(extremes), key=lambda index: math.atan2(y[index] - cy, x[index] - cx))
+        inside = np.ones(len(x), dtype=bool)
+        scale = np.abs(x).max() + np.abs(y).max()
+        for i, index in enumerate(corners):
+            ax, ay = x[corners[i - 1]], y[corners[i - 1]]
+            bx, by = x[index], y[index]
+            # Strictly on the left of every side, with a margin for the rounding errors
+            margin = 8 * sys.float_info.epsilon * scale * (abs(bx - ax) + abs(by - ay) + scale)
+            inside &= (bx - ax) * (y - ay) - (by - ay) * (x - ax) > margin
+        candidates = np.nonzero(~inside)[0]
+    else:
+        candidates = np.arange(len(x))
+
+    order = candidates[np.lexsort((y[candidates], x[candidates]))].tolist()
+    return np.array(_monotone_chain(order, x.tolist(), y.tolist()), dtype=np.int64)
+
+
+def closest_pair(points: Sequence[Point] | PointArray) -> tuple[int, int]:
+    """
+    Find the two closest points with the divide and conquer algorithm.
+
+    The points are sorted by x and split at the median. The closest pair is in a
+    half, or crosses the split within a strip as wide as the best distance found,
+    where every point only needs to be compared with the next 7 in order of y.
+    The cost is O(n log n). Point objects are compared exactly with integer
+    squared distances; a PointArray is computed with floats, with every strip
+    and every small subset compared with vectorized operations.
+
+    Args:
+        points (Sequence[Point] | PointArray): At least two points, with rational or float coordinates.
+
+    Returns:
+        tuple[int, int]: The indices (i, j), i < j, of one of the closest pairs.
+
+    Raises:
+        ValueError: If there are fewer than two points, or a coordinate of a Point is
+            symbolic or irrational.
+    """
+    if len(points) < 2:
+        raise ValueError("closest_pair needs at least two points")
+    elif _is_array(points):
+        i, j = _closest_pair_array(points.x, points.y)
+    else:
+        i, j = _closest_pair(_point_data(points))
+    return (i, j) if i < j else (j, i)
+
+
+def _closest_pair(data: list[tuple[int, int]]) -> tuple[int, int]:
+    order = sorted(range(len(data)), key=data.__getitem__)
+    best = [math.inf, order[0], order[1]]
+
+    def distance(i: int, j: int) -> int:
+        (x1, y1), (x2, y2) = data[i], data[j]
+        return (x1 - x2) ** 2 + (y1 - y2) ** 2
+
+    def solve(indices: list[int]) -> list[int]:
+        # Update the best pair among the indices sorted by x, and return them sorted by y
+        if len(indices) <= 3:
+            for i, j in combinations(indices, 2):
+                value = distance(i, j)
+                if value < best[0]:
+                    best[:] = value, i, j
+            return sorted(indices, key=lambda index: data[index][1])
+
+        middle = len(indices) // 2
+        split = data[indices[middle]][0]
+        left, right = solve(indices[:middle]), solve(indices[middle:])
+
+        # Merge the halves by y
+        merged, i, j = [], 0, 0
+        while i < len(left) and j < len(right):
+            if data[left[i]][1] <= data[right[j]][1]:
+                merged.append(left[i])
+                i += 1
+            else:
+                merged.append(right[j])
+                j += 1
+        merged += left[i:] + right[j:]
+
+        strip = [index for index in merged if (data[index][0] - split) ** 2 < best[0]]
+        for k, i in enumerate(strip):
+            for j in strip[k + 1:k + 8]:
+                if (data[j][1] - data[i][1]) ** 2 >= best[0]:
+                    break
+                value = distance(i, j)
+                if value < best[0]:
+                    best[:] = value, i, j
+        return merged
+
+    solve(order)
+    return best[1], best[2]
+
+
+def _closest_pair_array(x, y) -> tuple[int, int]:
+    import numpy as np
+
+    order = np.lexsort((y, x))
+    xs, ys = x[order], y[order]
+    best = [math.inf, 0, 1]
+    leaf = 32
+
+    def update(distances, first, second):
+        k = int(np.argmin(distances))
+        if distances[k] < best[0]:
+            best[:] = float(distances[k]), int(first[k]), int(second[k])
+
+    def solve(start: int, stop: int):
+        # Update the best pair among the points start to stop (exclusive) in order of x
+        if stop - start <= leaf:
+            i, j = np.triu_indices(stop - start, 1)
+            i, j = i + start, j + start
+            update((xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2, i, j)
+            return
+
+        middle = (start + stop) // 2
+        split = xs[middle]
+        solve(start, middle)
+        solve(middle, stop)
+
+        # The strip around the split, in order of y
+        strip = np.nonzero((xs[start:stop] - split) ** 2 < best[0])[0] + start
+        if len(strip) < 2:
+            return
+        strip = strip[np.argsort(ys[strip], kind='stable')]
+        sx, sy = xs[strip], ys[strip]
+        for k in range(1, min(8, len(strip))):
+            update((sx[k:] - sx[:-k]) ** 2 + (sy[k:] - sy[:-k]) ** 2, strip[:-k], strip[k:])
+
+    solve(0, len(xs))
+    return int(order[best[1]]), int(order[best[2]])
+
+
+# The vertex at infinity of the ghost triangles, which close the triangulation
+# around its convex hull
+_GHOST = -1
+
+
+def delaunay(points: Sequence[Point] | PointArray, exact: bool = False) -> list[tuple[int, int, int]]:
+    """
+    Compute the Delaunay triangulation of a set of points with the Bowyer-Watson algorithm.
+
+    The points are inserted one at a time in an order that keeps consecutive
+    points close to each other, so that walking from the last triangle created
+    finds the triangle containing the next point in a few steps. The triangles
+    whose circumcircle contains the point are then replaced by a fan around it.
+    Ghost triangles, with a vertex at infinity, stand for the outside of the hull.
+    The orientation and incircle predicates are evaluated exactly on the rational
+    coordinates, so degenerate (collinear and cocircular) inputs are safe.
+
+    A PointArray is triangulated by scipy.spatial (Qhull) in compiled code when
+    SciPy is installed, about 10^6 points in seconds, with float predicates:
+    among cocircular points, it may choose other triangles of the same
+    triangulation problem.
+
+    Args:
+        points (Sequence[Point] | PointArray): The points, with rational or float coordinates.
+        exact (bool): If True, a PointArray is also triangulated with the exact predicates.
+
+    Returns:
+        list[tuple[int, int, int]]: The sorted triangles, as indices (i, j, k) of their
+        vertices in counterclockwise order with i the smallest (an np.ndarray of
+        shape (m, 3) for a PointArray). Duplicate points are used once, with their first
+        index, and collinear points have no triangles.
+
+    Raises:
+        ValueError: If a coordinate of a Point is symbolic or irrational.
+    """
+    if _is_array(points):
+        import numpy as np
+
+        if not exact:
+            triangles = _delaunay_qhull(points.x, points.y)
+            if triangles is not None:
+                return triangles
+        return np.array(_delaunay(_point_data(points)), dtype=np.int64).reshape(-1, 3)
+    return _delaunay(_point_data(points))
+
+
+def _delaunay_qhull(x, y):
+    # The triangles of the float coordinates with SciPy, None if it is not installed
+    try:
+        from scipy.spatial import Delaunay
+    except ImportError:
+        return None
+    import numpy as np
+
+    # The first index of every distinct point
+    order = np.lexsort((y, x))
+    distinct = np.ones(len(order), dtype=bool)
+    distinct[1:] = (np.diff(x[order]) != 0) | (np.diff(y[order]) != 0)
+    first = np.sort(np.minimum.reduceat(order, np.flatnonzero(distinct))) if len(order) else order
+    if len(first) < 3:
+        return np.empty((0, 3), dtype=np.int64)
+    try:
+        simplices = Delaunay(np.column_stack((x[first], y[first]))).simplices
+    except RuntimeError:
+        # QhullError: the points are collinear
+        return np.empty((0, 3), dtype=np.int64)
+    triangles = first[simplices].astype(np.int64)
+
+    # Counterclockwise, starting from the smallest index, in sorted order
+    a, b, c = triangles.T
+    clockwise = (x[b] - x[a]) * (y[c] - y[a]) - (y[b] - y[a]) * (x[c] - x[a]) < 0
+    triangles[clockwise, 1:] = triangles[clockwise, :0:-1]
+    shift = np.argmin(triangles, axis=1)
+    triangles = triangles[np.arange(len(triangles))[:, None], (shift[:, None] + np.arange(3)) % 3]
+    return triangles[np.lexsort(triangles.T[::-1])]
+
+
+def _vertices(points: Sequence[Point] | PointArray) -> Sequence[Point]:
+    return points.to_points() if _is_array(points) else points
+
+
+def delaunay_triangles(points: Sequence[Point] | PointArray, exact: bool = False) -> list[Triangle]:
+    """
+    Compute the Delaunay triangulation of a set of points as Triangle objects. See delaunay.
+
+    Returns:
+        list[Triangle]: The triangles, with counterclockwise vertices, in the order of delaunay.
+        Their vertices are the given points (numeric points for a PointArray).
+    """
+    triangles = delaunay(points, exact)
+    if _is_array(points):
+        triangles = triangles.tolist()
+    vertices = _vertices(points)
+    return [Triangle(vertices[i], vertices[j], vertices[k]) for i, j, k in triangles]
+
+
+def delaunay_edges(points: Sequence[Point] | PointArray, exact: bool = False) -> list[Segment]:
+    """
+    Compute the edges of the Delaunay triangulation of a set of points as Segment objects. See delaunay.
+
+    Returns:
+        list[Segment]: One segment per edge, from the point with the smaller index,
+        sorted by the indices of their endpoints.
+    """
+    triangles = delaunay(points, exact)
+    if _is_array(points):
+        triangles = triangles.tolist()
+    edges = sorted({(min(u, v), max(u, v)) for i, j, k in triangles for u, v in ((i, j), (j, k), (k, i))})
+    vertices = _vertices(points)
+    return [Segment(vertices[i], vertices[j]) for i, j in edges]
+
+
+def _delaunay(data: list[tuple[int, int]]) -> list[tuple[int, int, int]]:
+    x, y = [value for value, _ in data], [value for _, value in data]
+
+    # Drop the duplicates and find a first triangle
+    indices = list({point: index for index, point in reversed(list(enumerate(data)))}.values())
+    indices.sort()
+    if len(indices) < 3:
+        return []
+    first, second = indices[0], indices[1]
+    third = next((index for index in indices[2:] if _orient(x, y, first, second, index) != 0), None)
+    if third is None:
+        return []
+    if _orient(x, y, first, second, third) < 0:
+        first, second = second, first
+
+    # adjacent[u, v] = w for every triangle (u, v, w) in counterclockwise order
+    adjacent = {}
+
+    def add(u: int, v: int, w: int):
+        adjacent[u, v] = w
+        adjacent[v, w] = u
+        adjacent[w, u] = v
+
+    def delete(u: int, v: int, w: int):
+        del adjacent[u, v], adjacent[v, w], adjacent[w, u]
+
+    add(first, second, third)
+    add(second, first, _GHOST)
+    add(third, second, _GHOST)
+    add(first, third, _GHOST)
+
+    def conflict(u: int, v: int, w: int, p: int) -> bool:
+        # Whether p is in the circumcircle of the triangle uvw
+        if _GHOST in (u, v, w):
+            # Ghost triangle: p is outside the hull edge, or on the edge itself
+            u, v = (v, w) if u == _GHOST else (w, u) if v == _GHOST else (u, v)
+            side = _orient(x, y, u, v, p)
+            return side > 0 or (side == 0 and min(x[u], x[v]) <= x[p] <= max(x[u], x[v]) and
+                                min(y[u], y[v]) <= y[p] <= max(y[u], y[v]))
+        return _incircle(x, y, u, v, w, p) > 0
+
+    def locate(p: int, u: int, v: int) -> tuple[int, int, int]:
+        # Visibility walk from the triangle of the edge uv to a triangle in conflict with p
+        w = adjacent[u, v]
+        while True:
+            if _GHOST in (u, v, w):
+                if conflict(u, v, w, p):
+                    return u, v, w
+                # Step into the real triangle across the hull edge
+                u, v = (v, w) if u == _GHOST else (w, u) if v == _GHOST else (u, v)
+                u, v = v, u
+                w = adjacent[u, v]
+                continue
+            for a, b in ((u, v), (v, w), (w, u)):
+                if _orient(x, y, a, b, p) < 0:
+                    u, v = b, a
+                    w = adjacent[u, v]
+                    break
+            else:
+                return u, v, w
+
+    last = (first, second)
+    order = [index for index in _spatial_order(x, y, indices) if index not in (first, second, third)]
+    for p in order:
+        u, v, w = locate(p, *last)
+        delete(u, v, w)
+        stack = [(u, v), (v, w), (w, u)]
+        while stack:
+            a, b = stack.pop()
+            # The triangle across the edge ab of the cavity
+            c = adjacent.get((b, a))
+            if c is None:
+                # Already deleted: the edge is inside the cavity
+                continue
+            if conflict(b, a, c, p):
+                delete(b, a, c)
+                stack.append((a, c))
+                stack.append((c, b))
+            else:
+                add(p, a, b)
+                if _GHOST not in (a, b):
+                    last = (a, b)
+
+    return sorted((u, v, w) for (u, v), w in adjacent.items()
+                  if w != _GHOST and u != _GHOST and v != _GHOST and u < v and u < w)
+
+
+def _spatial_order(x: list[int], y: list[int], indices: list[int]) -> list[int]:
+    # The points in vertical stripes, alternately upwards and downwards, so that
+    # consecutive points are close; the stripes are shuffled in rounds of growing
+    # size, which keeps the expected cost of the insertions low on sorted inputs
+    if len(indices) < 16:
+        return indices
+    low, high = min(x[index] for index in indices), max(x[index] for index in indices)
+    stripes = max(1, math.isqrt(len(indices) // 4))
+    width = (high - low) // stripes + 1
+
+    def key(index: int) -> tuple:
+        stripe = (x[index] - low) // width
+        return stripe, y[index] if stripe % 2 == 0 else -y[index]
+
+    generator = random.Random(0)
+    shuffled = indices[:]
+    generator.shuffle(shuffled)
+    order, start, size = [], 0, 8
+    while start < len(shuffled):
+        order += sorted(shuffled[start:start + size], key=key)
+        start, size = start + size, size * 2
+    return order
+
+
+def _orient(x: list, y: list, a: int, b: int, c: int) -> int:
+    # Twice the signed area of abc: positive if c is on the left of a -> b
+    return (x[b] - x[a]) * (y[c] - y[a]) - (y[b] - y[a]) * (x[c] - x[a])
+
+
+def _incircle(x: list, y: list, a: int, b: int, c: int, d: int) -> int:
+    # Positive if d is inside the circumcircle of the counterclockwise triangle abc
+    adx, ady = x[a] - x[d], y[a] - y[d]
+    bdx, bdy = x[b] - x[d], y[b] - y[d]
+    cdx, cdy = x[c] - x[d], y[c] - y[d]
+    return ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy) +
+            (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy) +
+            (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
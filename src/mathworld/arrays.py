@@ -0,0 +1,494 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'arrays.py'
+
+from typing import Iterator
+
+import numpy as np
+
+from .backend import NUMERIC
+from .elements import Point, Line, Segment, _restore_line
+from .polygons import Polygon
+
+
+def _float(value, name: str) -> float:
+    # Convert a SymPy coordinate or coefficient to a machine float
+    try:
+        return float(value)
+    except TypeError:
+        raise ValueError(f"{name} must be numeric to be used in an array, got {value}") from None
+
+
+def _line_coefficients(line: Line) -> tuple[float, float, float]:
+    return _float(line.a, 'a'), _float(line.b, 'b'), _float(line.c, 'c')
+
+
+class PointArray():
+    # A batch of points stored as two float64 columns, for vectorized queries.
+    def __init__(self, x, y):
+        """
+        Initializes the PointArray from the x and y coordinates.
+
+        Args:
+            x (array_like): The x-coordinates of the points.
+            y (array_like): The y-coordinates of the points.
+
+        Raises:
+            ValueError: If x and y are not one-dimensional arrays of the same length.
+        """
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+
+        if self.x.ndim != 1 or self.x.shape != self.y.shape:
+            raise ValueError(
+                "x and y must be one-dimensional arrays of the same length")
+
+    @staticmethod
+    def from_points(points: list[Point]) -> 'PointArray':
+        """
+        Build a PointArray from Point objects.
+
+        Args:
+            points (list[Point]): The points, with numeric coordinates.
+
+        Returns:
+            PointArray: The points as float64 columns.
+
+        Raises:
+            ValueError: If a point has symbolic coordinates.
+        """
+        x = np.fromiter((_float(point.x, 'x') for point in points), dtype=np.float64)
+        y = np.fromiter((_float(point.y, 'y') for point in points), dtype=np.float64)
+        return PointArray(x, y)
+
+    def to_points(self) -> list[Point]:
+        """
+        Convert the array back to Point objects.
+
+        Returns:
+            list[Point]: One numeric Point per row.
+        """
+        return [Point(x, y, NUMERIC) for x, y in zip(self.x.tolist(), self.y.tolist())]
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, index) -> 'Point | PointArray':
+        if isinstance(index, (int, np.integer)):
+            return Point(float(self.x[index]), float(self.y[index]), NUMERIC)
+        return PointArray(self.x[index], self.y[index])
+
+    def __str__(self) -> str:
+        return f"PointArray({len(self)} points)"
+
+    def distance_to_point(self, point: Point) -> np.ndarray:
+        """
+        Calculate the Euclidean distance of every point to another point.
+
+        Args:
+            point (Point): The other point.
+
+        Returns:
+            np.ndarray: The distances, as float64.
+        """
+        return np.hypot(self.x - _float(point.x, 'x'), self.y - _float(point.y, 'y'))
+
+    def distance_to_line(self, line: Line) -> np.ndarray:
+        """
+        Calculate the perpendicular distance of every point to a line.
+
+        Args:
+            line (Line): The line.
+
+        Returns:
+            np.ndarray: The distances, as float64.
+        """
+        a, b, c = _line_coefficients(line)
+        return np.abs(a * self.x + b * self.y + c) / np.hypot(a, b)
+
+    def on_line(self, line: Line, tol: float = 1e-9) -> np.ndarray:
+        """
+        Determine which points lie on a line.
+
+        Args:
+            line (Line): The line.
+            tol (float): The maximum distance from the line.
+
+        Returns:
+            np.ndarray: A boolean mask, True for the points on the line.
+        """
+        return self.distance_to_line(line) <= tol
+
+    def on_segment(self, segment: Segment, tol: float = 1e-9) -> np.ndarray:
+        """
+        Determine which points lie on a segment.
+
+        Args:
+            segment (Segment): The segment.
+            tol (float): The maximum distance from the segment's line and endpoints box.
+
+        Returns:
+            np.ndarray: A boolean mask, True for the points on the segment.
+        """
+        x1, y1 = _float(segment.point1.x, 'x'), _float(segment.point1.y, 'y')
+        x2, y2 = _float(segment.point2.x, 'x'), _float(segment.point2.y, 'y')
+
+        # Line through the endpoints, as ax + by + c = 0
+        a, b = y2 - y1, x1 - x2
+        norm = np.hypot(a, b)
+        if norm == 0:
+            return self.distance_to_point(segment.point1) <= tol
+
+        on_line = np.abs(a * (self.x - x1) + b * (self.y - y1)) / norm <= tol
+        in_box = ((self.x >= min(x1, x2) - tol) & (self.x <= max(x1, x2) + tol) &
+                  (self.y >= min(y1, y2) - tol) & (self.y <= max(y1, y2) + tol))
+        return on_line & in_box
+
+    def in_polygon(self, polygon: Polygon, tol: float = 1e-9) -> np.ndarray:
+        """
+        Determine which points lie inside a polygon or on its boundary.
+
+        The interior is given by the nonzero winding rule, as in Polygon.contains.
+        Every side is tested against all the points at once, so the cost is
+        O(points * sides) vectorized operations.
+
+        Args:
+            polygon (Polygon): The polygon, with numeric coordinates.
+            tol (float): The maximum distance from the boundary of the points on it.
+
+        Returns:
+            np.ndarray: A boolean mask, True for the points inside the polygon or on its boundary.
+
+        Raises:
+            ValueError: If the polygon has symbolic coordinates.
+        """
+        x = np.fromiter((_float(value, 'x') for value in polygon.x), dtype=np.float64)
+        y = np.fromiter((_float(value, 'y') for value in polygon.y), dtype=np.float64)
+
+        winding = np.zeros(len(self), dtype=np.int64)
+        boundary = np.zeros(len(self), dtype=bool)
+        for x1, y1, x2, y2 in zip(x.tolist(), y.tolist(), np.roll(x, -1).tolist(), np.roll(y, -1).tolist()):
+            cross = (x2 - x1) * (self.y - y1) - (self.x - x1) * (y2 - y1)
+            below1, below2 = y1 <= self.y, y2 <= self.y
+            # Sides crossing the horizontal through the point upwards with the point on
+            # their left, and downwards with the point on their right
+            winding += below1 & ~below2 & (cross > 0)
+            winding -= below2 & ~below1 & (cross < 0)
+            boundary |= ((np.abs(cross) <= tol * np.hypot(x2 - x1, y2 - y1)) &
+                         (self.x >= min(x1, x2) - tol) & (self.x <= max(x1, x2) + tol) &
+                         (self.y >= min(y1, y2) - tol) & (self.y <= max(y1, y2) + tol))
+        return (winding != 0) | boundary
+
+    def quadrant(self) -> np.ndarray:
+        """
+        Determine the quadrant of every point.
+
+        Returns:
+            np.ndarray: The quadrants (1 to 4) as int8, 0 for points on an axis.
+        """
+        sx, sy = np.sign(self.x), np.sign(self.y)
+        quadrant = np.zeros(len(self), dtype=np.int8)
+        quadrant[(sx > 0) & (sy > 0)] = 1
+        quadrant[(sx < 0) & (sy > 0)] = 2
+        quadrant[(sx < 0) & (sy < 0)] = 3
+        quadrant[(sx > 0) & (sy < 0)] = 4
+        return quadrant
+
+
+def _groups(labels: np.ndarray, min_size: int) -> list[np.ndarray]:
+    # Indexes of the rows of every label with at least min_size rows, in label order
+    counts = np.bincount(labels)
+    rows = np.nonzero(counts[labels] >= min_size)[0]
+    rows = rows[np.argsort(labels[rows], kind='stable')]
+    return np.split(rows, np.cumsum(counts[counts >= min_size])[:-1])
+
+
+class LineArray():
+    # A batch of lines stored as three float64 columns of unit normal coefficients, for bulk queries.
+    def __init__(self, a, b, c):
+        """
+        Initializes the LineArray from the coefficients of ax + by + c = 0.
+
+        The coefficients are normalized as those of numeric lines: (a, b) is a
+        unit vector, with b > 0 or a > 0 for vertical lines.
+
+        Args:
+            a (array_like): The coefficients of x.
+            b (array_like): The coefficients of y.
+            c (array_like): The constant terms.
+
+        Raises:
+            ValueError: If a, b and c are not one-dimensional arrays of the same length,
+                or if a and b are both zero for a line.
+        """
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        c = np.asarray(c, dtype=np.float64)
+
+        if a.ndim != 1 or a.shape != b.shape or a.shape != c.shape:
+            raise ValueError(
+                "a, b and c must be one-dimensional arrays of the same length")
+
+        norm = np.hypot(a, b)
+        if not np.all(norm > 0):
+            raise ValueError("a and b cannot both be zero")
+        norm[(b < 0) | ((b == 0) & (a < 0))] *= -1
+
+        # + 0.0 turns negative zeros into zeros
+        self.a = np.ascontiguousarray(a / norm + 0.0)
+        self.b = np.ascontiguousarray(b / norm + 0.0)
+        self.c = np.ascontiguousarray(c / norm + 0.0)
+
+    @staticmethod
+    def from_lines(lines: list[Line]) -> 'LineArray':
+        """
+        Build a LineArray from Line objects.
+
+        Args:
+            lines (list[Line]): The lines, with numeric coefficients.
+
+        Returns:
+            LineArray: The lines as float64 columns.
+
+        Raises:
+            ValueError: If a line has symbolic coefficients.
+        """
+        a = np.fromiter((_float(line.a, 'a') for line in lines), dtype=np.float64)
+        b = np.fromiter((_float(line.b, 'b') for line in lines), dtype=np.float64)
+        c = np.fromiter((_float(line.c, 'c') for line in lines), dtype=np.float64)
+        return LineArray(a, b, c)
+
+    def to_lines(self) -> list[Line]:
+        """
+        Convert the array back to Line objects.
+
+        Returns:
+            list[Line]: One numeric Line per row.
+        """
+        return [_restore_line(a, b, c, NUMERIC)
+                for a, b, c in zip(self.a.tolist(), self.b.tolist(), self.c.tolist())]
+
+    def __len__(self) -> int:
+        return len(self.a)
+
+    def __getitem__(self, index) -> 'Line | LineArray':
+        if isinstance(index, (int, np.integer)):
+            return _restore_line(float(self.a[index]), float(self.b[index]), float(self.c[index]), NUMERIC)
+        # The rows are already normalized
+        lines = LineArray.__new__(LineArray)
+        lines.a, lines.b, lines.c = self.a[index], self.b[index], self.c[index]
+        return lines
+
+    def __str__(self) -> str:
+        return f"LineArray({len(self)} lines)"
+
+    def angles(self) -> np.ndarray:
+        """
+        Calculate the direction of every line.
+
+        Returns:
+            np.ndarray: The angles of the normals modulo pi, in [0, pi), as float64.
+            Parallel lines have the same angle.
+        """
+        return np.mod(np.arctan2(self.a, self.b), np.pi)
+
+    def _classify(self, tol: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Label of the direction of every line, the angles in increasing order and
+        # their labels. Sorting the angles is what makes the grouping robust to the
+        # tolerance, where rounding them to a hashable key would split the lines on
+        # either side of a rounding boundary.
+        angles = self.angles()
+        order = np.argsort(angles, kind='stable')
+        ordered = angles[order]
+
+        ordered_labels = np.zeros(len(self), dtype=np.int64)
+        np.cumsum(np.diff(ordered) > tol, out=ordered_labels[1:])
+        if len(self) > 1 and ordered_labels[-1] > 0 and ordered[0] + np.pi - ordered[-1] <= tol:
+            # Nearly vertical lines on both sides of the wrap-around at pi
+            ordered_labels[ordered_labels == ordered_labels[-1]] = 0
+
+        labels = np.empty(len(self), dtype=np.int64)
+        labels[order] = ordered_labels
+        return labels, ordered, ordered_labels
+
+    def directions(self, tol: float = 1e-9) -> np.ndarray:
+        """
+        Group the lines by direction.
+
+        Lines whose angles differ by at most tol are in the same group, and so are
+        chains of such lines.
+
+        Args:
+            tol (float): The maximum angle, in radians, between parallel lines.
+
+        Returns:
+            np.ndarray: The label of the direction of every line, as int64 from 0,
+            equal for parallel lines.
+        """
+        return self._classify(tol)[0]
+
+    def parallel_groups(self, tol: float = 1e-9, min_size: int = 2) -> list[np.ndarray]:
+        """
+        Find the groups of parallel lines, in O(N log N) instead of N^2 isParallel calls.
+
+        Args:
+            tol (float): The maximum angle, in radians, between parallel lines.
+            min_size (int): The minimum number of lines of a group.
+
+        Returns:
+            list[np.ndarray]: The indexes of the lines of every group with at least min_size lines.
+        """
+        return _groups(self.directions(tol), min_size)
+
+    def perpendicular_directions(self, tol: float = 1e-9) -> np.ndarray:
+        """
+        Find the direction perpendicular to every line.
+
+        Lines i and j are perpendicular if perpendicular_directions()[i] == directions()[j].
+
+        Args:
+            tol (float): The maximum angle, in radians, between parallel lines
+                and the maximum deviation from a right angle.
+
+        Returns:
+            np.ndarray: For every line, the label of the direction (as returned by directions)
+            perpendicular to it, -1 if no line has that direction.
+        """
+        labels, ordered, ordered_labels = self._classify(tol)
+        if len(self) == 0:
+            return labels
+
+        # The nearest sorted angles on either side of the perpendicular one
+        target = np.mod(self.angles() + np.pi / 2, np.pi)
+        after = np.searchsorted(ordered, target) % len(self)
+        before = (after - 1) % len(self)
+
+        result = np.full(len(self), -1, dtype=np.int64)
+        for candidate in (before, after):
+            gap = np.abs(ordered[candidate] - target)
+            gap = np.minimum(gap, np.pi - gap)
+            found = (gap <= tol) & (result < 0)
+            result[found] = ordered_labels[candidate[found]]
+        return result
+
+    def unique(self, tol: float = 1e-9) -> tuple['LineArray', np.ndarray]:
+        """
+        Remove the coincident duplicates.
+
+        Args:
+            tol (float): The maximum angle, in radians, between parallel lines
+                and the maximum distance between coincident ones.
+
+        Returns:
+            tuple[LineArray, np.ndarray]: The distinct lines, each the first of its
+            duplicates, and for every line the index of its distinct line.
+        """
+        labels = self.directions(tol)
+        if len(self) == 0:
+            return self[:0], labels
+
+        # The normals of a group can be opposite (nearly vertical lines on both sides
+        # of the wrap-around): orient them as the first line of the group
+        first = np.zeros(labels.max() + 1, dtype=np.int64)
+        first[labels[::-1]] = np.arange(len(self) - 1, -1, -1)
+        reference = first[labels]
+        sign = np.where(self.a * self.a[reference] + self.b * self.b[reference] < 0, -1.0, 1.0)
+        # With unit normals c is the signed distance from the origin
+        offsets = sign * self.c
+
+        order = np.lexsort((offsets, labels))
+        starts = np.ones(len(self), dtype=bool)
+        starts[1:] = (np.diff(labels[order]) != 0) | (np.diff(offsets[order]) > tol)
+        ordered_inverse = np.cumsum(starts) - 1
+
+        # Number the distinct lines in the order of their first occurrence
+        distinct = order[starts]
+        rank = np.argsort(distinct, kind='stable')
+        renumber = np.empty(len(rank), dtype=np.int64)
+        renumber[rank] = np.arange(len(rank))
+        inverse = np.empty(len(self), dtype=np.int64)
+        inverse[order] = renumber[ordered_inverse]
+
+        # The first line of every set of duplicates
+        representative = np.full(len(rank), len(self), dtype=np.int64)
+        np.minimum.at(representative, inverse, np.arange(len(self)))
+        return self[representative], inverse
+
+    def coincident_groups(self, tol: float = 1e-9, min_size: int = 2) -> list[np.ndarray]:
+        """
+        Find the groups of coincident lines.
+
+        Args:
+            tol (float): The maximum angle, in radians, between parallel lines
+                and the maximum distance between coincident ones.
+            min_size (int): The minimum number of lines of a group.
+
+        Returns:
+            list[np.ndarray]: The indexes of the lines of every group with at least min_size lines.
+        """
+        return _groups(self.unique(tol)[1], min_size)
+
+    def intersect(self, other: 'LineArray | Line', tol: float = 1e-9) -> PointArray:
+        """
+        Calculate the intersection of every line with the line in the same row of
+        another LineArray, or with a single line.
+
+        Args:
+            other (LineArray | Line): The other lines, as many as these, or one line.
+            tol (float): The maximum sine of the angle between parallel lines.
+
+        Returns:
+            PointArray: The intersection points, with NaN coordinates for parallel (or coincident) lines.
+
+        Raises:
+            ValueError: If the arrays have different lengths.
+        """
+        if isinstance(other, Line):
+            other = LineArray(*([value] for value in _line_coefficients(other)))
+        elif len(other) != len(self) and len(other) != 1:
+            raise ValueError("the arrays must have the same length")
+        return PointArray(*_cramer(self.a, self.b, self.c, other.a, other.b, other.c, tol))
+
+    def intersections(self, other: 'LineArray | None' = None, tol: float = 1e-9,
+                      block_size: int = 1024) -> Iterator[tuple[np.ndarray, np.ndarray, PointArray]]:
+        """
+        Calculate the intersections of all the pairs of non-parallel lines.
+
+        The pairs are computed in blocks of rows, so that the memory used does not
+        grow with the square of the number of lines.
+
+        Args:
+            other (LineArray | None): The other lines, None for the pairs of these lines.
+            tol (float): The maximum sine of the angle between parallel lines.
+            block_size (int): The number of lines of this array in a block.
+
+        Yields:
+            tuple[np.ndarray, np.ndarray, PointArray]: For every block, the indexes i
+            of the lines of this array, the indexes j of the other lines (j > i for the
+            pairs of these lines) and their intersection points.
+        """
+        pairs = other is None
+        if pairs:
+            other = self
+
+        for start in range(0, len(self), block_size):
+            stop = min(start + block_size, len(self))
+            a1, b1, c1 = self.a[start:stop, None], self.b[start:stop, None], self.c[start:stop, None]
+            found = np.abs(a1 * other.b - other.a * b1) > tol
+            if pairs:
+                found &= np.arange(len(other)) > np.arange(start, stop)[:, None]
+            i, j = np.nonzero(found)
+            if len(i) == 0:
+                continue
+            i += start
+            x, y = _cramer(self.a[i], self.b[i], self.c[i], other.a[j], other.b[j], other.c[j], tol)
+            yield i, j, PointArray(x, y)
+
+
+def _cramer(a1, b1, c1, a2, b2, c2, tol: float) -> tuple[np.ndarray, np.ndarray]:
+    # Cramer's rule on a1x + b1y = -c1, a2x + b2y = -c2, NaN for parallel lines
+    determinant = a1 * b2 - a2 * b1
+    parallel = np.abs(determinant) <= tol
+    determinant = np.where(parallel, np.nan, determinant)
+    return (b1 * c2 - b2 * c1) / determinant, (a2 * c1 - a1 * c2) / determinant
@@ -0,0 +1,125 @@
+__author__ = 'Tobia Petrolini'
+__file__ = 'backend.py'
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# Exact representation: coordinates and coefficients are SymPy expressions
+SYMPY = 'sympy'
+# Machine floats with closed-form arithmetic and tolerance-based predicates
+NUMERIC = 'numeric'
+
+BACKENDS = (SYMPY, NUMERIC)
+
+_default_backend = SYMPY
+_default_tolerance = 1e-9
+
+# Overrides set by use_backend(), local to the current thread or task
+_backend_override = ContextVar('mathworld_backend', default=None)
+_tolerance_override = ContextVar('mathworld_tolerance', default=None)
+
+
+def _check_backend(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(BACKENDS)}")
+    return backend
+
+
+def _check_tolerance(tolerance: float) -> float:
+    tolerance = float(tolerance)
+    if tolerance < 0:
+        raise ValueError("tolerance must be a non-negative number")
+    return tolerance
+
+
+def get_backend() -> str:
+    """
+    Return the backend used for new elements when none is given explicitly.
+
+    Returns:
+        str: SYMPY or NUMERIC.
+    """
+    backend = _backend_override.get()
+    return _default_backend if backend is None else backend
+
+
+def set_backend(backend: str):
+    """
+    Set the default backend for new elements.
+
+    Args:
+        backend (str): SYMPY or NUMERIC.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    global _default_backend
+    _default_backend = _check_backend(backend)
+
+
+def get_tolerance() -> float:
+    """
+    Return the tolerance used by the predicates of numeric elements.
+
+    Returns:
+        float: The absolute tolerance.
+    """
+    tolerance = _tolerance_override.get()
+    return _default_tolerance if tolerance is None else tolerance
+
+
+def set_tolerance(tolerance: float):
+    """
+    Set the tolerance used by the predicates of numeric elements.
+
+    Args:
+        tolerance (float): The absolute tolerance.
+
+    Raises:
+        ValueError: If the tolerance is negative.
+    """
+    global _default_tolerance
+    _default_tolerance = _check_tolerance(tolerance)
+
+
+@contextmanager
+def use_backend(backend: str | None = None, tolerance: float | None = None) -> Iterator[str]:
+    """
+    Temporarily change the backend and/or the tolerance in the current thread or task.
+
+    Args:
+        backend (str | None): SYMPY or NUMERIC.
+        tolerance (float | None): The absolute tolerance of numeric predicates.
+
+    Yields:
+        str: The backend in use inside the block.
+
+    Raises:
+        ValueError: If the backend is unknown or the tolerance is negative.
+    """
+    backend_token = _backend_override.set(
+        _check_backend(backend) if backend is not None else _backend_override.get())
+    tolerance_token = _tolerance_override.set(
+        _check_tolerance(tolerance) if tolerance is not None else _tolerance_override.get())
+    try:
+        yield get_backend()
+    finally:
+        _tolerance_override.reset(tolerance_token)
+        _backend_override.reset(backend_token)
+
+
+def resolve_backend(backend: str | None) -> str:
+    """
+    Return the given backend, or the current default when it is None.
+
+    Args:
+        backend (str | None): SYMPY, NUMERIC or None.
+
+    Returns:
+        str: SYMPY or NUMERIC.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    return get_backend() if backend is None else _check_backend(backend)
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'batch.py'
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+from .equations import _normalize, solve_equation, solve_system
+
+
+class BatchResult(NamedTuple):
+    # The result of one problem of a batch: value is None when error is set
+    index: int
+    value: Any
+    error: str | None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _describe(error: BaseException) -> str:
+    return f'{type(error).__name__}: {error}'
+
+
+def _run_chunk(function: Callable, problems: list[tuple]) -> list[tuple[Any, str | None]]:
+    # Runs in the worker processes: an error only affects its own problem
+    results = []
+    for arguments in problems:
+        try:
+            results.append((function(*arguments), None))
+        except Exception as error:
+            results.append((None, _describe(error)))
+    return results
+
+
+def _equation_problem(problem: str | tuple[str, str], variable: str) -> tuple[tuple, tuple]:
+    # (deduplication key, arguments of solve_equation)
+    if isinstance(problem, tuple):
+        problem, variable = problem
+    arguments = (_normalize(problem), variable)
+    return arguments, arguments
+
+
+def _system_problem(problem, variables: list[str] | None) -> tuple[tuple, tuple]:
+    # (deduplication key, arguments of solve_system)
+    if variables is None:
+        equations, problem_variables = problem
+    else:
+        equations, problem_variables = problem, variables
+    key = (tuple(_normalize(equation) for equation in equations), tuple(problem_variables))
+    return key, (list(key[0]), list(key[1]))
+
+
+def _batch(function: Callable, problems: Iterable, prepare: Callable, workers: int | None,
+           chunksize: int, ordered: bool, deduplicate: bool = True) -> Iterator[BatchResult]:
+    # Checked here rather than in the generator, so that errors are raised on the call
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, got {workers}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive, got {chunksize}")
+    return _stream(function, problems, prepare, workers, chunksize, ordered, deduplicate)
+
+
+def _stream(function: Callable, problems: Iterable, prepare: Callable, workers: int,
+            chunksize: int, ordered: bool, deduplicate: bool = True) -> Iterator[BatchResult]:
+    # Without deduplication, prepare must return a distinct key for every problem
+    # and the memory used does not grow with the input.
+    # key -> indices of the inputs waiting for its result
+    waiting = {}
+    # key -> (value, error) of the problems already solved, for later duplicates
+    solved = {}
+    # Results completed out of order, by index, when ordered
+    ready = {}
+    next_index = 0
+    # Submitted chunks: future -> (keys, arguments), kept to resubmit them if the pool breaks
+    pending = {}
+    chunk = []
+    # Chunks of a broken pool, rerun one at a time to find the problem that broke it
+    suspects = deque()
+
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    # Bounds the memory used by a long input: reading stops while this many chunks run
+    max_pending = 2 * workers
+
+    def output(index: int, value: Any, error: str | None) -> Iterator[BatchResult]:
+        nonlocal next_index
+        if not ordered:
+            yield BatchResult(index, value, error)
+            return
+        ready[index] = BatchResult(index, value, error)
+        while next_index in ready:
+            yield ready.pop(next_index)
+            next_index += 1
+
+    def complete(keys: list, results: list) -> Iterator[BatchResult]:
+        for key, (value, error) in zip(keys, results):
+            if deduplicate:
+                solved[key] = (value, error)
+            for index in waiting.pop(key):
+                yield from output(index, value, error)
+
+    def restart():
+        # A worker process died, e.g. killed by the system or by a crash in native
+        # code: every future of the pool fails and it accepts no more work
+        nonlocal executor
+        executor.shutdown(wait=True, cancel_futures=True)
+        executor = ProcessPoolExecutor(workers)
+
+    def broken() -> Iterator[BatchResult]:
+        # The chunks in flight can not tell which one broke the pool
+        for future, (keys, arguments) in list(pending.items()):
+            if future.done() and not future.cancelled() and future.exception() is None:
+                yield from complete(keys, future.result())
+            else:
+                suspects.append((keys, arguments))
+        pending.clear()
+        restart()
+
+        # Alone in the pool, the chunk that breaks it again is the culprit: it is
+        # split until the problem is found, which is the only one to fail
+        while suspects:
+            keys, arguments = suspects.popleft()
+            try:
+                results = executor.submit(_run_chunk, function, arguments).result()
+            except BrokenProcessPool as error:
+                restart()
+                if len(keys) > 1:
+                    suspects.extendleft(reversed([([key], [problem]) for key, problem in zip(keys, arguments)]))
+                    continue
+                results = [(None, _describe(error))]
+            except Exception as error:
+                results = [(None, _describe(error))] * len(keys)
+            yield from complete(keys, results)
+
+    def collect(done: set[Future]) -> Iterator[BatchResult]:
+        for future in done:
+            if future not in pending:
+                # Already handled with the rest of a broken pool
+                continue
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                yield from broken()
+                continue
+            except Exception as error:
+                # The chunk could not be sent or received, e.g. a problem that can not be pickled
+                results = [(None, _describe(error))] * len(pending[future][0])
+            yield from complete(pending.pop(future)[0], results)
+
+    def submit() -> Iterator[BatchResult]:
+        keys = [key for key, _ in chunk]
+        arguments = [problem for _, problem in chunk]
+        chunk.clear()
+        if executor is None:
+            yield from complete(keys, _run_chunk(function, arguments))
+            return
+
+        try:
+            future = executor.submit(_run_chunk, function, arguments)
+        except BrokenProcessPool:
+            # The pool broke before its futures were collected
+            suspects.append((keys, arguments))
+            yield from broken()
+            return
+        pending[future] = (keys, arguments)
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+
+    try:
+        for index, problem in enumerate(problems):
+            try:
+                key, arguments = prepare(problem)
+                hash(key)
+            except Exception as error:
+                yield from output(index, None, _describe(error))
+                continue
+
+            if key in solved:
+                yield from output(index, *solved[key])
+            elif key in waiting:
+                waiting[key].append(index)
+            else:
+                waiting[key] = [index]
+                chunk.append((key, arguments))
+                if len(chunk) >= chunksize:
+                    yield from submit()
+
+        if chunk:
+            yield from submit()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def solve_equations_batch(equations: Iterable[str | tuple[str, str]], variable: str = 'x',
+                          workers: int | None = None, chunksize: int = 16,
+                          ordered: bool = True) -> Iterator[BatchResult]:
+    """
+    Solve many equations with solve_equation in a pool of worker processes.
+
+    Identical inputs (up to whitespace) are solved once. The input is read
+    lazily and the results are yielded as soon as they are available, so long
+    inputs can be streamed.
+
+    Args:
+        equations (Iterable[str | tuple[str, str]]): The equations, or (equation, variable) pairs.
+        variable (str): The variable to solve for, for the equations given without one.
+        workers (int | None): The number of worker processes, the number of CPUs if None.
+            With 1 the equations are solved in the current process.
+        chunksize (int): The number of distinct equations sent to a worker at a time.
+        ordered (bool): If True, the results are yielded in input order, otherwise as they complete.
+
+    Returns:
+        Iterator[BatchResult]: One result per equation. Its value is the result of solve_equation,
+        or None with error set to 'ExceptionType: message' if solving the equation raised.
+
+    Raises:
+        ValueError: If workers or chunksize is not positive.
+    """
+    return _batch(solve_equation, equations, lambda problem: _equation_problem(problem, variable),
+                  workers, chunksize, ordered)
+
+
+def solve_systems_batch(systems: Iterable, variables: list[str] | None = None,
+                        workers: int | None = None, chunksize: int = 16,
+                        ordered: bool = True) -> Iterator[BatchResult]:
+    """
+    Solve many systems with solve_system in a pool of worker processes.
+
+    Identical inputs (up to whitespace) are solved once. The input is read
+    lazily and the results are yielded as soon as they are available, so long
+    inputs can be streamed.
+
+    Args:
+        systems (Iterable): The lists of equations if variables is given,
+            otherwise (equations, variables) pairs.
+        variables (list[str] | None): The variables to solve for, shared by every system.
+        workers (int | None): The number of worker processes, the number of CPUs if None.
+            With 1 the systems are solved in the current process.
+        chunksize (int): The number of distinct systems sent to a worker at a time.
+        ordered (bool): If True, the results are yielded in input order, otherwise as they complete.
+
+    Returns:
+        Iterator[BatchResult]: One result per system. Its value is the result of solve_system,
+        or None with error set to 'ExceptionType: message' if solving the system raised.
+
+    Raises:
+        ValueError: If workers or chunksize is not positive.
+    """
+    return _batch(solve_system, systems, lambda problem: _system_problem(problem, variables),
+                  workers, chunksize, ordered)
@@ -0,0 +1,202 @@
+__author__ = 'Tobia Petrolini'
+__file__ = 'cache.py'
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    # Statistics of a cache, in the style of functools.lru_cache
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_MISSING = object()
+
+
+class LRUCache():
+    # A bounded, thread-safe least recently used cache.
+    def __init__(self, maxsize: int = 1024, enabled: bool = True):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of entries kept in the cache.
+            enabled (bool): Whether the cache stores and returns entries.
+
+        Raises:
+            ValueError: If maxsize is negative.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer")
+
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key, marking it as the most recently used.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any): The value returned when the key is not cached.
+
+        Returns:
+            Any: The cached value, or default.
+        """
+        if not self.enabled:
+            return default
+
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to store.
+        """
+        if not self.enabled or self.maxsize == 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove every entry and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics of the cache.
+
+        Returns:
+            CacheInfo: The hits, misses, maximum size and current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def configure(self, maxsize: int | None = None, enabled: bool | None = None):
+        """
+        Change the size limit of the cache or enable/disable it.
+
+        Disabling the cache also drops its entries.
+
+        Args:
+            maxsize (int | None): The new maximum number of entries.
+            enabled (bool | None): Whether the cache stores and returns entries.
+
+        Raises:
+            ValueError: If maxsize is negative.
+        """
+        with self._lock:
+            if maxsize is not None:
+                if maxsize < 0:
+                    raise ValueError("maxsize must be a non-negative integer")
+                self.maxsize = maxsize
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+            if enabled is not None:
+                self.enabled = enabled
+                if not enabled:
+                    self._data.clear()
+
+
+class WeakLRUCache(LRUCache):
+    # An LRUCache that also finds the evicted values still referenced elsewhere.
+    def __init__(self, maxsize: int = 1024, enabled: bool = True):
+        """
+        Initializes an empty cache.
+
+        The maxsize most recently used values are kept alive by the cache. Older
+        values are only referenced weakly: they are found again as long as another
+        object uses them, and are never kept alive by the cache. Values that do not
+        support weak references (numbers, tuples, ...) are dropped when evicted.
+
+        Args:
+            maxsize (int): The maximum number of entries kept alive by the cache.
+            enabled (bool): Whether the cache stores and returns entries.
+
+        Raises:
+            ValueError: If maxsize is negative.
+        """
+        super().__init__(maxsize, enabled)
+        self._weak = weakref.WeakValueDictionary()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if not self.enabled:
+            return default
+
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+
+            value = self._weak.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            # Alive elsewhere: used again, so kept alive by the cache again
+            self.hits += 1
+            self._store(key, value)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        if not self.enabled:
+            return
+
+        with self._lock:
+            try:
+                self._weak[key] = value
+            except TypeError:
+                pass
+            self._store(key, value)
+
+    def _store(self, key: Hashable, value: Any):
+        if self.maxsize == 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._weak.clear()
+        super().clear()
+
+    def configure(self, maxsize: int | None = None, enabled: bool | None = None):
+        super().configure(maxsize, enabled)
+        if enabled is False:
+            with self._lock:
+                self._weak.clear()
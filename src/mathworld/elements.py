@@ -3,38 +3,81 @@ from __future__ import annotations
 __author__ = 'Tobia Petrolini'
 __file__ = 'elements.py'
 
+import math
+import threading
+import weakref
+from functools import cached_property
+from typing import Iterable
+
 from .equations import *
+from .backend import SYMPY, NUMERIC, get_backend, set_backend, get_tolerance, set_tolerance, use_backend, resolve_backend
+from .profiling import api_call, sympy_operation
+from .memo import memoized
+from ._rational import integers, to_sympy, canonical_coefficients
+from .predicates import incident, on_segment, parallel, perpendicular
+
+_X, _Y = sp.symbols('x y')
+
+# SymPy functions timed by the profiler
+_cancel = sympy_operation('cancel', sp.cancel)
+_radsimp = sympy_operation('radsimp', sp.radsimp)
+_expand = sympy_operation('expand', sp.expand)
+_polynomial_lcm = sympy_operation('lcm', sp.lcm)
+_equals = sympy_operation('equals', sp.Expr.equals)
 
 
 class Point():
     # Represents a point in 2D space, with x and y coordinates.
-    def __init__(self, x: int | float | str | sp.Expr | None, y: int | float | str | sp.Expr | None):
+    __slots__ = ('x', 'y', 'backend', '__weakref__')
+
+    def __init__(self, x: int | float | str | sp.Expr | None, y: int | float | str | sp.Expr | None, backend: str | None = None):
         """
         Initializes the Point object with x and y coordinates.
 
         Args:
             x (int | float | str | sp.Expr | None): The x-coordinate of the point.
             y (int | float | str | sp.Expr | None): The y-coordinate of the point.
+            backend (str | None): SYMPY or NUMERIC, the current default backend if None.
         """
-        self.x = x
-        self.y = y
+        self.backend = resolve_backend(backend)
 
-        # Convert x and y to symbolic values
-        self.x = sympy_value(self.x, 'x')
-        self.y = sympy_value(self.y, 'y')
+        # Convert x and y to symbolic values, or to floats for the numeric backend
+        if self.backend == NUMERIC:
+            self.x = float_value(x, 'x')
+            self.y = float_value(y, 'y')
+        else:
+            self.x = sympy_value(x, 'x')
+            self.y = sympy_value(y, 'y')
 
-        # Store coordinates as a tuple
-        self.cordinates = self.x, self.y
+    @property
+    def cordinates(self) -> tuple:
+        """
+        The coordinates of the point, as a tuple (x, y).
+        """
+        return self.x, self.y
 
-        # Determine the quadrant of the point
-        if float(self.x) > 0 and float(self.y) > 0:
-            self.quadrant = 1
-        elif float(self.x) < 0 and float(self.y) > 0:
-            self.quadrant = 2
-        elif float(self.x) < 0 and float(self.y) < 0:
-            self.quadrant = 3
-        elif float(self.x) > 0 and float(self.y) < 0:
-            self.quadrant = 4
+    @property
+    def quadrant(self) -> int | None:
+        """
+        The quadrant of the point (1 to 4), None if it lies on an axis or the
+        signs of symbolic coordinates cannot be determined.
+        """
+        if self.backend == NUMERIC:
+            x_positive, x_negative = self.x > 0, self.x < 0
+            y_positive, y_negative = self.y > 0, self.y < 0
+        else:
+            x_positive, x_negative = self.x.is_positive, self.x.is_negative
+            y_positive, y_negative = self.y.is_positive, self.y.is_negative
+
+        if x_positive and y_positive:
+            return 1
+        elif x_negative and y_positive:
+            return 2
+        elif x_negative and y_negative:
+            return 3
+        elif x_positive and y_negative:
+            return 4
+        return None
 
     def __str__(self) -> str:
         """
@@ -45,6 +88,53 @@ class Point():
         """
         return f"{self.cordinates}"
 
+    def __eq__(self, other: object) -> bool:
+        # Points are equal if they have the same backend and the same coordinates
+        if not isinstance(other, Point):
+            return NotImplemented
+        return self.backend == other.backend and self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash(self._canonical())
+
+    def _canonical(self) -> tuple:
+        # The values compared by __eq__, which also key the memoized operations
+        return Point, self.backend, self.x, self.y
+
+    def __reduce__(self) -> tuple:
+        # Pickled as its coordinates, restored without converting them again
+        return _restore_point, (_pack(self.x), _pack(self.y), self.backend)
+
+    def intern(self) -> 'Point':
+        """
+        Return the shared instance of the points equal to this one.
+
+        Interned elements are kept in a table of weak references, so a shared
+        instance lives as long as it is used somewhere.
+
+        Returns:
+            Point: The first interned point equal to this one, or the point itself.
+        """
+        return _intern(self)
+
+    def to_numeric(self) -> 'Point':
+        """
+        Convert the point to the numeric backend.
+
+        Returns:
+            Point: The point with float coordinates (itself if it is already numeric).
+        """
+        return self if self.backend == NUMERIC else Point(self.x, self.y, backend=NUMERIC)
+
+    def to_exact(self) -> 'Point':
+        """
+        Convert the point to the SymPy backend.
+
+        Returns:
+            Point: The point with exact coordinates (itself if it is already exact).
+        """
+        return self if self.backend == SYMPY else Point(self.x, self.y, backend=SYMPY)
+
     def isorigin(self) -> bool:
         """
         Checks if the point is the origin.
@@ -52,9 +142,12 @@ class Point():
         Returns:
             bool: True if the point is the origin, False otherwise.
         """
-        return float(self.x) == 0 and float(self.y) == 0
+        if self.backend == NUMERIC:
+            tolerance = get_tolerance()
+            return abs(self.x) <= tolerance and abs(self.y) <= tolerance
+        return self.x == 0 and self.y == 0
 
-    def distancePoint(self, point: 'Point') -> sp.Expr:
+    def distancePoint(self, point: 'Point') -> sp.Expr | float:
         """
         Calculate the Euclidean distance to another point.
 
@@ -62,11 +155,18 @@ class Point():
             point (Point): The other point to calculate the distance from.
 
         Returns:
-            sp.Expr: The distance as a SymPy expression.
+            sp.Expr | float: The distance as a SymPy expression, or a float for numeric points.
         """
+        if _is_numeric(self, point):
+            return math.hypot(float(self.x) - float(point.x), float(self.y) - float(point.y))
+        values = integers(self.x, self.y, point.x, point.y)
+        if values is not None:
+            (x1, y1, x2, y2), w = values
+            return sp.sqrt(to_sympy((x1 - x2)**2 + (y1 - y2)**2, w * w))
         return sp.sqrt((self.x - point.x)**2 + (self.y - point.y)**2)
 
-    def distanceLine(self, line: 'Line') -> sp.Expr:
+    @memoized('Point.distanceLine')
+    def distanceLine(self, line: 'Line') -> sp.Expr | float:
         """
         Calculate the perpendicular distance from the point to a line.
 
@@ -74,35 +174,70 @@ class Point():
             line (Line): The line to calculate the distance from.
 
         Returns:
-            sp.Expr: The distance as a SymPy expression.
+            sp.Expr | float: The distance as a SymPy expression, or a float for numeric elements.
         """
+        if _is_numeric(self, line):
+            a, b, c = line._unit_coefficients()
+            return abs(a * float(self.x) + b * float(self.y) + c)
+        coefficients, point = _line_integers(line), _point_integers(self)
+        if coefficients is not None and point is not None:
+            (a, b, c), (x, y, w) = coefficients, point
+            return to_sympy(abs(a * x + b * y + c * w), w) / sp.sqrt(to_sympy(a**2 + b**2))
         return sp.Abs(line.a*self.x + line.b*self.y + line.c) / sp.sqrt(line.a**2 + line.b**2)
 
-    def ison(self, element: 'Point' | 'Line' | 'Segment') -> bool:
+    @api_call('Point.ison')
+    def ison(self, element: 'Point' | 'Line' | 'Segment' | 'Circle') -> bool:
         """
         Determine if the point lies on a given geometric element.
 
+        Numeric elements are compared within the current tolerance.
+
         Args:
-            element (Point | Line | Segment): The geometric element.
+            element (Point | Line | Segment | Circle): The geometric element.
 
         Returns:
             bool: True if the point lies on the element.
         """
+        if _is_numeric(self, element):
+            return self._ison_numeric(element, get_tolerance())
+
         if isinstance(element, Point):
-            return element.cordinates == self.cordinates
+            return element == self
         elif isinstance(element, Line):
             # Check if the point satisfies the line equation
-            return sp.simplify(element.a * self.x + element.b * self.y + element.c) == 0
+            return incident(self, element)
+        elif isinstance(element, Circle):
+            # Check if the point satisfies the circle equation
+            values = integers(self.x, self.y, element.center.x, element.center.y, element.radius)
+            if values is not None:
+                (x, y, cx, cy, r), _ = values
+                return (x - cx)**2 + (y - cy)**2 == r**2
+            return _is_zero((self.x - element.center.x)**2 + (self.y - element.center.y)**2 - element.radius**2)
         elif isinstance(element, Segment):
-            # Check if the point lies within the segment's endpoints and on its line
-            min_x = min(element.point1.x, element.point2.x)
-            max_x = max(element.point1.x, element.point2.x)
-            min_y = min(element.point1.y, element.point2.y)
-            max_y = max(element.point1.y, element.point2.y)
-            return self.ison(element.line) and (self.x >= min_x and self.x <= max_x) and (self.y >= min_y and self.y <= max_y)
+            # Check if the point lies on the segment's line, between its endpoints
+            return on_segment(self, element)
+
+    def _ison_numeric(self, element: 'Point' | 'Line' | 'Segment' | 'Circle', tolerance: float) -> bool:
+        x, y = float(self.x), float(self.y)
+
+        if isinstance(element, Point):
+            return abs(x - float(element.x)) <= tolerance and abs(y - float(element.y)) <= tolerance
+        elif isinstance(element, Line):
+            a, b, c = element._unit_coefficients()
+            return abs(a * x + b * y + c) <= tolerance
+        elif isinstance(element, Circle):
+            distance = math.hypot(x - float(element.center.x), y - float(element.center.y))
+            return abs(distance - float(element.radius)) <= tolerance
+        elif isinstance(element, Segment):
+            x1, y1 = float(element.point1.x), float(element.point1.y)
+            x2, y2 = float(element.point2.x), float(element.point2.y)
+            return (self._ison_numeric(element.line, tolerance) and
+                    min(x1, x2) - tolerance <= x <= max(x1, x2) + tolerance and
+                    min(y1, y2) - tolerance <= y <= max(y1, y2) + tolerance)
 
     @staticmethod
-    def findPoint(line: 'Line', point: 'Point', distance: int | float | str | sp.Expr) -> tuple['Point', 'Point | None']:
+    @api_call('Point.findPoint')
+    def findPoint(line: 'Line', point: 'Point', distance: int | float | str | sp.Expr, timeout: float | None = None) -> tuple['Point', 'Point | None']:
         """
         Find two points on a line at a specific distance from a reference point.
 
@@ -110,97 +245,374 @@ class Point():
             line (Line): The line on which to find the points.
             point (Point): The reference point.
             distance (int | float | str | sp.Expr): The desired distance from the reference point.
+            timeout (float | None): If given, the points are computed in a worker process
+                that is killed after this many seconds.
 
         Returns:
             tuple[Point, Point]: A tuple containing two points at the given distance.
 
         Raises:
             ValueError: If there are no possible points at the given distance.
+            SolveTimeout: If the computation takes longer than timeout.
         """
-        distance = sympy_value(distance, 'distance')
+        if timeout is not None:
+            from .workers import run
+            return run(Point.findPoint, line, point, distance, timeout=timeout)
 
-        # Equation of a circle around the reference point
-        circle_eq = sp.Eq((sp.Symbol('x') - point.x)**2 +
-                          (sp.Symbol('y') - point.y)**2, distance**2)
+        # The points are the intersections of the line with a circle around the reference point
+        backend = NUMERIC if _is_numeric(line, point) else SYMPY
+        points = Circle(point, distance, backend=backend).intersection(line)
 
-        # Solve for intersection points between the circle and line
-        sol = list(sp.solve([circle_eq, line.equation],
-                            (sp.Symbol('x'), sp.Symbol('y'))))
-
-        if not isinstance(sol[0][0], sp.Expr):
+        if len(points) == 0:
             raise ValueError(
                 'There is no point at that distance that lies on the line')
-        elif len(sol) == 1:
-            return Point(sol[0][0], sol[0][1]), None
+        elif len(points) == 1:
+            return points[0], None
         else:
-            return Point(sol[0][0], sol[0][1]), Point(sol[1][0], sol[1][1])
+            return points
+
+
+# Interned elements, keyed on themselves: equal elements share the first instance
+_INTERNED = weakref.WeakValueDictionary()
+_interned_lock = threading.Lock()
+
+
+def _intern(element: 'Point | Line') -> 'Point | Line':
+    # Keyed on the canonical values: a key holding the element would keep it alive
+    with _interned_lock:
+        return _INTERNED.setdefault(element._canonical(), element)
+
+
+def _pack(value: sp.Expr | float) -> int | tuple[int, int] | sp.Expr | float:
+    # Compact picklable form of a value: SymPy integers and rationals become Python ints
+    if isinstance(value, sp.Integer):
+        return int(value)
+    elif isinstance(value, sp.Rational):
+        return int(value.p), int(value.q)
+    return value
+
+
+def _unpack(value: int | tuple[int, int] | sp.Expr | float) -> sp.Expr | float:
+    if isinstance(value, int):
+        return sp.Integer(value)
+    elif isinstance(value, tuple):
+        return sp.Rational(*value)
+    return value
+
+
+def _restore_point(x, y, backend: str) -> 'Point':
+    point = Point.__new__(Point)
+    point.x, point.y, point.backend = _unpack(x), _unpack(y), backend
+    return point
+
+
+def _restore_line(a, b, c, backend: str) -> 'Line':
+    line = Line.__new__(Line)
+    line.backend = backend
+    line.a, line.b, line.c = _unpack(a), _unpack(b), _unpack(c)
+    line._slope = line._intercept = line._equation = line._implicitEquation = None
+    return line
+
+
+def _restore_segment(point1: 'Point', point2: 'Point') -> 'Segment':
+    segment = Segment.__new__(Segment)
+    segment.point1, segment.point2, segment.backend = point1, point2, point1.backend
+    return segment
+
+
+def _restore_circle(center: 'Point', radius, backend: str) -> 'Circle':
+    circle = Circle.__new__(Circle)
+    circle.center, circle.radius, circle.backend = center, _unpack(radius), backend
+    circle._equation = None
+    return circle
+
+
+def _is_numeric(*elements) -> bool:
+    # Operations involving at least one numeric element are computed with floats
+    return any(element.backend == NUMERIC for element in elements)
+
+
+def _tidy(value: sp.Expr) -> sp.Expr:
+    # Cheap normalization of a coefficient: rationals are already canonical,
+    # radicals get a rationalized denominator and symbolic values are cancelled.
+    if value.is_Rational or value.is_Float or value.is_Atom:
+        return value
+    elif value.free_symbols:
+        return _cancel(value)
+    elif not any(power.exp.is_negative for power in value.atoms(sp.Pow)):
+        # Nothing in a denominator to rationalize
+        return value
+    else:
+        return _radsimp(value)
+
+
+def _is_zero(value: sp.Expr) -> bool:
+    # Exact zero test: structural for rationals, simplification only when needed
+    if value.is_Rational or value.is_Float:
+        return value == 0
+
+    value = _expand(value)
+    if value == 0:
+        return True
+    elif value.free_symbols:
+        return _cancel(value) == 0
+    return _equals(value, 0) is True
+
+
+def _denominator(value: sp.Expr) -> sp.Expr:
+    # Denominator of a coefficient, as used to clear fractions in ax + by + c = 0.
+    if value.is_Rational:
+        return sp.Integer(value.q)
+    return value.as_numer_denom()[1]
+
+
+def _lcm(value1: sp.Expr, value2: sp.Expr) -> sp.Expr:
+    if value1.is_Integer and value2.is_Integer:
+        return sp.Integer(math.lcm(int(value1), int(value2)))
+    return _polynomial_lcm(value1, value2)
+
+
+def _linear_form(equation: sp.Equality) -> tuple[sp.Expr, sp.Expr, sp.Expr]:
+    """
+    Extract the coefficients of an equation written as ax + by + c = 0.
 
+    Args:
+        equation (sp.Equality): The equation, linear in x and y.
 
-ORIGIN = Point(sp.Integer(0), sp.Integer(0))
+    Returns:
+        tuple[sp.Expr, sp.Expr, sp.Expr]: The (not yet normalized) coefficients a, b and c.
+
+    Raises:
+        ValueError: If the equation is not linear in x and y.
+    """
+    x, y = _X, _Y
+    terms = {x: [], y: [], sp.S.One: []}
+
+    difference = equation.lhs - equation.rhs
+    if difference.has(sp.Float):
+        # Floats are rationalized, as sp.solve did, so that y = 0.5*x is the line of 'y = x/2'
+        difference = sp.nsimplify(difference, rational=True)
+    for term in sp.Add.make_args(_expand(difference)):
+        coefficient, variable = term.as_independent(x, y, as_Add=False)
+        if variable not in terms:
+            raise ValueError("equation must be linear in x and y")
+        terms[variable].append(coefficient)
+
+    return sp.Add(*terms[x]), sp.Add(*terms[y]), sp.Add(*terms[sp.S.One])
+
+
+def _canonical_coefficients(a: sp.Expr, b: sp.Expr, c: sp.Expr) -> tuple[sp.Expr, sp.Expr, sp.Expr]:
+    """
+    Normalize the coefficients of ax + by + c = 0.
+
+    The line is first divided by b (or by a for vertical lines) and then
+    multiplied by the least common multiple of the remaining denominators,
+    so that y = 2x/3 + 1/3 becomes -2x + 3y - 1 = 0.
+
+    Args:
+        a (sp.Expr): The coefficient of x.
+        b (sp.Expr): The coefficient of y.
+        c (sp.Expr): The constant term.
+
+    Returns:
+        tuple[sp.Expr, sp.Expr, sp.Expr]: The canonical coefficients a, b and c.
+
+    Raises:
+        ValueError: If a and b are both zero.
+    """
+    values = integers(a, b, c)
+    if values is not None:
+        return canonical_coefficients(*values[0])
+
+    if b != 0:
+        p, q = _tidy(a / b), _tidy(c / b)
+        scale = _lcm(_denominator(p), _denominator(q))
+        return _tidy(p * scale), scale, _tidy(q * scale)
+    elif a != 0:
+        q = _tidy(c / a)
+        scale = _denominator(q)
+        return scale, sp.Integer(0), _tidy(q * scale)
+    else:
+        raise ValueError("a and b cannot both be zero")
+
+
+def _point_integers(point: Point) -> tuple[int, int, int] | None:
+    # Homogeneous integer coordinates (x, y, w) of an exact point, None if they are not rational
+    values = integers(point.x, point.y)
+    return None if values is None else (*values[0], values[1])
+
+
+def _line_integers(line: 'Line') -> tuple[int, int, int] | None:
+    # Integer multiples of the coefficients of an exact line, None if they are not rational
+    values = integers(line.a, line.b, line.c)
+    return None if values is None else values[0]
 
 
 class Line():
     # Represents a line in 2D space, defined by an equation.
-    def __init__(self, equation: str | sp.Equality):
+    __slots__ = ('a', 'b', 'c', 'backend', '_slope', '_intercept', '_equation', '_implicitEquation', '__weakref__')
+
+    @api_call('Line.__init__')
+    def __init__(self, equation: str | sp.Equality, backend: str | None = None, timeout: float | None = None):
         """
         Initializes the Line object from an equation.
 
         Args:
             equation (str | sp.Equality): The equation defining the line.
+            backend (str | None): SYMPY or NUMERIC, the current default backend if None.
+            timeout (float | None): If given, the equation is processed in a worker process
+                that is killed after this many seconds.
 
         Raises:
             ValueError: If the provided equation format is invalid.
+            SolveTimeout: If processing the equation takes longer than timeout.
         """
-        self.equation = equation
+        backend = resolve_backend(backend)
+
+        if timeout is not None:
+            from .workers import run
+            line = run(Line, equation, backend, timeout=timeout)
+            self.backend, self.a, self.b, self.c = line.backend, line.a, line.b, line.c
+            self._slope = self._intercept = self._equation = self._implicitEquation = None
+            return
 
         # Process the equation input
-        if isinstance(self.equation, str):
-            self.equation = read_equation(self.equation)
-        elif isinstance(self.equation, sp.Equality):
-            pass
-        else:
+        if isinstance(equation, str):
+            equation = read(equation)
+
+        if not isinstance(equation, sp.Equality):
             raise ValueError("equation must be an Equality or str")
 
-        # Determine the implicit form and coefficients
-        if 'y' in str(self.equation):
-            self.equation = sp.Eq(expression('y'), expression(
-                str(sp.solve(self.equation, 'y')[0])))
-
-            lhs, rhs = self.equation.lhs, self.equation.rhs
-            lcm_denoms = sp.lcm([term.as_numer_denom()[1]
-                                for term in (lhs - rhs).as_ordered_terms()])
-            scaled_lhs = (lhs - rhs) * lcm_denoms
-
-            # Simplify the implicit equation
-            self.implicitEquation = sp.Eq(scaled_lhs.simplify(), 0)
-
-            # Calculate slope and intercept
-            self.slope = sp.simplify(
-                sp.diff(self.equation.rhs, sp.Symbol('x')))
-            self.intercept = sp.solve(self.equation, 'y')[0].subs('x', 0)
-
-            # Extract coefficients for implicit form
-            x, y = sp.symbols('x y')
-            self.a = self.implicitEquation.lhs.as_coefficients_dict().get(x, 0)
-            self.b = self.implicitEquation.lhs.as_coefficients_dict().get(y, 0)
-            self.c = self.implicitEquation.lhs.as_coefficients_dict().get(1, 0)
+        a, b, c = _linear_form(equation)
+        if backend == NUMERIC:
+            self._set_numeric_coefficients(
+                float_value(a, 'a'), float_value(b, 'b'), float_value(c, 'c'))
+        else:
+            self._set_coefficients(*_canonical_coefficients(a, b, c))
+
+    @classmethod
+    @api_call('Line.from_coefficients')
+    def from_coefficients(cls, a: int | float | str | sp.Expr, b: int | float | str | sp.Expr, c: int | float | str | sp.Expr, backend: str | None = None) -> 'Line':
+        """
+        Build a line directly from the coefficients of ax + by + c = 0.
+
+        Args:
+            a (int | float | str | sp.Expr): The coefficient of x.
+            b (int | float | str | sp.Expr): The coefficient of y.
+            c (int | float | str | sp.Expr): The constant term.
+            backend (str | None): SYMPY or NUMERIC, the current default backend if None.
+
+        Returns:
+            Line: The line, with the same attributes as if it was built from its equation.
+
+        Raises:
+            ValueError: If a and b are both zero.
+        """
+        line = cls.__new__(cls)
+        if resolve_backend(backend) == NUMERIC:
+            line._set_numeric_coefficients(
+                float_value(a, 'a'), float_value(b, 'b'), float_value(c, 'c'))
+        elif (values := integers(a, b, c)) is not None:
+            # ints, rational floats and SymPy rationals, without converting them to SymPy first
+            line._set_coefficients(*canonical_coefficients(*values[0]))
         else:
-            # Vertical line processing
-            self.equation = sp.Eq(expression('x'), expression(
-                str(sp.solve(self.equation, 'x')[0])))
-
-            lhs, rhs = self.equation.lhs, self.equation.rhs
-            lcm_denoms = sp.lcm([term.as_numer_denom()[1]
-                                for term in (lhs - rhs).as_ordered_terms()])
-            scaled_lhs = (lhs - rhs) * lcm_denoms
-
-            self.implicitEquation = sp.Eq(scaled_lhs.simplify(), 0)
-            x = sp.symbols('x')
-            self.a = self.implicitEquation.lhs.as_coefficients_dict().get(x, 0)
-            self.b = sp.Integer(0)
-            self.c = self.implicitEquation.lhs.as_coefficients_dict().get(1, 0)
-            self.slope = sp.oo
-            self.intercept = None
+            line._set_coefficients(*_canonical_coefficients(
+                sympy_value(a, 'a'), sympy_value(b, 'b'), sympy_value(c, 'c')))
+        return line
+
+    @classmethod
+    def _from_integers(cls, a: int, b: int, c: int) -> 'Line':
+        # An exact line from integer coefficients, as computed by the integer fast paths
+        line = cls.__new__(cls)
+        line._set_coefficients(*canonical_coefficients(a, b, c))
+        return line
+
+    def _set_coefficients(self, a: sp.Expr, b: sp.Expr, c: sp.Expr):
+        # The canonical coefficients, every other attribute is derived on first access
+        self.backend = SYMPY
+        self.a, self.b, self.c = a, b, c
+        self._slope = self._intercept = self._equation = self._implicitEquation = None
+
+    def _set_numeric_coefficients(self, a: float, b: float, c: float):
+        # Numeric lines keep a unit normal (a, b), with b > 0 or a > 0 for vertical lines
+        norm = math.hypot(a, b)
+        if norm == 0:
+            raise ValueError("a and b cannot both be zero")
+        elif b < 0 or (b == 0 and a < 0):
+            norm = -norm
+
+        self.backend = NUMERIC
+        self.a, self.b, self.c = a / norm + 0.0, b / norm + 0.0, c / norm + 0.0
+        self._slope = self._intercept = self._equation = self._implicitEquation = None
+
+    def _set_slope_intercept(self):
+        if self.backend == NUMERIC:
+            if self.b != 0:
+                self._slope = -self.a / self.b + 0.0
+                self._intercept = -self.c / self.b + 0.0
+            else:
+                # Vertical line
+                self._slope = math.inf
+        elif self.b != 0:
+            coefficients = _line_integers(self)
+            if coefficients is not None:
+                a, b, c = coefficients
+                self._slope, self._intercept = to_sympy(-a, b), to_sympy(-c, b)
+            else:
+                self._slope = _tidy(-self.a / self.b)
+                self._intercept = _tidy(-self.c / self.b)
+        else:
+            # Vertical line
+            self._slope = sp.oo
+
+    @property
+    def slope(self) -> sp.Expr | float:
+        """
+        The slope of the line, infinite for vertical lines.
+        """
+        if self._slope is None:
+            self._set_slope_intercept()
+        return self._slope
+
+    @property
+    def intercept(self) -> sp.Expr | float | None:
+        """
+        The y-intercept of the line, None for vertical lines.
+        """
+        if self._slope is None:
+            self._set_slope_intercept()
+        return self._intercept
+
+    def _unit_coefficients(self) -> tuple[float, float, float]:
+        # Float coefficients of the line, scaled so that (a, b) is a unit vector
+        if self.backend == NUMERIC:
+            return self.a, self.b, self.c
+
+        a, b, c = float_value(self.a, 'a'), float_value(self.b, 'b'), float_value(self.c, 'c')
+        norm = math.hypot(a, b)
+        return a / norm, b / norm, c / norm
+
+    @property
+    def equation(self) -> sp.Equality:
+        """
+        The explicit equation of the line, y = mx + q (x = k for vertical lines).
+        """
+        if self._equation is None:
+            if self.intercept is not None:
+                self._equation = sp.Eq(_Y, self.slope * _X + self.intercept, evaluate=False)
+            else:
+                value = -self.c / self.a
+                self._equation = sp.Eq(_X, value if self.backend == NUMERIC else _tidy(value), evaluate=False)
+        return self._equation
+
+    @property
+    def implicitEquation(self) -> sp.Equality:
+        """
+        The implicit equation of the line, ax + by + c = 0.
+        """
+        if self._implicitEquation is None:
+            self._implicitEquation = sp.Eq(self.a * _X + self.b * _Y + self.c, 0, evaluate=False)
+        return self._implicitEquation
 
     def __str__(self) -> str:
         """
@@ -211,6 +623,60 @@ class Line():
         """
         return f'{self.equation.lhs} = {self.equation.rhs}'
 
+    def __eq__(self, other: object) -> bool:
+        # Lines are equal if they have the same backend and the same canonical coefficients:
+        # exact lines are scaled to coprime integers when rational, with b > 0 (a > 0 if vertical),
+        # numeric lines to a unit normal with the same sign convention
+        if not isinstance(other, Line):
+            return NotImplemented
+        return (self.backend == other.backend and
+                self.a == other.a and self.b == other.b and self.c == other.c)
+
+    def __hash__(self) -> int:
+        return hash(self._canonical())
+
+    def _canonical(self) -> tuple:
+        # The values compared by __eq__, which also key the memoized operations
+        return Line, self.backend, self.a, self.b, self.c
+
+    def __reduce__(self) -> tuple:
+        # Pickled as its canonical coefficients: the derived attributes are rebuilt on first access
+        return _restore_line, (_pack(self.a), _pack(self.b), _pack(self.c), self.backend)
+
+    def intern(self) -> 'Line':
+        """
+        Return the shared instance of the lines equal to this one.
+
+        Returns:
+            Line: The first interned line equal to this one, or the line itself.
+        """
+        return _intern(self)
+
+    def to_numeric(self) -> 'Line':
+        """
+        Convert the line to the numeric backend.
+
+        Returns:
+            Line: The line with float coefficients (itself if it is already numeric).
+        """
+        if self.backend == NUMERIC:
+            return self
+        return Line.from_coefficients(self.a, self.b, self.c, backend=NUMERIC)
+
+    def to_exact(self) -> 'Line':
+        """
+        Convert the line to the SymPy backend.
+
+        Returns:
+            Line: The line with exact coefficients (itself if it is already exact).
+        """
+        if self.backend == SYMPY:
+            return self
+        elif self.intercept is None:
+            return Line.from_coefficients(1, 0, self.c / self.a, backend=SYMPY)
+        # Go through the slope, whose float is usually shorter than the unit normal's
+        return Line.from_coefficients(-self.slope, 1, -self.intercept, backend=SYMPY)
+
     def isHorizontal(self) -> bool:
         """
         Check if the line is horizontal.
@@ -218,6 +684,8 @@ class Line():
         Returns:
             bool: True if the line is horizontal.
         """
+        if self.backend == NUMERIC:
+            return abs(self.a) <= get_tolerance()
         return self.slope == 0
 
     def isVertical(self) -> bool:
@@ -227,6 +695,8 @@ class Line():
         Returns:
             bool: True if the line is vertical.
         """
+        if self.backend == NUMERIC:
+            return abs(self.b) <= get_tolerance()
         return self.slope == sp.oo
 
     def isParallel(self, line: 'Line') -> bool:
@@ -239,7 +709,11 @@ class Line():
         Returns:
             bool: True if the lines are parallel.
         """
-        return self.slope == line.slope
+        if _is_numeric(self, line):
+            a1, b1, _ = self._unit_coefficients()
+            a2, b2, _ = line._unit_coefficients()
+            return abs(a1 * b2 - a2 * b1) <= get_tolerance()
+        return parallel(self, line)
 
     def isPerpendicular(self, line: 'Line') -> bool:
         """
@@ -251,22 +725,69 @@ class Line():
         Returns:
             bool: True if the lines are perpendicular.
         """
-        return self.slope * line.slope == -1
-
-    def intersection(self, line: 'Line') -> Point:
+        if _is_numeric(self, line):
+            a1, b1, _ = self._unit_coefficients()
+            a2, b2, _ = line._unit_coefficients()
+            return abs(a1 * a2 + b1 * b2) <= get_tolerance()
+        return perpendicular(self, line)
+
+    @api_call('Line.intersection')
+    @memoized('Line.intersection')
+    def intersection(self, line: 'Line', timeout: float | None = None) -> Point | 'Line' | None:
         """
         Calculate the intersection point with another line.
 
+        The point is computed from the coefficients with Cramer's rule.
+
         Args:
             line (Line): The other line.
+            timeout (float | None): If given, the point is computed in a worker process
+                that is killed after this many seconds.
 
         Returns:
-            Point: The intersection point.
-        """
-        x, y = sp.symbols('x y')
-        sol = sp.solve([self.equation, line.equation], (x, y))
-        return Point(sol[x], sol[y])
+            Point | Line | None: The intersection point, None if the lines are parallel
+            or the line itself if the lines are coincident.
 
+        Raises:
+            SolveTimeout: If the computation takes longer than timeout.
+        """
+        if timeout is not None:
+            from .workers import run
+            point = run(Line.intersection, self, line, timeout=timeout)
+            return self if isinstance(point, Line) else point
+
+        if _is_numeric(self, line):
+            a1, b1, c1 = self._unit_coefficients()
+            a2, b2, c2 = line._unit_coefficients()
+            tolerance = get_tolerance()
+
+            # Cramer's rule on a1x + b1y = -c1, a2x + b2y = -c2
+            determinant = a1 * b2 - a2 * b1
+            if abs(determinant) <= tolerance:
+                # Parallel lines: coincident if a point of this line lies on the other
+                return self if abs(c2 - c1 * (a1 * a2 + b1 * b2)) <= tolerance else None
+            return Point((b1 * c2 - b2 * c1) / determinant,
+                         (a2 * c1 - a1 * c2) / determinant, backend=NUMERIC)
+
+        coefficients1, coefficients2 = _line_integers(self), _line_integers(line)
+        if coefficients1 is not None and coefficients2 is not None:
+            (a1, b1, c1), (a2, b2, c2) = coefficients1, coefficients2
+            determinant = a1 * b2 - a2 * b1
+            if determinant == 0:
+                return self if a1 * c2 - a2 * c1 == 0 and b1 * c2 - b2 * c1 == 0 else None
+            return Point(to_sympy(b1 * c2 - b2 * c1, determinant),
+                         to_sympy(a2 * c1 - a1 * c2, determinant), backend=SYMPY)
+
+        a1, b1, c1 = self.a, self.b, self.c
+        a2, b2, c2 = line.a, line.b, line.c
+
+        determinant = a1 * b2 - a2 * b1
+        if _is_zero(determinant):
+            return self if _is_zero(a1 * c2 - a2 * c1) and _is_zero(b1 * c2 - b2 * c1) else None
+        return Point(_tidy((b1 * c2 - b2 * c1) / determinant),
+                     _tidy((a2 * c1 - a1 * c2) / determinant), backend=SYMPY)
+
+    @api_call('Line.isPerpendicularBisector')
     def isPerpendicularBisector(self, segment: 'Segment') -> bool:
         """
         Check if the line is the axis of a given segment.
@@ -277,35 +798,55 @@ class Line():
         Returns:
             bool: True if the line is the axis of the segment.
         """
-        return str(self.equation) == str(segment.perpendicularBisector.equation)
+        if _is_numeric(self, segment):
+            return self.isParallel(segment.perpendicularBisector) and segment.middle.ison(self)
+        return self == segment.perpendicularBisector
 
+    @api_call('Line.isBisector')
     def isBisector(self, line1: 'Line', line2: 'Line') -> bool:
         """
         Check if the line is the bisector of the angle between two other lines.
 
+        The line is a bisector if it passes through the intersection of the two
+        lines, i.e. the determinant of the three equations is zero, and makes
+        the same angle with both of them: (a*a1 + b*b1)^2 * n2^2 = (a*a2 + b*b2)^2 * n1^2.
+        For parallel lines the only bisector is the line halfway between them.
+
         Args:
             line1 (Line): The first line.
             line2 (Line): The second line.
 
         Returns:
-            bool: True if the line is the bisector of the two lines.
+            bool: True if the line is a bisector of the two lines, False if the lines are coincident.
         """
-        intersection_point = line1.intersection(line2)
-
-        # Determine a test point slightly offset from the intersection
-        if not self.isVertical():
-            test_point = Point(intersection_point.x + 1,
-                               intersection_point.y + self.slope)
-        else:
-            test_point = Point(intersection_point.x, intersection_point.y + 1)
-
-        # Calculate distances from the test point to the two lines
-        distance_to_line1 = test_point.distanceLine(line1)
-        distance_to_line2 = test_point.distanceLine(line2)
-
-        # Check if distances are equal
-        return sp.simplify(distance_to_line1 - distance_to_line2) == 0
-
+        if line1.isParallel(line2):
+            try:
+                (a2, b2, c2), = line1._bisector_coefficients(line2)
+            except ValueError:
+                return False
+            line = Line.from_coefficients(a2, b2, c2, backend=NUMERIC if _is_numeric(self, line1, line2) else SYMPY)
+            return self.isParallel(line) and self.intersection(line) is self
+
+        if _is_numeric(self, line1, line2):
+            a, b, c = self._unit_coefficients()
+            a1, b1, c1 = line1._unit_coefficients()
+            a2, b2, c2 = line2._unit_coefficients()
+            tolerance = get_tolerance()
+
+            determinant = a * (b1 * c2 - b2 * c1) - b * (a1 * c2 - a2 * c1) + c * (a1 * b2 - a2 * b1)
+            return (abs(determinant) <= tolerance and
+                    abs(abs(a * a1 + b * b1) - abs(a * a2 + b * b2)) <= tolerance)
+
+        a, b, c = self.a, self.b, self.c
+        a1, b1, c1 = line1.a, line1.b, line1.c
+        a2, b2, c2 = line2.a, line2.b, line2.c
+
+        determinant = a * (b1 * c2 - b2 * c1) - b * (a1 * c2 - a2 * c1) + c * (a1 * b2 - a2 * b1)
+        return (_is_zero(determinant) and
+                _is_zero((a * a1 + b * b1)**2 * (a2**2 + b2**2) - (a * a2 + b * b2)**2 * (a1**2 + b1**2)))
+
+    @api_call('Line.findParallel')
+    @memoized('Line.findParallel')
     def findParallel(self, point: Point) -> 'Line':
         """
         Find a parallel line that passes through a given point.
@@ -316,12 +857,18 @@ class Line():
         Returns:
             Line: The parallel line.
         """
-        if self.isVertical():
-            return Line(sp.Eq(expression('x'), point.x))
-        else:
-            intercept = point.y - self.slope * point.x
-            return Line(sp.Eq(expression('y'), self.slope * expression('x') + intercept))
-
+        if _is_numeric(self, point):
+            a, b, _ = self._unit_coefficients()
+            x, y = float(point.x), float(point.y)
+            return Line.from_coefficients(a, b, -(a * x + b * y), backend=NUMERIC)
+        coefficients, homogeneous = _line_integers(self), _point_integers(point)
+        if coefficients is not None and homogeneous is not None:
+            (a, b, _), (x, y, w) = coefficients, homogeneous
+            return Line._from_integers(a * w, b * w, -(a * x + b * y))
+        return Line.from_coefficients(self.a, self.b, -(self.a * point.x + self.b * point.y), backend=SYMPY)
+
+    @api_call('Line.findPerpendicular')
+    @memoized('Line.findPerpendicular')
     def findPerpendicular(self, point: Point) -> 'Line':
         """
         Find a perpendicular line that passes through a given point.
@@ -332,58 +879,88 @@ class Line():
         Returns:
             Line: The perpendicular line.
         """
-        if self.isVertical():
-            return Line(sp.Eq(expression('y'), point.y))
-        elif self.isHorizontal():
-            return Line(sp.Eq(expression('x'), point.x))
-        else:
-            perpendicular_slope = -1 / self.slope
-            intercept = point.y - perpendicular_slope * point.x
-            return Line(sp.Eq(expression('y'), perpendicular_slope * expression('x') + intercept))
-
-    def findBisector(self, line: 'Line') -> tuple['Line', 'Line']:
+        if _is_numeric(self, point):
+            a, b, _ = self._unit_coefficients()
+            x, y = float(point.x), float(point.y)
+            return Line.from_coefficients(b, -a, a * y - b * x, backend=NUMERIC)
+        coefficients, homogeneous = _line_integers(self), _point_integers(point)
+        if coefficients is not None and homogeneous is not None:
+            (a, b, _), (x, y, w) = coefficients, homogeneous
+            return Line._from_integers(b * w, -a * w, a * y - b * x)
+        return Line.from_coefficients(self.b, -self.a, self.a * point.y - self.b * point.x, backend=SYMPY)
+
+    @api_call('Line.findBisector')
+    @memoized('Line.findBisector')
+    def findBisector(self, line: 'Line') -> tuple['Line', ...]:
         """
         Find the bisectors of the angles formed between the current line and another line.
 
+        With the coefficients scaled to unit normals, n1 = sqrt(a1^2 + b1^2) and
+        n2 = sqrt(a2^2 + b2^2), the bisectors are (a1/n1 - a2/n2)x + (b1/n1 - b2/n2)y + (c1/n1 - c2/n2) = 0
+        and the same with a sum, so no equation has to be solved.
+
         Args:
             line (Line): The other line.
 
         Returns:
-            tuple[Line, Line]: The two angle bisectors as lines.
-        """
-        x, y = sp.symbols('x y')
+            tuple[Line, ...]: The two angle bisectors as lines, or only the line halfway
+            between them if the lines are parallel.
 
-        # Calculate distance expressions for each line
-        distance_self = (self.a * x + self.b * y + self.c) / \
-            sp.sqrt(self.a**2 + self.b**2)
-        distance_line = (line.a * x + line.b * y + line.c) / \
-            sp.sqrt(line.a**2 + line.b**2)
-
-        # Form equations for the angle bisectors
-        eq1 = sp.Eq(distance_self, distance_line)
-        eq2 = sp.Eq(distance_self, -distance_line)
-
-        # Solve for the bisectors
-        if not self.isVertical():
-            solutions1 = sp.solve(eq1, y)
-            solutions2 = sp.solve(eq2, y)
-            solutions = solutions1 + solutions2
-        else:
-            solutions1 = sp.solve(eq1, x)
-            solutions2 = sp.solve(eq2, x)
-            solutions = solutions1 + solutions2
-
-        if len(solutions) == 2:
-            line1 = Line(sp.Eq(y, solutions[0])) if not self.isVertical(
-            ) else Line(sp.Eq(x, solutions[0]))
-            line2 = Line(sp.Eq(y, solutions[1])) if not self.isVertical(
-            ) else Line(sp.Eq(x, solutions[1]))
-            return line1, line2
-        else:
-            return Line(sp.Eq(y, solutions[0])) if not self.isVertical() else Line(sp.Eq(x, solutions[0]))
+        Raises:
+            ValueError: If the lines are coincident.
+        """
+        backend = NUMERIC if _is_numeric(self, line) else SYMPY
+        return tuple(Line.from_coefficients(a, b, c, backend=backend)
+                     for a, b, c in self._bisector_coefficients(line))
+
+    def _bisector_coefficients(self, line: 'Line') -> list[tuple]:
+        # Coefficients (a, b, c), not normalized, of the bisectors of the two lines
+        if _is_numeric(self, line):
+            a1, b1, c1 = self._unit_coefficients()
+            a2, b2, c2 = line._unit_coefficients()
+            tolerance = get_tolerance()
+
+            if abs(a1 * b2 - a2 * b1) <= tolerance:
+                # Parallel lines: the unit normals point the same way or opposite ways
+                sign = 1.0 if a1 * a2 + b1 * b2 > 0 else -1.0
+                if abs(c1 - sign * c2) <= tolerance:
+                    raise ValueError("The lines are coincident")
+                return [(a1, b1, (c1 + sign * c2) / 2)]
+            return [(a1 - a2, b1 - b2, c1 - c2), (a1 + a2, b1 + b2, c1 + c2)]
+
+        a1, b1, c1 = self.a, self.b, self.c
+        a2, b2, c2 = line.a, line.b, line.c
+
+        if _is_zero(a1 * b2 - a2 * b1):
+            # Parallel lines: (a2, b2) = k(a1, b1), the bisector is halfway between them
+            k = a2 / a1 if not _is_zero(a1) else b2 / b1
+            if _is_zero(c2 - k * c1):
+                raise ValueError("The lines are coincident")
+            return [(a1, b1, (c1 + c2 / k) / 2)]
+
+        r1, r2 = a1**2 + b1**2, a2**2 + b2**2
+        n1, n2 = sp.sqrt(r1), sp.sqrt(r2)
+        coefficients = ((a1, a2), (b1, b2), (c1, c2))
+
+        bisectors = []
+        for sign in (1, -1):
+            # The bisector is (u1*n2 - sign*u2*n1) for u = a, b, c, that is the
+            # difference (sign = 1) or the sum (sign = -1) of the unit equations.
+            # Scaling it by the conjugate (v1*n2 + sign*v2*n1) of b (or a) turns
+            # that coefficient into the rational v1^2*r2 - v2^2*r1 and leaves a
+            # single radical n1*n2 in the others, which keeps canonicalization cheap.
+            for v1, v2 in ((b1, b2), (a1, a2)):
+                if not _is_zero(v1**2 * r2 - v2**2 * r1):
+                    bisectors.append(tuple(u1 * v1 * r2 - u2 * v2 * r1 + sign * (u1 * v2 - u2 * v1) * n1 * n2
+                                           for u1, u2 in coefficients))
+                    break
+            else:
+                bisectors.append(tuple(u1 * n2 - sign * u2 * n1 for u1, u2 in coefficients))
+        return bisectors
 
     @staticmethod
-    def findLine(point1: Point | None = None, point2: Point | None = None, slope: int | float | str | sp.Expr | None = None, intercept: int | float | str | sp.Expr | None = None) -> 'Line':
+    @api_call('Line.findLine')
+    def findLine(point1: Point | None = None, point2: Point | None = None, slope: int | float | str | sp.Expr | None = None, intercept: int | float | str | sp.Expr | None = None, backend: str | None = None) -> 'Line':
         """
         Generate a line based on given parameters.
 
@@ -392,6 +969,8 @@ class Line():
             point2 (Point | None): The second point on the line.
             slope (int | float | str | sp.Expr | None): The slope of the line.
             intercept (int | float | str | sp.Expr | None): The y-intercept of the line.
+            backend (str | None): SYMPY or NUMERIC. If None, the line is numeric when a
+                given point is numeric, otherwise the current default backend is used.
 
         Returns:
             Line: The constructed line object.
@@ -399,22 +978,43 @@ class Line():
         Raises:
             ValueError: If sufficient parameters are not provided.
         """
+        if backend is None and _is_numeric(*(point for point in (point1, point2) if point is not None)):
+            backend = NUMERIC
+        backend = resolve_backend(backend)
+        value = float_value if backend == NUMERIC else sympy_value
+
+        if backend == NUMERIC and point1 and point2:
+            # Through two points, without going through the slope
+            x1, y1 = float(point1.x), float(point1.y)
+            x2, y2 = float(point2.x), float(point2.y)
+            if x1 == x2 and y1 == y2:
+                raise ValueError("point1 and point2 must be different points")
+            return Line.from_coefficients(y2 - y1, x1 - x2, x2 * y1 - x1 * y2, backend=NUMERIC)
+
         is_vertical = False
 
+        if slope is not None:
+            slope = value(slope, 'slope')
+
         # Check if the line is vertical based on the slope or point alignment
         if slope == sp.oo or (point1 and point2 and point1.x == point2.x):
             is_vertical = True
 
         if intercept is not None:
-            intercept = sympy_value(intercept, 'intercept')
+            intercept = value(intercept, 'intercept')
+
+        if backend == SYMPY:
+            line = _find_rational_line(point1, point2, slope, intercept, is_vertical)
+            if line is not None:
+                return line
 
         if is_vertical:
             if point1:
-                return Line(sp.Eq(expression('x'), point1.x))
+                return Line.from_coefficients(1, 0, -point1.x, backend=backend)
             elif point2:
-                return Line(sp.Eq(expression('x'), point2.x))
+                return Line.from_coefficients(1, 0, -point2.x, backend=backend)
             elif intercept is not None:
-                return Line(sp.Eq(expression('x'), intercept))
+                return Line.from_coefficients(1, 0, -intercept, backend=backend)
             else:
                 raise ValueError(
                     "One of point1, point2, or intercept must be provided.")
@@ -432,31 +1032,386 @@ class Line():
             else:
                 raise ValueError("At least two parameters must be provided.")
 
-        return Line(sp.Eq(expression('y'), slope * expression('x') + intercept))
-
-
-X_AXIS = Line(equation('y = 0'))
-Y_AXIS = Line(equation('x = 0'))
-BISECTOR_1_3 = Line(equation('y = x'))
-BISECTOR_2_4 = Line(equation('y = -x'))
+        return Line.from_coefficients(-slope, 1, -intercept, backend=backend)
+
+
+def _find_rational_line(point1: Point | None, point2: Point | None, slope: sp.Expr | None,
+                        intercept: sp.Expr | None, is_vertical: bool) -> Line | None:
+    # findLine with integer arithmetic, None if a value is not rational or the
+    # parameters are not enough, which is left to findLine
+    points = [point for point in (point1, point2) if point is not None]
+    if any(point.backend != SYMPY for point in points):
+        # Their float coordinates are combined as floats by findLine
+        return None
+    values = integers(*(coordinate for point in points for coordinate in (point.x, point.y)),
+                      *(value for value in (slope, intercept) if value is not None))
+    if values is None:
+        return None
+    values, w = values
+
+    if is_vertical:
+        if points:
+            return Line._from_integers(w, 0, -values[0])
+        return Line._from_integers(w, 0, -values[-1]) if intercept is not None else None
+    elif len(points) == 2:
+        x1, y1, x2, y2 = values[:4]
+        # The line through the points, the same as slope (y2 - y1) / (x2 - x1), times w^2
+        return Line._from_integers(w * (y2 - y1), w * (x1 - x2), x2 * y1 - x1 * y2)
+    elif slope is not None and points:
+        x, y, slope = values[:3]
+        # y = slope * x + (y - slope * x), times w^2
+        return Line._from_integers(-slope * w, w * w, slope * x - y * w)
+    elif slope is not None and intercept is not None:
+        slope, intercept = values
+        return Line._from_integers(-slope, w, -intercept)
+    return None
 
 
 class Segment:
     # Represents a line segment between two points.
+    DERIVED = ('length', 'middle', 'line', 'perpendicularBisector')
+
     def __init__(self, point1: Point, point2: Point):
         """
         Initializes the Segment object with two endpoints.
 
+        If one of the endpoints is numeric, both are converted to the numeric backend.
+
         Args:
             point1 (Point): The first endpoint of the segment.
             point2 (Point): The second endpoint of the segment.
         """
+        if _is_numeric(point1, point2):
+            point1, point2 = point1.to_numeric(), point2.to_numeric()
+
         self.point1 = point1
         self.point2 = point2
+        self.backend = point1.backend
+
+    def __reduce__(self) -> tuple:
+        # Pickled as its endpoints, without the cached derived properties
+        return _restore_segment, (self.point1, self.point2)
+
+    # The derived properties are computed on first access and then cached
+
+    @cached_property
+    def length(self) -> sp.Expr | float:
+        """
+        The length of the segment.
+        """
+        return self.point1.distancePoint(self.point2)
+
+    @cached_property
+    def middle(self) -> Point:
+        """
+        The midpoint of the segment.
+        """
+        return Point((self.point1.x + self.point2.x) / 2,
+                     (self.point1.y + self.point2.y) / 2, backend=self.backend)
+
+    @cached_property
+    def line(self) -> Line:
+        """
+        The line containing the segment.
+        """
+        return Line.findLine(self.point1, self.point2, backend=self.backend)
+
+    @cached_property
+    def perpendicularBisector(self) -> Line:
+        """
+        The perpendicular bisector of the segment.
+        """
+        return self.line.findPerpendicular(self.middle)
+
+    def precompute(self, *attributes: str) -> 'Segment':
+        """
+        Compute the derived properties of the segment now instead of on first access.
+
+        Args:
+            *attributes (str): The properties to compute, all of them if none is given.
+
+        Returns:
+            Segment: The segment itself.
+
+        Raises:
+            ValueError: If an attribute is not a derived property.
+        """
+        for attribute in attributes or Segment.DERIVED:
+            if attribute not in Segment.DERIVED:
+                raise ValueError(
+                    f"attribute must be one of {', '.join(Segment.DERIVED)}")
+            getattr(self, attribute)
+        return self
+
+    @staticmethod
+    def precompute_all(segments: Iterable['Segment'], *attributes: str) -> list['Segment']:
+        """
+        Compute the derived properties of many segments at once.
+
+        Args:
+            segments (Iterable[Segment]): The segments.
+            *attributes (str): The properties to compute, all of them if none is given.
+
+        Returns:
+            list[Segment]: The segments.
+
+        Raises:
+            ValueError: If an attribute is not a derived property.
+        """
+        return [segment.precompute(*attributes) for segment in segments]
+
+    def to_numeric(self) -> 'Segment':
+        """
+        Convert the segment to the numeric backend.
+
+        Returns:
+            Segment: The segment with numeric endpoints (itself if it is already numeric).
+        """
+        if self.backend == NUMERIC:
+            return self
+        return Segment(self.point1.to_numeric(), self.point2.to_numeric())
+
+    def to_exact(self) -> 'Segment':
+        """
+        Convert the segment to the SymPy backend.
+
+        Returns:
+            Segment: The segment with exact endpoints (itself if it is already exact).
+        """
+        if self.backend == SYMPY:
+            return self
+        return Segment(self.point1.to_exact(), self.point2.to_exact())
+
+
+class Circle():
+    # Represents a circle in 2D space, defined by its center and radius.
+    def __init__(self, center: Point, radius: int | float | str | sp.Expr, backend: str | None = None):
+        """
+        Initializes the Circle object with its center and radius.
+
+        Args:
+            center (Point): The center of the circle.
+            radius (int | float | str | sp.Expr): The radius of the circle.
+            backend (str | None): SYMPY or NUMERIC. If None, the circle is numeric when
+                the center is numeric, otherwise the current default backend is used.
+
+        Raises:
+            ValueError: If the radius is negative.
+        """
+        if backend is None and center.backend == NUMERIC:
+            backend = NUMERIC
+        self.backend = resolve_backend(backend)
+
+        if self.backend == NUMERIC:
+            self.center = center.to_numeric()
+            self.radius = float_value(radius, 'radius')
+            negative = self.radius < 0
+        else:
+            self.center = center.to_exact()
+            self.radius = sympy_value(radius, 'radius')
+            negative = self.radius.is_negative
+
+        if negative:
+            raise ValueError("radius must be non-negative")
+
+        self._equation = None
+
+    def __reduce__(self) -> tuple:
+        return _restore_circle, (self.center, _pack(self.radius), self.backend)
+
+    @property
+    def equation(self) -> sp.Equality:
+        """
+        The equation of the circle, (x - h)**2 + (y - k)**2 = r**2.
+        """
+        if self._equation is None:
+            self._equation = sp.Eq((_X - self.center.x)**2 + (_Y - self.center.y)**2,
+                                   self.radius**2, evaluate=False)
+        return self._equation
+
+    def __str__(self) -> str:
+        """
+        Returns the equation of the circle as a string.
+
+        Returns:
+            str: The circle equation in string format.
+        """
+        return f'{self.equation.lhs} = {self.equation.rhs}'
+
+    def to_numeric(self) -> 'Circle':
+        """
+        Convert the circle to the numeric backend.
+
+        Returns:
+            Circle: The circle with float center and radius (itself if it is already numeric).
+        """
+        return self if self.backend == NUMERIC else Circle(self.center, self.radius, backend=NUMERIC)
+
+    def to_exact(self) -> 'Circle':
+        """
+        Convert the circle to the SymPy backend.
+
+        Returns:
+            Circle: The circle with exact center and radius (itself if it is already exact).
+        """
+        return self if self.backend == SYMPY else Circle(self.center, self.radius, backend=SYMPY)
+
+    @api_call('Circle.intersection')
+    def intersection(self, element: Line | 'Circle') -> tuple[Point, ...] | 'Circle':
+        """
+        Calculate the intersection points with a line or another circle.
+
+        The points are computed in closed form: the foot of the perpendicular from
+        the center is moved by half the chord along the direction (-b, a) of the line.
+        Two circles are intersected through their radical line.
+
+        Args:
+            element (Line | Circle): The line or the other circle.
+
+        Returns:
+            tuple[Point, ...] | Circle: The intersection points (none, one if tangent, or two),
+            or the circle itself if the circles are coincident.
+
+        Raises:
+            ValueError: If the element is not a Line or a Circle.
+        """
+        if isinstance(element, Line):
+            return self._intersection_line(element)
+        elif isinstance(element, Circle):
+            return self._intersection_circle(element)
+        raise ValueError("element must be a Line or a Circle")
+
+    def _intersection_line(self, line: Line) -> tuple[Point, ...]:
+        if _is_numeric(self, line):
+            a, b, c = line._unit_coefficients()
+            h, k, r = float(self.center.x), float(self.center.y), float(self.radius)
+
+            offset = a * h + b * k + c
+            foot_x, foot_y = h - offset * a, k - offset * b
+            squared = r**2 - offset**2
+
+            if abs(squared) <= get_tolerance():
+                return Point(foot_x, foot_y, backend=NUMERIC),
+            elif squared < 0:
+                return ()
+
+            step = math.sqrt(squared)
+            return (Point(foot_x - step * b, foot_y + step * a, backend=NUMERIC),
+                    Point(foot_x + step * b, foot_y - step * a, backend=NUMERIC))
+
+        a, b, c = line.a, line.b, line.c
+        h, k, r = self.center.x, self.center.y, self.radius
+
+        # Foot of the perpendicular from the center, and half the chord times |(a, b)|^2
+        norm = a**2 + b**2
+        offset = a * h + b * k + c
+        foot_x, foot_y = h - offset * a / norm, k - offset * b / norm
+        squared = r**2 * norm - offset**2
+
+        # With rational data the coordinates are already in canonical form
+        tidy = _tidy if not all(value.is_Rational for value in (a, b, c, h, k, r)) else (lambda value: value)
+
+        if _is_zero(squared):
+            return Point(tidy(foot_x), tidy(foot_y), backend=SYMPY),
+        elif squared.is_negative:
+            return ()
+
+        step = sp.sqrt(squared) / norm
+        return (Point(tidy(foot_x - step * b), tidy(foot_y + step * a), backend=SYMPY),
+                Point(tidy(foot_x + step * b), tidy(foot_y - step * a), backend=SYMPY))
+
+    def _intersection_circle(self, circle: 'Circle') -> tuple[Point, ...] | 'Circle':
+        numeric = _is_numeric(self, circle)
+        first, second = (self.to_numeric(), circle.to_numeric()) if numeric else (self, circle)
+        h1, k1, r1 = first.center.x, first.center.y, first.radius
+        h2, k2, r2 = second.center.x, second.center.y, second.radius
+
+        # Subtracting the two equations leaves the radical line ax + by + c = 0
+        a, b = 2 * (h2 - h1), 2 * (k2 - k1)
+        c = h1**2 + k1**2 - r1**2 - h2**2 - k2**2 + r2**2
+
+        if numeric:
+            tolerance = get_tolerance()
+            concentric = math.hypot(a, b) <= tolerance
+            coincident = concentric and abs(r1 - r2) <= tolerance
+        else:
+            concentric = _is_zero(a) and _is_zero(b)
+            coincident = concentric and _is_zero(r1 - r2)
+
+        if coincident:
+            return self
+        elif concentric:
+            return ()
+        return first._intersection_line(
+            Line.from_coefficients(a, b, c, backend=NUMERIC if numeric else SYMPY))
+
+    @api_call('Circle.tangents')
+    def tangents(self, point: Point) -> tuple[Line, ...]:
+        """
+        Find the lines through a point that are tangent to the circle.
+
+        Args:
+            point (Point): The point the tangents pass through.
+
+        Returns:
+            tuple[Line, ...]: Two lines if the point is outside the circle, one if it lies on it,
+            none if it is inside.
+        """
+        numeric = _is_numeric(self, point)
+        backend = NUMERIC if numeric else SYMPY
+
+        if numeric:
+            h, k, r = float(self.center.x), float(self.center.y), float(self.radius)
+            px, py = float(point.x), float(point.y)
+        else:
+            h, k, r = self.center.x, self.center.y, self.radius
+            px, py = point.x, point.y
+
+        dx, dy = px - h, py - k
+        squared = dx**2 + dy**2
+        difference = squared - r**2
+
+        if abs(difference) <= get_tolerance() if numeric else _is_zero(difference):
+            # The point is on the circle: the tangent is perpendicular to the radius
+            return Line.from_coefficients(dx, dy, -(dx * px + dy * py), backend=backend),
+        elif difference < 0 if numeric else difference.is_negative:
+            return ()
+
+        root = r * (math.sqrt(difference) if numeric else sp.sqrt(difference))
+        tangents = []
+        for sign in (1, -1):
+            # (u, v) is the radius to the tangent point, scaled by |point - center|^2
+            u = r**2 * dx - sign * root * dy
+            v = r**2 * dy + sign * root * dx
+            tangents.append(Line.from_coefficients(
+                u, v, -(u * h + v * k + r**2 * squared), backend=backend))
+        return tuple(tangents)
+
+
+# Module constants, built on first access by __getattr__ rather than at import time
+_CONSTANTS = {
+    'ORIGIN': lambda: Point(sp.Integer(0), sp.Integer(0), backend=SYMPY),
+    'X_AXIS': lambda: Line.from_coefficients(0, 1, 0, backend=SYMPY),
+    'Y_AXIS': lambda: Line.from_coefficients(1, 0, 0, backend=SYMPY),
+    'BISECTOR_1_3': lambda: Line.from_coefficients(-1, 1, 0, backend=SYMPY),
+    'BISECTOR_2_4': lambda: Line.from_coefficients(1, 1, 0, backend=SYMPY),
+}
+_constants_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    if name not in _CONSTANTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _constants_lock:
+        # Another thread may have built the constant while this one was waiting
+        if name not in globals():
+            globals()[name] = _CONSTANTS[name]()
+        return globals()[name]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_CONSTANTS))
+
 
-        # Calculate segment properties
-        self.length = self.point1.distancePoint(self.point2)
-        self.middle = Point((self.point1.x + self.point2.x) / 2,
-                            (self.point1.y + self.point2.y) / 2)
-        self.line = Line.findLine(self.point1, self.point2)
-        self.perpendicularBisector = self.line.findPerpendicular(self.middle)
+__all__ = ['Point', 'Line', 'Segment', 'Circle'] + list(_CONSTANTS)
@@ -3,7 +3,56 @@ __file__ = 'equations.py'
 
 import sympy as sp
 
+from .cache import CacheInfo, LRUCache
+from .profiling import api_call, sympy_operation
 
+# Parsed expressions and equations, keyed on their normalized input string.
+# SymPy objects are immutable, so cached results can be shared freely.
+PARSE_CACHE = LRUCache(maxsize=4096)
+
+# SymPy functions timed by the profiler
+_parse_expr = sympy_operation('parse_expr', sp.parse_expr)
+_solveset = sympy_operation('solveset', sp.solveset)
+_solve = sympy_operation('solve', sp.solve)
+
+
+def _normalize(text: str) -> str:
+    # Collapse runs of whitespace, which never change the parsed result
+    return ' '.join(text.split())
+
+
+def parse_cache_info() -> CacheInfo:
+    """
+    Return the statistics of the parse cache used by expression(), equation() and read().
+
+    Returns:
+        CacheInfo: The hits, misses, maximum size and current size of the cache.
+    """
+    return PARSE_CACHE.info()
+
+
+def clear_parse_cache():
+    """
+    Remove every entry of the parse cache and reset its statistics.
+    """
+    PARSE_CACHE.clear()
+
+
+def configure_parse_cache(maxsize: int | None = None, enabled: bool | None = None):
+    """
+    Change the size limit of the parse cache or enable/disable it.
+
+    Args:
+        maxsize (int | None): The maximum number of cached inputs.
+        enabled (bool | None): Whether parsed inputs are cached.
+
+    Raises:
+        ValueError: If maxsize is negative.
+    """
+    PARSE_CACHE.configure(maxsize, enabled)
+
+
+@api_call('expression')
 def expression(expression: str) -> sp.Expr:
     """
     Parses a mathematical expression into a SymPy expression object.
@@ -14,7 +63,12 @@ def expression(expression: str) -> sp.Expr:
     Returns:
         sp.Expr: A SymPy expression object representing the parsed expression.
     """
-    return sp.parse_expr(expression, transformations='all')
+    key = ('expression', _normalize(expression))
+    value = PARSE_CACHE.get(key)
+    if value is None:
+        value = _parse_expr(key[1], transformations='all')
+        PARSE_CACHE.put(key, value)
+    return value
 
 
 def sympy_value(value, name: str = 'value') -> sp.Expr:
@@ -46,6 +100,37 @@ def sympy_value(value, name: str = 'value') -> sp.Expr:
     return value
 
 
+def float_value(value, name: str = 'value') -> float:
+    """
+    Convert a value into a machine float.
+
+    Args:
+        value (int | float | str | sp.Expr): The value to convert.
+        name (str): A name used in error messages.
+
+    Returns:
+        float: The converted value.
+
+    Raises:
+        ValueError: If the input value is of an unsupported type or is not numeric.
+    """
+    if isinstance(value, float):
+        return value
+    elif isinstance(value, (int, sp.Expr)):
+        pass
+    elif isinstance(value, str):
+        value = expression(value)
+    else:
+        raise ValueError(
+            f"{name} must be an integer, float, Rational, Expr or str")
+
+    try:
+        return float(value)
+    except TypeError:
+        raise ValueError(f"{name} must be numeric, got {value}") from None
+
+
+@api_call('equation')
 def equation(equation: str) -> sp.Equality:
     """
     Parses an equation into a SymPy equality object.
@@ -56,10 +141,16 @@ def equation(equation: str) -> sp.Equality:
     Returns:
         sp.Equality: A SymPy equality object representing the parsed equation.
     """
-    lhs, rhs = equation.split("=")
-    return sp.Eq(expression(lhs), expression(rhs))
+    key = ('equation', _normalize(equation))
+    value = PARSE_CACHE.get(key)
+    if value is None:
+        lhs, rhs = key[1].split("=")
+        value = sp.Eq(expression(lhs), expression(rhs))
+        PARSE_CACHE.put(key, value)
+    return value
 
 
+@api_call('read')
 def read(input: str) -> sp.Expr | sp.Equality:
     """
     Reads a mathematical input and determines if it's an expression or an equation.
@@ -76,40 +167,62 @@ def read(input: str) -> sp.Expr | sp.Equality:
         return expression(input)
 
 
-def solve_equation(_equation: str, variable: str = 'x') -> tuple[sp.Expr] | None:
+@api_call('solve_equation')
+def solve_equation(_equation: str, variable: str = 'x', timeout: float | None = None) -> tuple[sp.Expr] | None:
     """
     Solves a symbolic equation for a given variable.
 
     Args:
         _equation (str): The equation in string format.
         variable (str): The variable to solve for.
+        timeout (float | None): If given, the equation is solved in a worker process
+            that is killed after this many seconds.
 
     Returns:
         tuple[sp.Expr] | None: A list of solutions as SymPy expressions.
         Return None if no real solutions exist or the equation is complex-valued.
+
+    Raises:
+        SolveTimeout: If solving takes longer than timeout.
     """
+    if timeout is not None:
+        from .workers import run
+        return run(solve_equation, _equation, variable, timeout=timeout)
+
     symbol = sp.symbols(variable[0])
-    solutions = tuple(sp.solveset(equation(_equation), symbol))
+    solutions = tuple(_solveset(equation(_equation), symbol))
+    if not solutions:
+        return None
     return solutions if sp.im(solutions[0]) == 0 else None
 
 
-def solve_system(equations: list[str], variables: list[str]) -> tuple[tuple[sp.Expr]] | None:
+@api_call('solve_system')
+def solve_system(equations: list[str], variables: list[str], timeout: float | None = None) -> tuple[tuple[sp.Expr]] | None:
     """
     Solves a system of symbolic equations for multiple variables.
 
     Args:
         equations (str): A list of equations in string format.
         variables (str): A list of variables to solve for.
+        timeout (float | None): If given, the system is solved in a worker process
+            that is killed after this many seconds.
 
     Returns:
         tuple[tuple[sp.Expr]] | None: A tuple of solution tuples, where each inner tuple represents the solution values for the variables. 
         Returns None if no real solutions exist.
+
+    Raises:
+        SolveTimeout: If solving takes longer than timeout.
     """
+    if timeout is not None:
+        from .workers import run
+        return run(solve_system, equations, variables, timeout=timeout)
+
     symbols = sp.symbols(variables)
 
     parsed_equations = [equation(eq) for eq in equations]
 
-    solutions = sp.solve(parsed_equations, symbols, dict=True)
+    solutions = _solve(parsed_equations, symbols, dict=True)
 
     real_solutions = []
     for sol in solutions:
@@ -0,0 +1,795 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'index.py'
+
+import heapq
+import math
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Iterator
+
+from .backend import get_tolerance
+from .elements import Point, Line, Segment
+from .equations import float_value
+
+
+def _coordinates(point: Point) -> tuple[float, float]:
+    return float_value(point.x, 'x'), float_value(point.y, 'y')
+
+
+def _slack(*values: float) -> float:
+    # Float tolerance used to select candidates, before the exact check
+    return get_tolerance() * (1 + max(map(abs, values), default=0))
+
+
+def _segment_distance(x: float, y: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    # Distance from (x, y) to the closed segment (x1, y1) - (x2, y2)
+    dx, dy = x2 - x1, y2 - y1
+    length = dx * dx + dy * dy
+    if length == 0:
+        return math.hypot(x - x1, y - y1)
+    t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length))
+    return math.hypot(x - x1 - t * dx, y - y1 - t * dy)
+
+
+def _segment_in_box(x1: float, y1: float, x2: float, y2: float,
+                    xmin: float, ymin: float, xmax: float, ymax: float) -> bool:
+    # Liang-Barsky clipping: the segment has a point inside the closed box
+    t0, t1 = 0.0, 1.0
+    dx, dy = x2 - x1, y2 - y1
+    for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+        if p == 0:
+            if q < 0:
+                return False
+        else:
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+            if t0 > t1:
+                return False
+    return True
+
+
+# Weight balance of the KD-tree: a subtree is rebuilt when one of its children holds
+# more than this fraction of its nodes, which keeps the depth below log(n) / log(1 / _ALPHA)
+_ALPHA = 2 / 3
+
+
+class _Node():
+    # A node of the KD-tree, splitting on x at even depths and on y at odd depths
+    __slots__ = ('x', 'y', 'point', 'left', 'right', 'deleted', 'size')
+
+    def __init__(self, x: float, y: float, point: Point):
+        self.x, self.y, self.point = x, y, point
+        self.left = self.right = None
+        self.deleted = False
+        # Number of nodes of the subtree, deleted ones included
+        self.size = 1
+
+
+def _subtree(node: _Node | None) -> list[_Node]:
+    # The nodes of a subtree, without recursion
+    nodes = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is not None:
+            nodes.append(node)
+            stack.append(node.left)
+            stack.append(node.right)
+    return nodes
+
+
+def _build(nodes: list[_Node], depth: int) -> _Node | None:
+    # A balanced tree, whose depth is logarithmic so that the recursion is bounded
+    if not nodes:
+        return None
+    nodes.sort(key=(lambda node: node.x) if depth % 2 == 0 else (lambda node: node.y))
+    middle = len(nodes) // 2
+    node = nodes[middle]
+    node.left = _build(nodes[:middle], depth + 1)
+    node.right = _build(nodes[middle + 1:], depth + 1)
+    node.size = len(nodes)
+    return node
+
+
+class PointIndex():
+    # A KD-tree over points, for nearest-neighbour, radius, box and incidence queries.
+    def __init__(self, points: Iterable[Point] = ()):
+        """
+        Initializes the index, building a balanced tree from the given points.
+
+        Args:
+            points (Iterable[Point]): The points to index, with numeric coordinates.
+
+        Raises:
+            ValueError: If a point has symbolic coordinates.
+        """
+        self._nodes = {}
+        self._root = None
+        self._deleted = 0
+        self._rebuild([_Node(*_coordinates(point), point) for point in points])
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[Point]:
+        return (node.point for node in self._nodes.values())
+
+    def __contains__(self, point: Point) -> bool:
+        return id(point) in self._nodes
+
+    def _rebuild(self, nodes: list[_Node]):
+        for node in nodes:
+            node.deleted = False
+        self._nodes = {id(node.point): node for node in nodes}
+        self._root = _build(list(self._nodes.values()), 0)
+        self._deleted = 0
+
+    def _rebalance(self, path: list[_Node]):
+        # The new node at the end of path is too deep: rebuild the lowest ancestor
+        # whose children are out of balance, dropping its deleted nodes
+        child = path[-1]
+        for depth in range(len(path) - 2, -1, -1):
+            node = path[depth]
+            if child.size > _ALPHA * node.size:
+                break
+            child = node
+        else:
+            depth = 0
+
+        nodes = _subtree(path[depth])
+        kept = [node for node in nodes if not node.deleted]
+        dropped = len(nodes) - len(kept)
+        self._deleted -= dropped
+        for ancestor in path[:depth]:
+            ancestor.size -= dropped
+
+        root = _build(kept, depth)
+        if depth == 0:
+            self._root = root
+        elif path[depth - 1].left is path[depth]:
+            path[depth - 1].left = root
+        else:
+            path[depth - 1].right = root
+
+    def insert(self, point: Point):
+        """
+        Add a point to the index.
+
+        When the new node is deeper than log(n) / log(1 / _ALPHA), the subtree
+        that is out of balance is rebuilt (as in a scapegoat tree).
+
+        Args:
+            point (Point): The point, with numeric coordinates.
+
+        Raises:
+            ValueError: If the point has symbolic coordinates or is already indexed.
+        """
+        if id(point) in self._nodes:
+            raise ValueError("point is already in the index")
+
+        node = _Node(*_coordinates(point), point)
+        self._nodes[id(point)] = node
+
+        parent = self._root
+        if parent is None:
+            self._root = node
+            return
+        path = []
+        while True:
+            path.append(parent)
+            parent.size += 1
+            go_left = node.x < parent.x if len(path) % 2 == 1 else node.y < parent.y
+            child = parent.left if go_left else parent.right
+            if child is None:
+                if go_left:
+                    parent.left = node
+                else:
+                    parent.right = node
+                break
+            parent = child
+
+        path.append(node)
+        if len(path) - 1 > math.log(self._root.size, 1 / _ALPHA):
+            self._rebalance(path)
+
+    def remove(self, point: Point):
+        """
+        Remove a point from the index.
+
+        The node is only marked as deleted; the tree is rebuilt when half of its nodes are.
+
+        Args:
+            point (Point): The point, as it was inserted.
+
+        Raises:
+            KeyError: If the point is not in the index.
+        """
+        node = self._nodes.pop(id(point))
+        node.deleted = True
+        self._deleted += 1
+        if self._deleted > len(self._nodes):
+            self._rebuild(list(self._nodes.values()))
+
+    def nearest(self, point: Point, k: int = 1) -> list[Point]:
+        """
+        Find the k indexed points closest to a point.
+
+        Args:
+            point (Point): The query point.
+            k (int): The number of points to return.
+
+        Returns:
+            list[Point]: Up to k points, from the closest to the farthest.
+        """
+        x, y = _coordinates(point)
+        # Max-heap of the best candidates, as (-distance, counter, node)
+        best = []
+        counter = 0
+
+        # Subtrees to visit, with a lower bound of the distance of their points
+        stack = [(self._root, 0, 0.0)] if k > 0 else []
+        while stack:
+            node, depth, bound = stack.pop()
+            if node is None or (len(best) == k and bound >= -best[0][0]):
+                continue
+            if not node.deleted:
+                distance = math.hypot(node.x - x, node.y - y)
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, counter, node))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, counter, node))
+                counter += 1
+
+            difference = x - node.x if depth % 2 == 0 else y - node.y
+            near, far = (node.left, node.right) if difference < 0 else (node.right, node.left)
+            # The near side is visited first
+            stack.append((far, depth + 1, max(bound, abs(difference))))
+            stack.append((near, depth + 1, bound))
+        return [node.point for _, _, node in sorted(best, key=lambda item: (-item[0], item[1]))]
+
+    def within_box(self, xmin: float, ymin: float, xmax: float, ymax: float) -> list[Point]:
+        """
+        Find the indexed points inside a closed axis-aligned box.
+
+        Args:
+            xmin (float): The left side of the box.
+            ymin (float): The bottom side of the box.
+            xmax (float): The right side of the box.
+            ymax (float): The top side of the box.
+
+        Returns:
+            list[Point]: The points inside the box.
+        """
+        found = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                continue
+            if not node.deleted and xmin <= node.x <= xmax and ymin <= node.y <= ymax:
+                found.append(node.point)
+            value, low, high = (node.x, xmin, xmax) if depth % 2 == 0 else (node.y, ymin, ymax)
+            if low <= value:
+                stack.append((node.left, depth + 1))
+            if value <= high:
+                stack.append((node.right, depth + 1))
+        return found
+
+    def within_radius(self, point: Point, radius: float) -> list[Point]:
+        """
+        Find the indexed points within a given distance of a point.
+
+        Args:
+            point (Point): The query point.
+            radius (float): The maximum distance.
+
+        Returns:
+            list[Point]: The points at distance at most radius.
+        """
+        x, y = _coordinates(point)
+        radius = float(radius)
+        return [found for found in self.within_box(x - radius, y - radius, x + radius, y + radius)
+                if math.hypot(self._nodes[id(found)].x - x, self._nodes[id(found)].y - y) <= radius]
+
+    def locate(self, point: Point) -> list[Point]:
+        """
+        Find the indexed points that coincide with a point.
+
+        The candidates are selected with a float tolerance and then checked
+        with Point.ison, exactly for SymPy points.
+
+        Args:
+            point (Point): The query point.
+
+        Returns:
+            list[Point]: The indexed points equal to the query point.
+        """
+        x, y = _coordinates(point)
+        slack = _slack(x, y)
+        return [found for found in self.within_box(x - slack, y - slack, x + slack, y + slack)
+                if point.ison(found)]
+
+
+class SegmentIndex():
+    # A uniform grid where every segment is registered in the cells it crosses.
+    def __init__(self, segments: Iterable[Segment] = (), cell_size: float | None = None):
+        """
+        Initializes the index.
+
+        Args:
+            segments (Iterable[Segment]): The segments to index, with numeric endpoints.
+            cell_size (float | None): The side of the grid cells. If None, the mean
+                bounding box side of the initial segments is used (1 if there are none).
+
+        Raises:
+            ValueError: If a segment has symbolic endpoints or cell_size is not positive.
+        """
+        segments = list(segments)
+        entries = [(segment, *_coordinates(segment.point1), *_coordinates(segment.point2))
+                   for segment in segments]
+
+        if cell_size is None:
+            sides = [max(abs(x2 - x1), abs(y2 - y1)) for _, x1, y1, x2, y2 in entries]
+            cell_size = sum(sides) / len(sides) if sides else 0.0
+            cell_size = cell_size if cell_size > 0 else 1.0
+        cell_size = float(cell_size)
+        if not cell_size > 0:
+            raise ValueError("cell_size must be a positive number")
+
+        self.cell_size = cell_size
+        self._segments = {}
+        self._cells = {}
+        # The grid and coarser ones, level l with cells of side cell_size * 2**l, up to
+        # a level with at most 4 occupied cells. The nearest search descends them from
+        # the closest cells, skipping the empty space and the segments already seen.
+        self._levels = [self._cells]
+
+        for entry in entries:
+            self._insert(*entry)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __iter__(self) -> Iterator[Segment]:
+        return (entry[0] for entry in self._segments.values())
+
+    def __contains__(self, segment: Segment) -> bool:
+        return id(segment) in self._segments
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _cell_range(self, xmin: float, ymin: float, xmax: float, ymax: float) -> Iterator[tuple[int, int]]:
+        i1, j1 = self._cell(xmin, ymin)
+        i2, j2 = self._cell(xmax, ymax)
+        for i in range(i1, i2 + 1):
+            for j in range(j1, j2 + 1):
+                yield i, j
+
+    def _segment_cells(self, x1: float, y1: float, x2: float, y2: float) -> Iterator[tuple[int, int]]:
+        # Cells crossed by the segment, column by column: their number grows with its
+        # length, not with the area of its bounding box
+        if x1 > x2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        size = self.cell_size
+        i1, i2 = math.floor(x1 / size), math.floor(x2 / size)
+        slope = (y2 - y1) / (x2 - x1) if i1 != i2 else 0.0
+        # Widens the part of every column, so that rounding never skips a cell near a corner
+        pad = 1e-9 * size
+        for i in range(i1, i2 + 1):
+            if i1 == i2:
+                ya, yb = y1, y2
+            else:
+                ya = y1 + (max(x1, i * size) - x1) * slope
+                yb = y1 + (min(x2, (i + 1) * size) - x1) * slope
+            for j in range(math.floor((min(ya, yb) - pad) / size), math.floor((max(ya, yb) + pad) / size) + 1):
+                yield i, j
+
+    def _register(self, entry: tuple, add: bool):
+        # Add or remove a segment in the cells it crosses, at every level
+        key = id(entry[0])
+        cells = set(self._segment_cells(*entry[1:]))
+        for level, grid in enumerate(self._levels):
+            if level:
+                cells = {(i >> 1, j >> 1) for i, j in cells}
+            for cell in cells:
+                if add:
+                    grid.setdefault(cell, {})[key] = entry
+                else:
+                    entries = grid[cell]
+                    del entries[key]
+                    if not entries:
+                        del grid[cell]
+
+        while len(self._levels[-1]) > 4:
+            grid = {}
+            for (i, j), entries in self._levels[-1].items():
+                grid.setdefault((i >> 1, j >> 1), {}).update(entries)
+            self._levels.append(grid)
+
+    def _cell_distance(self, x: float, y: float, level: int, i: int, j: int) -> float:
+        # Distance from (x, y) to the closed cell (i, j) of a level
+        side = self.cell_size * (1 << level)
+        dx = max(i * side - x, 0.0, x - (i + 1) * side)
+        dy = max(j * side - y, 0.0, y - (j + 1) * side)
+        return math.hypot(dx, dy)
+
+    def _insert(self, segment: Segment, x1: float, y1: float, x2: float, y2: float):
+        if id(segment) in self._segments:
+            raise ValueError("segment is already in the index")
+        entry = (segment, x1, y1, x2, y2)
+        self._segments[id(segment)] = entry
+        self._register(entry, True)
+
+    def insert(self, segment: Segment):
+        """
+        Add a segment to the index.
+
+        Args:
+            segment (Segment): The segment, with numeric endpoints.
+
+        Raises:
+            ValueError: If the segment has symbolic endpoints or is already indexed.
+        """
+        self._insert(segment, *_coordinates(segment.point1), *_coordinates(segment.point2))
+
+    def remove(self, segment: Segment):
+        """
+        Remove a segment from the index.
+
+        Args:
+            segment (Segment): The segment, as it was inserted.
+
+        Raises:
+            KeyError: If the segment is not in the index.
+        """
+        self._register(self._segments.pop(id(segment)), False)
+
+    def _candidates(self, xmin: float, ymin: float, xmax: float, ymax: float) -> list[tuple]:
+        # Entries of the segments sharing a cell with the box, without duplicates
+        found = {}
+        (i1, j1), (i2, j2) = self._cell(xmin, ymin), self._cell(xmax, ymax)
+        if (i2 - i1 + 1) * (j2 - j1 + 1) > len(self._cells):
+            # A box larger than the occupied cells
+            for (i, j), entries in self._cells.items():
+                if i1 <= i <= i2 and j1 <= j <= j2:
+                    found.update(entries)
+            return list(found.values())
+
+        for cell in self._cell_range(xmin, ymin, xmax, ymax):
+            entries = self._cells.get(cell)
+            if entries:
+                found.update(entries)
+        return list(found.values())
+
+    def within_box(self, xmin: float, ymin: float, xmax: float, ymax: float) -> list[Segment]:
+        """
+        Find the indexed segments that have a point inside a closed axis-aligned box.
+
+        Args:
+            xmin (float): The left side of the box.
+            ymin (float): The bottom side of the box.
+            xmax (float): The right side of the box.
+            ymax (float): The top side of the box.
+
+        Returns:
+            list[Segment]: The segments crossing or touching the box.
+        """
+        return [entry[0] for entry in self._candidates(xmin, ymin, xmax, ymax)
+                if _segment_in_box(*entry[1:], xmin, ymin, xmax, ymax)]
+
+    def within_radius(self, point: Point, radius: float) -> list[Segment]:
+        """
+        Find the indexed segments within a given distance of a point.
+
+        Args:
+            point (Point): The query point.
+            radius (float): The maximum distance.
+
+        Returns:
+            list[Segment]: The segments at distance at most radius.
+        """
+        x, y = _coordinates(point)
+        radius = float(radius)
+        return [entry[0] for entry in self._candidates(x - radius, y - radius, x + radius, y + radius)
+                if _segment_distance(x, y, *entry[1:]) <= radius]
+
+    def nearest(self, point: Point, k: int = 1) -> list[Segment]:
+        """
+        Find the k indexed segments closest to a point.
+
+        The occupied cells are visited from the closest, descending from coarse
+        cells to fine ones, until the remaining cells are farther than the k-th
+        closest segment found.
+
+        Args:
+            point (Point): The query point.
+            k (int): The number of segments to return.
+
+        Returns:
+            list[Segment]: Up to k segments, from the closest to the farthest.
+        """
+        if k <= 0 or not self._segments:
+            return []
+
+        x, y = _coordinates(point)
+        top = len(self._levels) - 1
+        heap = [(self._cell_distance(x, y, top, i, j), top, i, j) for i, j in self._levels[top]]
+        heapq.heapify(heap)
+
+        # The k closest segments found, as a max-heap of (-distance, key, segment)
+        best = []
+        seen = set()
+        while heap:
+            bound, level, i, j = heapq.heappop(heap)
+            if len(best) == k and bound >= -best[0][0]:
+                break
+            entries = self._levels[level][i, j]
+            if level and len(entries) > 1:
+                # Descend only into the parts that hold segments not seen yet
+                if any(key not in seen for key in entries):
+                    grid = self._levels[level - 1]
+                    for ci in (2 * i, 2 * i + 1):
+                        for cj in (2 * j, 2 * j + 1):
+                            if (ci, cj) in grid:
+                                heapq.heappush(heap, (self._cell_distance(x, y, level - 1, ci, cj), level - 1, ci, cj))
+                continue
+
+            for key, entry in entries.items():
+                if key in seen:
+                    continue
+                seen.add(key)
+                item = (-_segment_distance(x, y, *entry[1:]), key, entry[0])
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                elif item[0] > best[0][0]:
+                    heapq.heapreplace(best, item)
+
+        return [segment for _, _, segment in sorted(best, reverse=True)]
+
+    def locate(self, point: Point) -> list[Segment]:
+        """
+        Find the indexed segments a point lies on.
+
+        The candidates are selected with a float tolerance and then checked
+        with Point.ison, exactly for SymPy segments.
+
+        Args:
+            point (Point): The query point.
+
+        Returns:
+            list[Segment]: The segments containing the point.
+        """
+        x, y = _coordinates(point)
+        slack = _slack(x, y)
+        return [entry[0] for entry in self._candidates(x - slack, y - slack, x + slack, y + slack)
+                if _segment_distance(x, y, *entry[1:]) <= slack and point.ison(entry[0])]
+
+
+class _Bucket():
+    # Lines whose normal angle falls in a range, sorted by offset
+    __slots__ = ('items', 'low', 'high')
+
+    def __init__(self, angle: float):
+        # Sorted list of (c, insertion counter, id(line))
+        self.items = []
+        # Range of the angles of the lines, which only widens until the bucket is empty
+        self.low = self.high = angle
+
+
+def _projection_range(x: float, y: float, low: float, high: float) -> tuple[float, float]:
+    # Range of x*cos(t) + y*sin(t) for t in [low, high], a range narrower than pi
+    values = [x * math.cos(low) + y * math.sin(low), x * math.cos(high) + y * math.sin(high)]
+    # Its extremes +-r, at the angles phi + m*pi inside the range
+    r, phi = math.hypot(x, y), math.atan2(y, x)
+    for m in range(math.ceil((low - phi) / math.pi), math.floor((high - phi) / math.pi) + 1):
+        values.append(r if m % 2 == 0 else -r)
+    return min(values), max(values)
+
+
+class LineIndex():
+    # Lines bucketed by the angle of their normal, each bucket sorted by the offset of the line.
+    def __init__(self, lines: Iterable[Line] = ()):
+        """
+        Initializes the index.
+
+        A line with unit normal (cos t, sin t), t in [0, pi), and offset c is at
+        distance |x*cos(t) + y*sin(t) + c| from a point (x, y). The angles are
+        split in about sqrt(n) buckets: over the angles of a bucket, x*cos(t) + y*sin(t)
+        stays in a range, so the lines close to a point are found with a binary
+        search on the sorted offsets of each bucket.
+
+        Args:
+            lines (Iterable[Line]): The lines to index, with numeric coefficients.
+
+        Raises:
+            ValueError: If a line has symbolic coefficients.
+        """
+        # id(line) -> (line, angle, item, a, b, c), with the normal of angle in [0, pi)
+        self._lines = {}
+        # Bucket number -> _Bucket, for buckets of _width radians
+        self._buckets = {}
+        self._width = math.pi
+        self._built_size = 0
+        self._counter = 0
+        for line in lines:
+            self.insert(line)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __iter__(self) -> Iterator[Line]:
+        return (entry[0] for entry in self._lines.values())
+
+    def __contains__(self, line: Line) -> bool:
+        return id(line) in self._lines
+
+    def _bucket(self, angle: float) -> int:
+        return int(angle / self._width)
+
+    def _add(self, key: int):
+        _, angle, item, *_ = self._lines[key]
+        bucket = self._buckets.get(self._bucket(angle))
+        if bucket is None:
+            bucket = self._buckets[self._bucket(angle)] = _Bucket(angle)
+        bucket.low, bucket.high = min(bucket.low, angle), max(bucket.high, angle)
+        insort(bucket.items, item)
+
+    def insert(self, line: Line):
+        """
+        Add a line to the index.
+
+        The buckets are rebuilt when the index has doubled in size since they were made.
+
+        Args:
+            line (Line): The line, with numeric coefficients.
+
+        Raises:
+            ValueError: If the line has symbolic coefficients or is already indexed.
+        """
+        if id(line) in self._lines:
+            raise ValueError("line is already in the index")
+
+        a, b, c = line._unit_coefficients()
+        if b < 0 or (b == 0 and a < 0):
+            a, b, c = -a, -b, -c
+        angle = math.atan2(b, a) % math.pi
+        item = (c + 0.0, self._counter, id(line))
+        self._counter += 1
+        self._lines[id(line)] = (line, angle, item, a, b, c)
+
+        if len(self._lines) > 2 * max(self._built_size, 8):
+            # About sqrt(n) buckets of sqrt(n) lines
+            self._width = math.pi / math.isqrt(len(self._lines))
+            self._built_size = len(self._lines)
+            self._buckets = {}
+            for key in self._lines:
+                self._add(key)
+        else:
+            self._add(id(line))
+
+    def remove(self, line: Line):
+        """
+        Remove a line from the index.
+
+        Args:
+            line (Line): The line, as it was inserted.
+
+        Raises:
+            KeyError: If the line is not in the index.
+        """
+        _, angle, item, *_ = self._lines.pop(id(line))
+        number = self._bucket(angle)
+        items = self._buckets[number].items
+        del items[bisect_left(items, item)]
+        if not items:
+            del self._buckets[number]
+
+    def _distance(self, key: int, x: float, y: float) -> float:
+        _, _, _, a, b, c = self._lines[key]
+        return abs(a * x + b * y + c)
+
+    def _within(self, x: float, y: float, radius: float) -> list[int]:
+        # Ids of the lines whose offset is within radius of the range of the point, bucket by bucket
+        keys = []
+        for bucket in self._buckets.values():
+            low, high = _projection_range(x, y, bucket.low, bucket.high)
+            start = bisect_left(bucket.items, (-high - radius, -1, 0))
+            stop = bisect_right(bucket.items, (-low + radius, math.inf, 0))
+            keys.extend(item[2] for item in bucket.items[start:stop])
+        return keys
+
+    def within_radius(self, point: Point, radius: float) -> list[Line]:
+        """
+        Find the indexed lines within a given distance of a point.
+
+        Args:
+            point (Point): The query point.
+            radius (float): The maximum distance.
+
+        Returns:
+            list[Line]: The lines at distance at most radius.
+        """
+        x, y = _coordinates(point)
+        radius = float(radius)
+        slack = _slack(radius, x, y)
+        return [self._lines[key][0] for key in self._within(x, y, radius + slack)
+                if self._distance(key, x, y) <= radius]
+
+    def nearest(self, point: Point, k: int = 1) -> list[Line]:
+        """
+        Find the k indexed lines closest to a point.
+
+        Every bucket is scanned from the offsets closest to the point outwards,
+        all buckets together from the lowest bound on the distance, until the
+        bounds exceed the k-th distance found.
+
+        Args:
+            point (Point): The query point.
+            k (int): The number of lines to return.
+
+        Returns:
+            list[Line]: Up to k lines, from the closest to the farthest.
+        """
+        if k <= 0:
+            return []
+
+        x, y = _coordinates(point)
+        slack = _slack(x, y)
+        # (bound, counter, items, position, step, low, high): the next line of a bucket
+        # in one direction, where low and high are the range of the bucket for the point
+        heap = []
+        counter = 0
+        for bucket in self._buckets.values():
+            low, high = _projection_range(x, y, bucket.low, bucket.high)
+            position = bisect_left(bucket.items, (-high, -1, 0))
+            if position > 0:
+                heap.append((-high - bucket.items[position - 1][0] - slack, counter, bucket.items, position - 1, -1, low, high))
+                counter += 1
+            if position < len(bucket.items):
+                heap.append((max(0.0, bucket.items[position][0] + low - slack), counter, bucket.items, position, 1, low, high))
+                counter += 1
+        heapq.heapify(heap)
+
+        # Max-heap of the best lines, as (-distance, key)
+        best = []
+        while heap:
+            bound, _, items, position, step, low, high = heapq.heappop(heap)
+            if len(best) == k and bound >= -best[0][0]:
+                break
+            key = items[position][2]
+            item = (-self._distance(key, x, y), key)
+            if len(best) < k:
+                heapq.heappush(best, item)
+            elif item > best[0]:
+                heapq.heapreplace(best, item)
+
+            position += step
+            if 0 <= position < len(items):
+                c = items[position][0]
+                bound = -high - c - slack if step < 0 else max(0.0, c + low - slack)
+                heapq.heappush(heap, (bound, counter, items, position, step, low, high))
+                counter += 1
+
+        return [self._lines[key][0] for _, key in sorted(best, reverse=True)]
+
+    def locate(self, point: Point) -> list[Line]:
+        """
+        Find the indexed lines a point lies on.
+
+        The candidates are selected with a float tolerance and then checked
+        with Point.ison, exactly for SymPy lines.
+
+        Args:
+            point (Point): The query point.
+
+        Returns:
+            list[Line]: The lines through the point.
+        """
+        x, y = _coordinates(point)
+        return [self._lines[key][0] for key in self._within(x, y, _slack(x, y))
+                if point.ison(self._lines[key][0])]
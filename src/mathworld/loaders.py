@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'loaders.py'
+
+import csv
+import json
+import math
+import mmap
+import os
+import re
+from array import array
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
+
+from .backend import resolve_backend
+from .batch import BatchResult, _batch, _describe
+from .elements import Point, Line, Segment
+from .equations import float_value
+
+# File extensions and the format they imply
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.txt': 'text'}
+
+# Column names recognized in CSV headers and JSON objects
+_COLUMNS = {'equation', 'a', 'b', 'c', 'x', 'y', 'x1', 'y1', 'x2', 'y2'}
+
+# Separators between the values of a row of a text file
+_SEPARATORS = re.compile(r'[,;\s]+')
+
+
+def _format(source: str | os.PathLike | Iterable[str], format: str | None) -> str:
+    if format is None:
+        if isinstance(source, (str, os.PathLike)):
+            format = FORMATS.get(os.path.splitext(os.fspath(source))[1].lower(), 'text')
+        else:
+            format = 'text'
+    if format not in ('csv', 'jsonl', 'text'):
+        raise ValueError("format must be 'csv', 'jsonl' or 'text'")
+    return format
+
+
+def _lines(source: str | os.PathLike | Iterable[str], memory_map: bool) -> Iterator[str]:
+    # The lines of a file, read lazily: the file is closed when the generator is
+    if not isinstance(source, (str, os.PathLike)):
+        # Not "yield from", which would close a file given by the caller
+        for line in source:
+            yield line
+    elif not memory_map:
+        with open(source, encoding='utf-8', newline='') as file:
+            yield from file
+    else:
+        with open(source, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b''):
+                    yield line.decode('utf-8')
+
+
+def _rows(source: str | os.PathLike | Iterable[str], format: str, memory_map: bool) -> Iterator[tuple[int, Any]]:
+    # (line number, row): the stripped line for text and JSONL files, the list
+    # of fields for CSV files, or a dict if the file starts with a header
+    lines = _lines(source, memory_map)
+    if format != 'csv':
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if line and not (format == 'text' and line.startswith('#')):
+                yield number, line
+        return
+
+    reader = csv.reader(lines)
+    header = None
+    first = True
+    for row in reader:
+        row = [field.strip() for field in row]
+        if not any(row):
+            continue
+        if first:
+            first = False
+            if all(field.lower() in _COLUMNS for field in row):
+                header = [field.lower() for field in row]
+                continue
+        yield reader.line_num, (dict(zip(header, row)) if header is not None else row)
+
+
+def _number(value: Any) -> Any:
+    # Plain integers and decimals are converted without the expression parser
+    if not isinstance(value, str):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return number if math.isfinite(number) else value
+
+
+def _decode(format: str, kind: str, row: Any) -> Any:
+    if format == 'jsonl':
+        return json.loads(row)
+    elif format == 'text' and kind != 'line':
+        return _SEPARATORS.split(row)
+    return row
+
+
+def _line(row: Any, backend: str) -> Line:
+    if isinstance(row, dict):
+        if 'equation' in row:
+            return Line(row['equation'], backend)
+        row = [row['a'], row['b'], row['c']]
+    if isinstance(row, str):
+        return Line(row, backend)
+    elif isinstance(row, list) and len(row) == 1:
+        return Line(row[0], backend)
+    elif isinstance(row, list) and len(row) == 3:
+        return Line.from_coefficients(*map(_number, row), backend=backend)
+    raise ValueError("a line must be given by its equation or by its coefficients a, b, c")
+
+
+def _point(row: Any, backend: str) -> Point:
+    if isinstance(row, dict):
+        row = [row['x'], row['y']]
+    if isinstance(row, list) and len(row) == 2:
+        return Point(_number(row[0]), _number(row[1]), backend)
+    raise ValueError("a point must be given by its coordinates x, y")
+
+
+def _segment(row: Any, backend: str) -> Segment:
+    if isinstance(row, dict):
+        row = [row['x1'], row['y1'], row['x2'], row['y2']]
+    elif isinstance(row, list) and len(row) == 2 and all(isinstance(point, list) for point in row):
+        row = row[0] + row[1]
+    if isinstance(row, list) and len(row) == 4:
+        x1, y1, x2, y2 = map(_number, row)
+        return Segment(Point(x1, y1, backend), Point(x2, y2, backend))
+    raise ValueError("a segment must be given by the coordinates x1, y1, x2, y2 of its endpoints")
+
+
+_BUILDERS = {'line': _line, 'point': _point, 'segment': _segment}
+
+
+def _build(kind: str, format: str, backend: str, row: Any) -> Line | Point | Segment:
+    # Runs in the worker processes, so that decoding is parallel too
+    return _BUILDERS[kind](_decode(format, kind, row), backend)
+
+
+def _load(kind: str, source: str | os.PathLike | Iterable[str], format: str | None, backend: str | None,
+          workers: int, chunksize: int, memory_map: bool) -> Iterator[BatchResult]:
+    format = _format(source, format)
+    # Resolved here: the backend set with use_backend() is not seen by other processes
+    build = partial(_build, kind, format, resolve_backend(backend))
+
+    # Line numbers of the rows being built, at most the rows in flight
+    numbers = deque()
+
+    def rows() -> Iterator[tuple[int, Any]]:
+        for number, row in _rows(source, format, memory_map):
+            numbers.append(number)
+            yield number, row
+
+    # Every row has its own key (its line number), so that nothing is kept once yielded
+    results = _batch(build, rows(), lambda item: (item[0], (item[1],)), workers, chunksize,
+                     ordered=True, deduplicate=False)
+    return (result._replace(index=numbers.popleft()) for result in results)
+
+
+def load_lines(source: str | os.PathLike | Iterable[str], format: str | None = None, backend: str | None = None,
+               workers: int = 1, chunksize: int = 256, memory_map: bool = False) -> Iterator[BatchResult]:
+    """
+    Read lines lazily from a file, one per row.
+
+    A row is an equation (text files, CSV column 'equation', JSON string or
+    {"equation": ...}) or the coefficients a, b, c of ax + by + c = 0 (three CSV
+    columns, JSON list or {"a": ..., "b": ..., "c": ...}).
+
+    Args:
+        source (str | os.PathLike | Iterable[str]): A path, or an iterable of lines such as an open file.
+        format (str | None): 'csv', 'jsonl' or 'text'. If None, it is implied by the file extension
+            ('text' for unknown extensions and iterables).
+        backend (str | None): SYMPY or NUMERIC, the current default backend if None.
+        workers (int): The number of worker processes building the lines, 1 to build them
+            in the current process.
+        chunksize (int): The number of rows sent to a worker at a time.
+        memory_map (bool): If True, the file is memory-mapped instead of read.
+
+    Returns:
+        Iterator[BatchResult]: One result per row, in file order. Its index is the line number
+        of the row, its value the Line, or None with error set if the row is invalid.
+
+    Raises:
+        ValueError: If the format is unknown or workers or chunksize is not positive.
+    """
+    return _load('line', source, format, backend, workers, chunksize, memory_map)
+
+
+def load_points(source: str | os.PathLike | Iterable[str], format: str | None = None, backend: str | None = None,
+                workers: int = 1, chunksize: int = 256, memory_map: bool = False) -> Iterator[BatchResult]:
+    """
+    Read points lazily from a file, one per row.
+
+    A row has the coordinates x, y of the point (two values separated by spaces or commas
+    in text files, CSV columns, JSON list or {"x": ..., "y": ...}). Integer and decimal
+    values are read as Python numbers, other values as expressions.
+
+    Args:
+        source, format, backend, workers, chunksize, memory_map: As in load_lines.
+
+    Returns:
+        Iterator[BatchResult]: One result per row, in file order. Its index is the line number
+        of the row, its value the Point, or None with error set if the row is invalid.
+
+    Raises:
+        ValueError: If the format is unknown or workers or chunksize is not positive.
+    """
+    return _load('point', source, format, backend, workers, chunksize, memory_map)
+
+
+def load_segments(source: str | os.PathLike | Iterable[str], format: str | None = None, backend: str | None = None,
+                  workers: int = 1, chunksize: int = 256, memory_map: bool = False) -> Iterator[BatchResult]:
+    """
+    Read segments lazily from a file, one per row.
+
+    A row has the coordinates x1, y1, x2, y2 of the endpoints (four values in text files,
+    CSV columns, JSON list, list of two points or {"x1": ..., "y1": ..., "x2": ..., "y2": ...}).
+
+    Args:
+        source, format, backend, workers, chunksize, memory_map: As in load_lines.
+
+    Returns:
+        Iterator[BatchResult]: One result per row, in file order. Its index is the line number
+        of the row, its value the Segment, or None with error set if the row is invalid.
+
+    Raises:
+        ValueError: If the format is unknown or workers or chunksize is not positive.
+    """
+    return _load('segment', source, format, backend, workers, chunksize, memory_map)
+
+
+def _coordinate(value: Any) -> float:
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return float_value(value)
+
+
+def load_point_arrays(source: str | os.PathLike | Iterable[str], format: str | None = None, size: int = 65536,
+                      memory_map: bool = False, on_error: Callable[[int, str], None] | None = None) -> Iterator:
+    """
+    Read points lazily from a file into PointArray blocks, without building Point objects.
+
+    The rows are read as in load_points, with the coordinates converted to floats.
+    Requires NumPy.
+
+    Args:
+        source, format, memory_map: As in load_lines.
+        size (int): The number of points of each block (the last one may be shorter).
+        on_error (Callable[[int, str], None] | None): Called with the line number and the error
+            of every invalid row, which is skipped. If None, an invalid row raises ValueError.
+
+    Returns:
+        Iterator[PointArray]: The blocks of points, in file order.
+
+    Raises:
+        ValueError: If the format is unknown, size is not positive or a row is invalid
+            and on_error is None.
+    """
+    from .arrays import PointArray
+
+    format = _format(source, format)
+    if size < 1:
+        raise ValueError(f"size must be positive, got {size}")
+
+    def blocks() -> Iterator[PointArray]:
+        x, y = array('d'), array('d')
+        for number, row in _rows(source, format, memory_map):
+            try:
+                row = _decode(format, 'point', row)
+                if isinstance(row, dict):
+                    row = [row['x'], row['y']]
+                if not isinstance(row, list) or len(row) != 2:
+                    raise ValueError("a point must be given by its coordinates x, y")
+                px, py = _coordinate(row[0]), _coordinate(row[1])
+            except Exception as error:
+                if on_error is None:
+                    raise ValueError(f"line {number}: {_describe(error)}") from None
+                on_error(number, _describe(error))
+                continue
+
+            x.append(px)
+            y.append(py)
+            if len(x) == size:
+                yield PointArray(x, y)
+                x, y = array('d'), array('d')
+        if x:
+            yield PointArray(x, y)
+
+    return blocks()
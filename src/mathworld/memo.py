@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'memo.py'
+
+# Opt-in memoization of the constructions of the elements.
+#
+# Every memoized method has its own WeakLRUCache, disabled by default. The keys
+# are the canonical values of the arguments (the backend and the coordinates of
+# a Point, the canonical coefficients of a Line), never the argument objects
+# themselves, so equal elements built separately share the entries and the cache
+# keeps no argument alive. The results are shared by the calls that hit.
+
+import functools
+from typing import Any, Callable, Hashable
+
+from .backend import get_tolerance
+from .cache import CacheInfo, WeakLRUCache
+
+# Caches of the memoized methods, by name
+MEMO_CACHES = {}
+
+_MISSING = object()
+# Stored in place of a result that is the first argument, e.g. the line returned
+# by Line.intersection for coincident lines
+_SELF = object()
+
+
+def _canonical(value: Any) -> Hashable:
+    # The value of an argument in a key, _MISSING if it can not be keyed on its value
+    canonical = getattr(value, '_canonical', None)
+    if canonical is not None:
+        return canonical()
+    elif value is None or isinstance(value, (int, float, str)):
+        return value
+    # SymPy expressions are immutable and hashed on their value
+    return value if hasattr(value, 'free_symbols') else _MISSING
+
+
+def memoized(name: str, maxsize: int = 1024) -> Callable:
+    """
+    Decorate a method whose results are cached once memoization is enabled.
+
+    Calls with keyword arguments, or with arguments that can not be keyed on
+    their value, are not cached.
+
+    Args:
+        name (str): The name of the cache, e.g. 'Line.findParallel'.
+        maxsize (int): The number of results kept alive by the cache.
+
+    Returns:
+        Callable: The decorator.
+    """
+    cache = MEMO_CACHES[name] = WeakLRUCache(maxsize, enabled=False)
+
+    def decorate(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not cache.enabled or kwargs:
+                return function(*args, **kwargs)
+
+            # The numeric predicates depend on the tolerance
+            key = [get_tolerance()]
+            for arg in args:
+                value = _canonical(arg)
+                if value is _MISSING:
+                    return function(*args)
+                key.append(value)
+            key = tuple(key)
+
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args)
+                cache.put(key, _SELF if result is args[0] else result)
+                return result
+            return args[0] if result is _SELF else result
+        return wrapper
+    return decorate
+
+
+def _caches(name: str | None) -> list[WeakLRUCache]:
+    # The caches are created with the methods they memoize
+    from . import elements  # noqa: F401
+
+    if name is None:
+        return list(MEMO_CACHES.values())
+    elif name not in MEMO_CACHES:
+        raise ValueError(f"name must be one of {', '.join(MEMO_CACHES)}")
+    return [MEMO_CACHES[name]]
+
+
+def memo_info(name: str | None = None) -> dict[str, CacheInfo] | CacheInfo:
+    """
+    Return the statistics of the memoization caches.
+
+    Args:
+        name (str | None): The name of a cache, e.g. 'Line.findParallel', None for all of them.
+
+    Returns:
+        dict[str, CacheInfo] | CacheInfo: The statistics of every cache by name,
+        or of the named cache.
+
+    Raises:
+        ValueError: If there is no cache with that name.
+    """
+    caches = _caches(name)
+    if name is not None:
+        return caches[0].info()
+    return {key: cache.info() for key, cache in MEMO_CACHES.items()}
+
+
+def clear_memo(name: str | None = None):
+    """
+    Remove every entry of the memoization caches and reset their statistics.
+
+    Args:
+        name (str | None): The name of a cache, None for all of them.
+
+    Raises:
+        ValueError: If there is no cache with that name.
+    """
+    for cache in _caches(name):
+        cache.clear()
+
+
+def configure_memo(maxsize: int | None = None, enabled: bool | None = None, name: str | None = None):
+    """
+    Enable or disable memoization, or change the size limit of its caches.
+
+    Memoization is disabled by default. Disabling a cache also drops its entries.
+
+    Args:
+        maxsize (int | None): The number of results kept alive by each cache.
+        enabled (bool | None): Whether the results are cached.
+        name (str | None): The name of a cache, None for all of them.
+
+    Raises:
+        ValueError: If maxsize is negative or there is no cache with that name.
+    """
+    for cache in _caches(name):
+        cache.configure(maxsize, enabled)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'parametric.py'
+
+import inspect
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from .arrays import PointArray
+from .backend import SYMPY, use_backend
+from .elements import Point, Line, Segment, sp
+
+
+class Construction():
+    # A construction derived once with symbolic parameters and compiled into a vectorized function.
+    def __init__(self, function: Callable[..., Any], parameters: Sequence[str] | None = None):
+        """
+        Derive the result of a construction symbolically and compile it with lambdify.
+
+        The function is called once with a real SymPy symbol for every parameter.
+        It may return a Point, Line, Segment, SymPy expression or number, or
+        tuples, lists and dicts of them. Calling the construction evaluates the
+        compiled result on arrays of parameter values.
+
+        The result is derived for generic parameter values: the values for which
+        the construction degenerates (e.g. parallel lines when intersecting)
+        give inf or nan.
+
+        Args:
+            function (Callable[..., Any]): The construction, e.g.
+                lambda t, k: Line.findLine(Point(t, 2*t), slope=k).intersection(X_AXIS).
+            parameters (Sequence[str] | None): The names of the parameters, in the order of the
+                arguments of function. If None, the names of its arguments are used.
+
+        Raises:
+            ValueError: If the function returns something that cannot be compiled.
+        """
+        if parameters is None:
+            parameters = list(inspect.signature(function).parameters)
+        self.parameters = tuple(parameters)
+        self.symbols = tuple(sp.Symbol(name, real=True) for name in self.parameters)
+
+        with use_backend(SYMPY):
+            self.result = function(*self.symbols)
+        expressions = []
+        self._layout = _flatten(self.result, expressions)
+        self.expressions = tuple(expressions)
+        self._function = sp.lambdify(self.symbols, self.expressions, modules='numpy', cse=True)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """
+        Evaluate the construction for many parameter values at once.
+
+        Args:
+            *args, **kwargs: The values of the parameters, as scalars or arrays that broadcast together.
+
+        Returns:
+            Any: The result with the same structure as the symbolic one: a PointArray for every
+            Point, a tuple (a, b, c) of arrays of unit normal coefficients for every Line, a
+            tuple of two PointArray for every Segment and an array for every expression.
+
+        Raises:
+            TypeError: If a parameter is missing or unknown.
+        """
+        values = inspect.Signature([inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                                    for name in self.parameters]).bind(*args, **kwargs).arguments
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(values[name], dtype=np.float64))
+                                       for name in self.parameters))
+        shape = arrays[0].shape if arrays else (1,)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            outputs = [np.broadcast_to(np.asarray(output, dtype=np.float64), shape).ravel()
+                       for output in self._function(*arrays)]
+        return _assemble(self._layout, iter(outputs))
+
+
+def _flatten(value: Any, expressions: list) -> Any:
+    # Collect the expressions of a result and return its layout, used to assemble the values
+    if isinstance(value, Point):
+        expressions.extend((value.x, value.y))
+        return 'point'
+    elif isinstance(value, Line):
+        expressions.extend((value.a, value.b, value.c))
+        return 'line'
+    elif isinstance(value, Segment):
+        expressions.extend((value.point1.x, value.point1.y, value.point2.x, value.point2.y))
+        return 'segment'
+    elif isinstance(value, (sp.Expr, int, float)):
+        expressions.append(sp.sympify(value))
+        return 'value'
+    elif isinstance(value, (tuple, list)):
+        return type(value), [_flatten(item, expressions) for item in value]
+    elif isinstance(value, dict):
+        return dict, {key: _flatten(item, expressions) for key, item in value.items()}
+    raise ValueError(f"cannot compile a construction returning {type(value).__name__}")
+
+
+def _unit(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # The numeric Line convention: unit normal with b > 0, or a > 0 for vertical lines
+    norm = np.hypot(a, b)
+    norm = np.where((b < 0) | ((b == 0) & (a < 0)), -norm, norm)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return a / norm + 0.0, b / norm + 0.0, c / norm + 0.0
+
+
+def _assemble(layout: Any, outputs: Any) -> Any:
+    if layout == 'point':
+        return PointArray(next(outputs), next(outputs))
+    elif layout == 'line':
+        return _unit(next(outputs), next(outputs), next(outputs))
+    elif layout == 'segment':
+        return (PointArray(next(outputs), next(outputs)), PointArray(next(outputs), next(outputs)))
+    elif layout == 'value':
+        return next(outputs)
+
+    container, items = layout
+    if container is dict:
+        return {key: _assemble(item, outputs) for key, item in items.items()}
+    return container(_assemble(item, outputs) for item in items)
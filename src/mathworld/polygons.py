@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'polygons.py'
+
+import math
+from array import array
+from functools import cached_property
+from typing import Iterable, Iterator
+
+from .equations import sp, sympy_value, float_value
+from .backend import SYMPY, NUMERIC, get_tolerance, resolve_backend
+from .elements import Point, Segment, _restore_point, _pack, _unpack, _tidy, _is_zero, _expand
+from ._rational import integers, to_sympy
+from .predicates import orientation, compare, on_segment
+
+
+class Polygon():
+    # Represents a polygon by the coordinates of its vertices, in order.
+    def __init__(self, vertices: Iterable[Point], backend: str | None = None):
+        """
+        Initializes the Polygon object with its vertices.
+
+        The coordinates are kept in two compact columns (tuples of SymPy values, or
+        arrays of floats for the numeric backend): Point and Segment objects are
+        only built on access.
+
+        Args:
+            vertices (Iterable[Point]): The vertices, in order along the boundary.
+            backend (str | None): SYMPY or NUMERIC. If None, the polygon is numeric when
+                a vertex is numeric, otherwise the current default backend is used.
+
+        Raises:
+            ValueError: If there are fewer than three vertices.
+        """
+        vertices = list(vertices)
+        if backend is None and any(vertex.backend == NUMERIC for vertex in vertices):
+            backend = NUMERIC
+        self._set_coordinates([vertex.x for vertex in vertices], [vertex.y for vertex in vertices],
+                              resolve_backend(backend))
+
+    @classmethod
+    def from_coordinates(cls, x: Iterable, y: Iterable, backend: str | None = None) -> 'Polygon':
+        """
+        Build a polygon from the coordinates of its vertices, without Point objects.
+
+        Args:
+            x (Iterable): The x-coordinates of the vertices, e.g. a list or a NumPy array.
+            y (Iterable): The y-coordinates of the vertices.
+            backend (str | None): SYMPY or NUMERIC, the current default backend if None.
+
+        Returns:
+            Polygon: The polygon.
+
+        Raises:
+            ValueError: If x and y have different lengths or there are too few vertices.
+        """
+        polygon = cls.__new__(cls)
+        polygon._set_coordinates(list(x), list(y), resolve_backend(backend))
+        return polygon
+
+    def _set_coordinates(self, x: list, y: list, backend: str):
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        elif len(x) < 3:
+            raise ValueError("a polygon needs at least three vertices")
+
+        self.backend = backend
+        if backend == NUMERIC:
+            self.x = array('d', (float_value(value, 'x') for value in x))
+            self.y = array('d', (float_value(value, 'y') for value in y))
+        else:
+            self.x = tuple(sympy_value(value, 'x') for value in x)
+            self.y = tuple(sympy_value(value, 'y') for value in y)
+
+    def __reduce__(self) -> tuple:
+        # Pickled as its coordinates, without the cached derived properties
+        return _restore_polygon, (type(self), tuple(_pack(value) for value in self.x),
+                                  tuple(_pack(value) for value in self.y), self.backend)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, index: int) -> Point:
+        return _restore_point(self.x[index], self.y[index], self.backend)
+
+    def __iter__(self) -> Iterator[Point]:
+        return (_restore_point(x, y, self.backend) for x, y in zip(self.x, self.y))
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the vertices.
+
+        Returns:
+            str: The vertices, as Polygon((x1, y1), (x2, y2), ...).
+        """
+        return f"{type(self).__name__}({', '.join(str(vertex) for vertex in self)})"
+
+    @cached_property
+    def vertices(self) -> tuple[Point, ...]:
+        """
+        The vertices of the polygon, as Point objects.
+        """
+        return tuple(self)
+
+    @cached_property
+    def sides(self) -> tuple[Segment, ...]:
+        """
+        The sides of the polygon, from every vertex to the next one.
+        """
+        vertices = self.vertices
+        return tuple(Segment(vertex, vertices[i - len(vertices) + 1]) for i, vertex in enumerate(vertices))
+
+    def _edges(self) -> Iterator[tuple]:
+        # The coordinates (x1, y1, x2, y2) of every side
+        x, y = self.x, self.y
+        return zip(x, y, x[1:] + x[:1], y[1:] + y[:1])
+
+    @cached_property
+    def signedArea(self) -> sp.Expr | float:
+        """
+        The area of the polygon computed with the shoelace formula, positive if the
+        vertices are in counterclockwise order and negative if they are clockwise.
+        """
+        if self.backend == NUMERIC:
+            return math.fsum(x1 * y2 - x2 * y1 for x1, y1, x2, y2 in self._edges()) / 2
+
+        values = integers(*self.x, *self.y)
+        if values is not None:
+            (scaled, w), n = values, len(self)
+            x, y = scaled[:n], scaled[n:]
+            total = sum(x[i - 1] * y[i] - x[i] * y[i - 1] for i in range(n))
+            return to_sympy(total, 2 * w * w)
+        return _expand(sp.Add(*(x1 * y2 - x2 * y1 for x1, y1, x2, y2 in self._edges())) / 2)
+
+    @cached_property
+    def area(self) -> sp.Expr | float:
+        """
+        The area of the polygon.
+        """
+        return abs(self.signedArea)
+
+    @cached_property
+    def perimeter(self) -> sp.Expr | float:
+        """
+        The perimeter of the polygon.
+        """
+        if self.backend == NUMERIC:
+            return math.fsum(math.hypot(x2 - x1, y2 - y1) for x1, y1, x2, y2 in self._edges())
+        return sp.Add(*(vertex.distancePoint(self.vertices[i - len(self) + 1])
+                        for i, vertex in enumerate(self.vertices)))
+
+    @cached_property
+    def centroid(self) -> Point:
+        """
+        The centroid (center of mass) of the region enclosed by the polygon.
+
+        Raises:
+            ValueError: If the area of the polygon is zero.
+        """
+        if self.backend == NUMERIC:
+            area = self.signedArea
+            if abs(area) <= get_tolerance():
+                raise ValueError("the centroid of a polygon with zero area is undefined")
+            crosses = [(x1 * y2 - x2 * y1, x1 + x2, y1 + y2) for x1, y1, x2, y2 in self._edges()]
+            return Point(math.fsum(cross * x for cross, x, _ in crosses) / (6 * area),
+                         math.fsum(cross * y for cross, _, y in crosses) / (6 * area), backend=NUMERIC)
+
+        values = integers(*self.x, *self.y)
+        if values is not None:
+            (scaled, w), n = values, len(self)
+            x, y = scaled[:n], scaled[n:]
+            crosses = [x[i - 1] * y[i] - x[i] * y[i - 1] for i in range(n)]
+            total = sum(crosses)
+            if total == 0:
+                raise ValueError("the centroid of a polygon with zero area is undefined")
+            # Twice the area is total / w^2 and every coordinate is scaled by w
+            return Point(to_sympy(sum(cross * (x[i - 1] + x[i]) for i, cross in enumerate(crosses)), 3 * w * total),
+                         to_sympy(sum(cross * (y[i - 1] + y[i]) for i, cross in enumerate(crosses)), 3 * w * total),
+                         backend=SYMPY)
+
+        area = self.signedArea
+        if _is_zero(area):
+            raise ValueError("the centroid of a polygon with zero area is undefined")
+        crosses = [(x1 * y2 - x2 * y1, x1 + x2, y1 + y2) for x1, y1, x2, y2 in self._edges()]
+        return Point(_tidy(_expand(sp.Add(*(cross * x for cross, x, _ in crosses))) / (6 * area)),
+                     _tidy(_expand(sp.Add(*(cross * y for cross, _, y in crosses))) / (6 * area)), backend=SYMPY)
+
+    def isConvex(self) -> bool:
+        """
+        Check if the polygon is convex.
+
+        Consecutive collinear vertices are allowed. The turns are computed with the
+        exact predicates for exact polygons.
+
+        Returns:
+            bool: True if every turn has the same direction and the boundary winds once.
+
+        Raises:
+            ValueError: If the answer depends on the value of a symbol.
+        """
+        if self.backend == NUMERIC:
+            tolerance = get_tolerance()
+            turn = lambda x1, y1, x2, y2, x3, y3: _sign((x2 - x1) * (y3 - y1) - (y2 - y1) * (x3 - x1), tolerance)
+            step = lambda x1, x2: _sign(x2 - x1, tolerance)
+        else:
+            turn = lambda x1, y1, x2, y2, x3, y3: orientation(
+                _restore_point(x1, y1, SYMPY), _restore_point(x2, y2, SYMPY), _restore_point(x3, y3, SYMPY))
+            step = lambda x1, x2: compare(x2, x1)
+
+        x, y, n = self.x, self.y, len(self)
+        turns = {turn(x[i - 2], y[i - 2], x[i - 1], y[i - 1], x[i], y[i]) for i in range(n)}
+        if 1 in turns and -1 in turns:
+            return False
+
+        # Turning always the same way, the boundary winds more than once (as a star
+        # does) if its direction along x changes sign more than twice
+        steps = [sign for sign in (step(x[i - 1], x[i]) for i in range(n)) if sign != 0]
+        return sum(sign != steps[i - 1] for i, sign in enumerate(steps)) <= 2
+
+    def contains(self, point: Point) -> bool:
+        """
+        Check if a point lies inside the polygon or on its boundary.
+
+        The interior is given by the nonzero winding rule, the same as the even-odd
+        rule for polygons that do not intersect themselves. For many points use
+        PointArray.in_polygon.
+
+        Args:
+            point (Point): The point.
+
+        Returns:
+            bool: True if the point is inside the polygon or on its boundary.
+
+        Raises:
+            ValueError: If the answer depends on the value of a symbol.
+        """
+        if self.backend == NUMERIC or point.backend == NUMERIC:
+            return self._contains_numeric(float_value(point.x, 'x'), float_value(point.y, 'y'), get_tolerance())
+
+        winding = 0
+        for side in self.sides:
+            point1, point2 = side.point1, side.point2
+            if on_segment(point, side):
+                return True
+            below1, below2 = compare(point1.y, point.y) <= 0, compare(point2.y, point.y) <= 0
+            if below1 != below2:
+                # The side crosses the horizontal through the point: upwards if point
+                # is on its left, downwards if it is on its right
+                side_of = orientation(point1, point2, point)
+                if below1 and side_of > 0:
+                    winding += 1
+                elif below2 and side_of < 0:
+                    winding -= 1
+        return winding != 0
+
+    def _contains_numeric(self, x: float, y: float, tolerance: float) -> bool:
+        winding = 0
+        for x1, y1, x2, y2 in self._edges():
+            cross = (x2 - x1) * (y - y1) - (x - x1) * (y2 - y1)
+            length = math.hypot(x2 - x1, y2 - y1)
+            if (abs(cross) <= tolerance * length and
+                    min(x1, x2) - tolerance <= x <= max(x1, x2) + tolerance and
+                    min(y1, y2) - tolerance <= y <= max(y1, y2) + tolerance):
+                # On the side, or on a side of zero length
+                return True
+            if y1 <= y < y2 and cross > 0:
+                winding += 1
+            elif y2 <= y < y1 and cross < 0:
+                winding -= 1
+        return winding != 0
+
+    def to_numeric(self) -> 'Polygon':
+        """
+        Convert the polygon to the numeric backend.
+
+        Returns:
+            Polygon: The polygon with float coordinates (itself if it is already numeric).
+        """
+        return self if self.backend == NUMERIC else type(self).from_coordinates(self.x, self.y, backend=NUMERIC)
+
+    def to_exact(self) -> 'Polygon':
+        """
+        Convert the polygon to the SymPy backend.
+
+        Returns:
+            Polygon: The polygon with exact coordinates (itself if it is already exact).
+        """
+        return self if self.backend == SYMPY else type(self).from_coordinates(self.x, self.y, backend=SYMPY)
+
+
+class Triangle(Polygon):
+    # Represents a triangle, a polygon with three vertices and closed-form centers.
+
+    def __init__(self, point1: Point, point2: Point, point3: Point, backend: str | None = None):
+        """
+        Initializes the Triangle object with its three vertices.
+
+        Args:
+            point1 (Point): The first vertex.
+            point2 (Point): The second vertex.
+            point3 (Point): The third vertex.
+            backend (str | None): SYMPY or NUMERIC. If None, the triangle is numeric when
+                a vertex is numeric, otherwise the current default backend is used.
+        """
+        super().__init__((point1, point2, point3), backend)
+
+    def _set_coordinates(self, x: list, y: list, backend: str):
+        if len(x) != 3:
+            raise ValueError("a triangle needs exactly three vertices")
+        super()._set_coordinates(x, y, backend)
+
+    @cached_property
+    def centroid(self) -> Point:
+        """
+        The centroid of the triangle, the intersection of its medians.
+        """
+        if self.backend == NUMERIC:
+            return Point(math.fsum(self.x) / 3, math.fsum(self.y) / 3, backend=NUMERIC)
+        return Point(_tidy(sp.Add(*self.x) / 3), _tidy(sp.Add(*self.y) / 3), backend=SYMPY)
+
+    @cached_property
+    def circumcenter(self) -> Point:
+        """
+        The circumcenter of the triangle, the intersection of the perpendicular
+        bisectors of its sides, computed in closed form.
+
+        Raises:
+            ValueError: If the vertices are collinear.
+        """
+        (x1, x2, x3), (y1, y2, y3) = self.x, self.y
+        if self.backend == SYMPY:
+            values = integers(x1, x2, x3, y1, y2, y3)
+            if values is not None:
+                (x1, x2, x3, y1, y2, y3), w = values
+                x, y, determinant = _circumcenter(x1, y1, x2, y2, x3, y3)
+                if determinant == 0:
+                    raise ValueError("the vertices of the triangle are collinear")
+                # The numerators have degree 3 and the determinant degree 2 in w
+                return Point(to_sympy(x, determinant * w), to_sympy(y, determinant * w), backend=SYMPY)
+
+        x, y, determinant = _circumcenter(x1, y1, x2, y2, x3, y3)
+        if self.backend == NUMERIC:
+            if abs(determinant) <= get_tolerance():
+                raise ValueError("the vertices of the triangle are collinear")
+            return Point(x / determinant, y / determinant, backend=NUMERIC)
+
+        determinant = _expand(determinant)
+        if _is_zero(determinant):
+            raise ValueError("the vertices of the triangle are collinear")
+        return Point(_tidy(_expand(x) / determinant), _tidy(_expand(y) / determinant), backend=SYMPY)
+
+    @cached_property
+    def orthocenter(self) -> Point:
+        """
+        The orthocenter of the triangle, the intersection of its altitudes.
+
+        On the Euler line, it is the sum of the vertices minus twice the circumcenter.
+
+        Raises:
+            ValueError: If the vertices are collinear.
+        """
+        center = self.circumcenter
+        if self.backend == NUMERIC:
+            return Point(math.fsum(self.x) - 2 * center.x, math.fsum(self.y) - 2 * center.y, backend=NUMERIC)
+        return Point(_tidy(sp.Add(*self.x) - 2 * center.x), _tidy(sp.Add(*self.y) - 2 * center.y), backend=SYMPY)
+
+    @cached_property
+    def incenter(self) -> Point:
+        """
+        The incenter of the triangle, the intersection of its angle bisectors: the
+        average of the vertices weighted by the lengths of the opposite sides.
+
+        Raises:
+            ValueError: If the vertices are collinear.
+        """
+        point1, point2, point3 = self.vertices
+        weights = (point2.distancePoint(point3), point3.distancePoint(point1), point1.distancePoint(point2))
+
+        if self.backend == NUMERIC:
+            if abs(self.signedArea) <= get_tolerance():
+                raise ValueError("the vertices of the triangle are collinear")
+            total = math.fsum(weights)
+            return Point(math.fsum(w * x for w, x in zip(weights, self.x)) / total,
+                         math.fsum(w * y for w, y in zip(weights, self.y)) / total, backend=NUMERIC)
+
+        if _is_zero(self.signedArea):
+            raise ValueError("the vertices of the triangle are collinear")
+        total = sp.Add(*weights)
+        return Point(_tidy(sp.Add(*(w * x for w, x in zip(weights, self.x))) / total),
+                     _tidy(sp.Add(*(w * y for w, y in zip(weights, self.y))) / total), backend=SYMPY)
+
+
+def _circumcenter(x1, y1, x2, y2, x3, y3) -> tuple:
+    # Numerators of the coordinates of the circumcenter and their common denominator
+    square1, square2, square3 = x1 * x1 + y1 * y1, x2 * x2 + y2 * y2, x3 * x3 + y3 * y3
+    determinant = 2 * (x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2))
+    x = square1 * (y2 - y3) + square2 * (y3 - y1) + square3 * (y1 - y2)
+    y = square1 * (x3 - x2) + square2 * (x1 - x3) + square3 * (x2 - x1)
+    return x, y, determinant
+
+
+def _sign(value: float, tolerance: float) -> int:
+    # Sign of a numeric value, 0 within the tolerance
+    return 0 if abs(value) <= tolerance else (1 if value > 0 else -1)
+
+
+def _restore_polygon(cls: type, x: tuple, y: tuple, backend: str) -> Polygon:
+    polygon = cls.__new__(cls)
+    polygon.backend = backend
+    values = ([_unpack(value) for value in x], [_unpack(value) for value in y])
+    polygon.x, polygon.y = (tuple(values[0]), tuple(values[1])) if backend == SYMPY else \
+        (array('d', values[0]), array('d', values[1]))
+    return polygon
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'predicates.py'
+
+# Exact geometric predicates evaluated in three stages:
+#
+# 1. The sign of the determinant is computed with floats, together with a bound
+#    on its rounding error. Most calls stop here, when the value is farther
+#    from zero than the bound.
+# 2. If all the values are rational, the determinant is computed exactly with
+#    Python integers over a common denominator.
+# 3. Otherwise SymPy decides whether it is zero and, if needed, its sign.
+#
+# A determinant is the sum of terms (coefficient, i, j, ...), each the product
+# of a small integer coefficient and of the values with indexes i, j, ...
+
+import math
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+import sympy as sp
+from sympy.core.evalf import PrecisionExhausted
+
+from ._rational import INTEGER_TYPES, integers
+from .equations import sympy_value
+
+if TYPE_CHECKING:
+    from .elements import Point, Line, Segment
+
+_EPSILON = sys.float_info.epsilon
+
+# Integers up to this magnitude are computed exactly with floats
+_EXACT = 2.0 ** 53
+
+# Relative error of a value converted to float: at most half a unit in the last
+# place, plus the error of the numerical evaluation of irrational values
+_INPUT_ERROR = 2 * _EPSILON
+
+
+
+class _Determinant(NamedTuple):
+    # The terms of a determinant, its degree and the relative error bound of the float filter
+    terms: tuple
+    degree: int
+    error: float
+
+
+def _determinant(*terms: tuple) -> _Determinant:
+    degree = max(len(term) for term in terms) - 1
+    # Every factor adds _INPUT_ERROR and every product and sum one rounding, relative
+    # to the sum of the magnitudes of the terms, with a margin for the computation of
+    # the bound itself
+    return _Determinant(terms, degree, 2 * degree * _INPUT_ERROR + (degree + len(terms) + 2) * _EPSILON)
+
+
+# Determinants of the predicates
+_ORIENTATION = _determinant((1, 0, 3), (-1, 0, 5), (1, 2, 5), (-1, 2, 1), (1, 4, 1), (-1, 4, 3))
+_INCIDENCE = _determinant((1, 0, 3), (1, 1, 4), (1, 2))
+_CROSS = _determinant((1, 0, 3), (-1, 1, 2))
+_DOT = _determinant((1, 0, 2), (1, 1, 3))
+_DIFFERENCE = _determinant((1, 0), (-1, 1))
+
+
+@lru_cache(maxsize=4096)
+def _evaluate(value: sp.Basic) -> float | None:
+    # Irrational values are evaluated numerically, which is slow: the same
+    # coefficients and coordinates are used by many predicates
+    try:
+        # strict: evalf raises instead of returning fewer correct digits
+        return float(value.evalf(20, strict=True))
+    except (TypeError, ValueError, OverflowError, PrecisionExhausted):
+        return None
+
+
+def _float(value) -> float | None:
+    # The value as a float within _INPUT_ERROR, None if that can not be guaranteed
+    kind = type(value)
+    try:
+        if kind is int or kind is float:
+            result = float(value)
+        elif kind in INTEGER_TYPES:
+            result = float(value.p)
+        elif isinstance(value, sp.Basic):
+            # Correctly rounded division of the integers
+            result = value.p / value.q if value.is_Rational else _evaluate(value)
+        else:
+            return None
+    except OverflowError:
+        return None
+    if result is None or not math.isfinite(result) or 0 < abs(result) < 1e-300 or (result == 0 and value != 0):
+        # Overflow or underflow, where the relative error is not bounded
+        return None
+    return result
+
+
+def _filter(values: tuple, determinant: _Determinant) -> int | None:
+    # Sign of the determinant from the float values, None if the rounding errors could change it
+    floats = []
+    integral = True
+    for value in values:
+        integral = integral and (type(value) is int or type(value) in INTEGER_TYPES)
+        value = _float(value)
+        if value is None:
+            return None
+        floats.append(value)
+
+    total = magnitude = 0.0
+    for coefficient, *indexes in determinant.terms:
+        product = float(coefficient)
+        for index in indexes:
+            product *= floats[index]
+        total += product
+        magnitude += abs(product)
+
+    if integral and magnitude < _EXACT:
+        # Integers whose products and sums are all exactly representable, zero included
+        return (total > 0) - (total < 0)
+    # With an absolute term for the underflow of small products
+    bound = determinant.error * magnitude + len(determinant.terms) * sys.float_info.min
+    if abs(total) > bound:
+        return 1 if total > 0 else -1
+    return None
+
+
+def _exact(values: tuple, determinant: _Determinant) -> int | None:
+    # Sign of the determinant of rational values with integer arithmetic, None if a value is not rational
+    scaled = integers(*values)
+    if scaled is None:
+        return None
+    values, denominator = scaled
+
+    # Terms of lower degree are multiplied by the denominator, as if they had factors 1
+    total = 0
+    for coefficient, *indexes in determinant.terms:
+        product = coefficient * denominator ** (determinant.degree - len(indexes))
+        for index in indexes:
+            product *= values[index]
+        total += product
+    return (total > 0) - (total < 0)
+
+
+def _symbolic(values: tuple, determinant: _Determinant, need_sign: bool) -> int:
+    # Sign of the determinant with SymPy, 1 for any nonzero value if the sign is not needed
+    from .elements import _is_zero
+
+    values = [sympy_value(value) for value in values]
+    value = sp.Add(*(coefficient * sp.Mul(*(values[index] for index in indexes))
+                     for coefficient, *indexes in determinant.terms))
+    if _is_zero(value):
+        return 0
+    elif not need_sign:
+        return 1
+
+    sign = sp.sign(value)
+    if sign in (1, -1):
+        return int(sign)
+    raise ValueError(f"the sign of {value} can not be determined")
+
+
+def _sign(values: tuple, determinant: _Determinant, need_sign: bool = True) -> int:
+    sign = _filter(values, determinant)
+    if sign is None:
+        sign = _exact(values, determinant)
+    if sign is None:
+        sign = _symbolic(values, determinant, need_sign)
+    return sign
+
+
+def orientation(point1: Point, point2: Point, point3: Point) -> int:
+    """
+    Orientation of three points.
+
+    Args:
+        point1 (Point): The first point.
+        point2 (Point): The second point.
+        point3 (Point): The third point.
+
+    Returns:
+        int: 1 if point3 is on the left of the line from point1 to point2 (counterclockwise turn),
+        -1 if it is on the right (clockwise turn), 0 if the points are collinear.
+
+    Raises:
+        ValueError: If the orientation depends on the value of a symbol.
+    """
+    return _sign((point1.x, point1.y, point2.x, point2.y, point3.x, point3.y), _ORIENTATION)
+
+
+def incident(point: Point, line: Line) -> bool:
+    """
+    Check exactly if a point lies on a line.
+
+    Args:
+        point (Point): The point.
+        line (Line): The line.
+
+    Returns:
+        bool: True if ax + by + c = 0.
+    """
+    return _sign((line.a, line.b, line.c, point.x, point.y), _INCIDENCE, need_sign=False) == 0
+
+
+def parallel(line1: Line, line2: Line) -> bool:
+    """
+    Check exactly if two lines are parallel (or coincident).
+
+    Args:
+        line1 (Line): The first line.
+        line2 (Line): The second line.
+
+    Returns:
+        bool: True if a1*b2 - a2*b1 = 0, which includes two vertical lines.
+    """
+    return _sign((line1.a, line1.b, line2.a, line2.b), _CROSS, need_sign=False) == 0
+
+
+def perpendicular(line1: Line, line2: Line) -> bool:
+    """
+    Check exactly if two lines are perpendicular.
+
+    Args:
+        line1 (Line): The first line.
+        line2 (Line): The second line.
+
+    Returns:
+        bool: True if a1*a2 + b1*b2 = 0, which includes a vertical and a horizontal line.
+    """
+    return _sign((line1.a, line1.b, line2.a, line2.b), _DOT, need_sign=False) == 0
+
+
+def compare(value1, value2) -> int:
+    """
+    Compare two real values exactly.
+
+    Args:
+        value1 (int | float | sp.Expr): The first value.
+        value2 (int | float | sp.Expr): The second value.
+
+    Returns:
+        int: 1 if value1 > value2, -1 if value1 < value2, 0 if they are equal.
+
+    Raises:
+        ValueError: If the comparison depends on the value of a symbol.
+    """
+    return _sign((value1, value2), _DIFFERENCE)
+
+
+def on_segment(point: Point, segment: Segment) -> bool:
+    """
+    Check exactly if a point lies on a closed segment.
+
+    Args:
+        point (Point): The point.
+        segment (Segment): The segment, which may be a single point.
+
+    Returns:
+        bool: True if the point is collinear with the endpoints and between them.
+
+    Raises:
+        ValueError: If the answer depends on the value of a symbol.
+    """
+    point1, point2 = segment.point1, segment.point2
+    values = (point1.x, point1.y, point2.x, point2.y, point.x, point.y)
+    if _sign(values, _ORIENTATION, need_sign=False) != 0:
+        return False
+    # Within the bounding box of the endpoints
+    return (compare(point.x, point1.x) * compare(point.x, point2.x) <= 0 and
+            compare(point.y, point1.y) * compare(point.y, point2.y) <= 0)
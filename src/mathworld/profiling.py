@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'profiling.py'
+
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Iterator, NamedTuple, TextIO
+
+# Number of active profiles and hooks: when it is zero the instrumented
+# functions only pay for one global lookup and one comparison
+_active = 0
+_active_lock = threading.Lock()
+
+_hooks = []
+# Profiles recording in the current thread or task
+_profiles = ContextVar('mathworld_profiles', default=())
+# Outermost instrumented API call running in the current thread or task
+_current_api = ContextVar('mathworld_api', default=None)
+
+# Name under which operations called outside of any API call are recorded
+DIRECT = '<direct>'
+
+
+class ProfileEvent(NamedTuple):
+    # A timed API call (operation is None) or SymPy operation, as passed to the hooks
+    api: str
+    operation: str | None
+    elapsed: float
+    args: tuple
+
+
+class Stats():
+    # Number of calls and cumulative time of an API call or operation
+    __slots__ = ('count', 'total')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+
+
+class Profile():
+    # Aggregated timings of the instrumented API calls and of the SymPy operations they run.
+    def __init__(self, slowest: int = 10):
+        """
+        Initializes an empty profile.
+
+        Args:
+            slowest (int): The number of slowest API calls kept with their arguments.
+        """
+        self.slowest = slowest
+        self.calls = {}
+        self.operations = {}
+        self._slowest_calls = []
+        self._lock = threading.Lock()
+
+    def record(self, event: ProfileEvent):
+        """
+        Add a timed API call or operation to the profile.
+
+        Args:
+            event (ProfileEvent): The timing to add.
+        """
+        with self._lock:
+            if event.operation is not None:
+                self.operations.setdefault((event.api, event.operation), Stats()).add(event.elapsed)
+                return
+
+            self.calls.setdefault(event.api, Stats()).add(event.elapsed)
+            if self.slowest > 0:
+                self._slowest_calls.append((event.elapsed, event.api, event.args))
+                if len(self._slowest_calls) > 2 * self.slowest:
+                    self._slowest_calls.sort(key=lambda call: -call[0])
+                    del self._slowest_calls[self.slowest:]
+
+    def clear(self):
+        """
+        Remove every recorded timing.
+        """
+        with self._lock:
+            self.calls.clear()
+            self.operations.clear()
+            self._slowest_calls.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the aggregated timings.
+
+        The time of an API call that is not spent in an instrumented operation
+        (object construction, arithmetic...) is reported as its self time.
+
+        Returns:
+            dict[str, dict[str, Any]]: For every API call, its count, total and self time
+            in seconds, and the count and total time of each operation it ran.
+        """
+        with self._lock:
+            stats = {api: {'count': call.count, 'total': call.total, 'self': call.total, 'operations': {}}
+                     for api, call in self.calls.items()}
+            for (api, operation), timing in self.operations.items():
+                entry = stats.setdefault(api, {'count': 0, 'total': 0.0, 'self': 0.0, 'operations': {}})
+                entry['operations'][operation] = {'count': timing.count, 'total': timing.total}
+                if api in self.calls:
+                    entry['self'] -= timing.total
+            return stats
+
+    def slowest_calls(self) -> list[tuple[float, str, tuple]]:
+        """
+        Return the slowest API calls.
+
+        Returns:
+            list[tuple[float, str, tuple]]: Tuples (seconds, api, arguments), from the slowest.
+        """
+        with self._lock:
+            return sorted(self._slowest_calls, key=lambda call: -call[0])[:self.slowest]
+
+    def report(self, file: TextIO | None = None) -> str:
+        """
+        Format the aggregated timings as a table, sorted by total time.
+
+        Args:
+            file (TextIO | None): A file the table is also written to.
+
+        Returns:
+            str: The table.
+        """
+        lines = [f"{'call / operation':<40}{'count':>10}{'total ms':>12}{'mean us':>12}"]
+        for api, entry in sorted(self.stats().items(), key=lambda item: -item[1]['total']):
+            count, total = entry['count'], entry['total']
+            lines.append(f"{api:<40}{count:>10}{total * 1e3:>12.3f}{total / max(count, 1) * 1e6:>12.1f}")
+            for operation, timing in sorted(entry['operations'].items(), key=lambda item: -item[1]['total']):
+                lines.append(f"{'  ' + operation:<40}{timing['count']:>10}{timing['total'] * 1e3:>12.3f}"
+                             f"{timing['total'] / timing['count'] * 1e6:>12.1f}")
+            if count:
+                lines.append(f"{'  (self)':<40}{'':>10}{entry['self'] * 1e3:>12.3f}")
+
+        slowest = self.slowest_calls()
+        if slowest:
+            lines.append('')
+            lines.append('slowest calls:')
+            for elapsed, api, args in slowest:
+                arguments = ', '.join(map(str, args))
+                lines.append(f"  {elapsed * 1e3:10.3f} ms  {api}({arguments[:200]})")
+
+        text = '\n'.join(lines)
+        if file is not None:
+            print(text, file=file)
+        return text
+
+
+def _change_active(step: int):
+    global _active
+    with _active_lock:
+        _active += step
+
+
+def add_hook(callback: Callable[[ProfileEvent], None]):
+    """
+    Register a function called with every timed API call and operation, in every thread.
+
+    Args:
+        callback (Callable[[ProfileEvent], None]): The function to call.
+    """
+    _hooks.append(callback)
+    _change_active(1)
+
+
+def remove_hook(callback: Callable[[ProfileEvent], None]):
+    """
+    Unregister a function added with add_hook.
+
+    Args:
+        callback (Callable[[ProfileEvent], None]): The function to remove.
+
+    Raises:
+        ValueError: If the function is not registered.
+    """
+    _hooks.remove(callback)
+    _change_active(-1)
+
+
+@contextmanager
+def profile(slowest: int = 10) -> Iterator[Profile]:
+    """
+    Record the instrumented calls made in the current thread or task inside the block.
+
+    Args:
+        slowest (int): The number of slowest API calls kept with their arguments.
+
+    Yields:
+        Profile: The profile being recorded.
+    """
+    recording = Profile(slowest)
+    token = _profiles.set(_profiles.get() + (recording,))
+    _change_active(1)
+    try:
+        yield recording
+    finally:
+        _change_active(-1)
+        _profiles.reset(token)
+
+
+def _emit(event: ProfileEvent):
+    for recording in _profiles.get():
+        recording.record(event)
+    for callback in list(_hooks):
+        callback(event)
+
+
+def api_call(name: str) -> Callable:
+    """
+    Decorate a public function or method whose calls are timed.
+
+    Only the outermost instrumented call is recorded: the API calls and
+    operations it makes are attributed to it.
+
+    Args:
+        name (str): The name of the call in the profiles, e.g. 'Line.intersection'.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorate(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _active or _current_api.get() is not None:
+                return function(*args, **kwargs)
+
+            token = _current_api.set(name)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                _current_api.reset(token)
+                _emit(ProfileEvent(name, None, elapsed, args))
+        return wrapper
+    return decorate
+
+
+def sympy_operation(name: str, function: Callable) -> Callable:
+    """
+    Wrap a SymPy function so that its calls are timed.
+
+    Args:
+        name (str): The name of the operation in the profiles, e.g. 'simplify'.
+        function (Callable): The function to wrap.
+
+    Returns:
+        Callable: The wrapped function.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _active:
+            return function(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            _emit(ProfileEvent(_current_api.get() or DIRECT, name, elapsed, args))
+    return wrapper
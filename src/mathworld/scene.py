@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'scene.py'
+
+from typing import Any, Callable, Iterator
+
+from .elements import Point, Line, Segment
+
+# Marks a node that has never been computed
+_MISSING = object()
+
+
+class Node():
+    # An element of a Scene: an input set by the caller or the result of an operation on other nodes.
+    __slots__ = ('scene', 'name', 'function', 'inputs', 'dependents', 'computations',
+                 '_value', '_error', '_dirty', '_changed', '_seen')
+
+    def __init__(self, scene: 'Scene', name: str | None, function: Callable[..., Any] | None, inputs: tuple):
+        self.scene = scene
+        self.name = name
+        self.function = function
+        self.inputs = inputs
+        self.dependents = []
+        # Number of times the function was called
+        self.computations = 0
+
+        self._value = _MISSING
+        self._error = None
+        self._dirty = function is not None
+        # Revision of the scene at which the value last changed, and the
+        # revisions of the inputs it was computed from
+        self._changed = 0
+        self._seen = None
+
+    def __repr__(self) -> str:
+        kind = 'input' if self.function is None else getattr(self.function, '__qualname__', 'derived')
+        return f"<Node {self.name or hex(id(self))} ({kind})>"
+
+    @property
+    def isinput(self) -> bool:
+        """
+        True if the node is an input, whose value is set with set().
+        """
+        return self.function is None
+
+    @property
+    def value(self) -> Any:
+        """
+        The value of the node, recomputed first if an input it depends on has changed.
+
+        Raises:
+            Exception: The error raised while computing the node or one of the nodes it depends on.
+        """
+        if self._dirty:
+            self.scene._refresh(self)
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def set(self, value: Any):
+        """
+        Change the value of an input node. The nodes that depend on it are
+        recomputed when their value is next read.
+
+        Args:
+            value (Any): The new value.
+
+        Raises:
+            ValueError: If the node is not an input.
+        """
+        self.scene.update({self: value})
+
+
+class Scene():
+    # A graph of constructions that recomputes only the nodes affected by a change of its inputs.
+    def __init__(self):
+        """
+        Initializes an empty scene.
+
+        Nodes are declared with input() and derive(), or with the shortcuts for the
+        operations of the elements (point(), segment(), middle(), intersection(), ...).
+        Values are computed lazily, when they are read, and kept until an input they
+        depend on changes. A recomputed node whose value is equal to the previous one
+        does not invalidate its own dependents.
+
+        A scene is not thread-safe.
+        """
+        self.nodes = []
+        self._names = {}
+        self._revision = 0
+        # Nodes invalidated since the last refresh, and the number of function calls
+        self._invalidated = []
+        self._computations = 0
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.nodes)
+
+    def __getitem__(self, name: str) -> Node:
+        return self._names[name]
+
+    def _add(self, node: Node) -> Node:
+        if node.name is not None:
+            if node.name in self._names:
+                raise ValueError(f"a node named {node.name!r} already exists")
+            self._names[node.name] = node
+        self.nodes.append(node)
+        return node
+
+    def input(self, value: Any, name: str | None = None) -> Node:
+        """
+        Declare an input node.
+
+        Args:
+            value (Any): Its initial value, e.g. a Point.
+            name (str | None): A unique name, to find the node with scene[name].
+
+        Returns:
+            Node: The node.
+
+        Raises:
+            ValueError: If the name is already used.
+        """
+        node = self._add(Node(self, name, None, ()))
+        self._revision += 1
+        node._value, node._changed = value, self._revision
+        return node
+
+    def derive(self, function: Callable[..., Any], *inputs: Node | Any, name: str | None = None) -> Node:
+        """
+        Declare a node computed from other nodes.
+
+        Args:
+            function (Callable[..., Any]): The operation, called with the values of the inputs,
+                e.g. Line.findParallel or Segment.
+            *inputs (Node | Any): The arguments of function: nodes of this scene or constant values.
+            name (str | None): A unique name, to find the node with scene[name].
+
+        Returns:
+            Node: The node, computed when its value is first read.
+
+        Raises:
+            ValueError: If the name is already used or an input belongs to another scene.
+        """
+        for node in inputs:
+            if isinstance(node, Node) and node.scene is not self:
+                raise ValueError("the inputs must belong to the same scene")
+
+        node = self._add(Node(self, name, function, inputs))
+        self._invalidated.append(node)
+        for parent in inputs:
+            if isinstance(parent, Node) and node not in parent.dependents:
+                parent.dependents.append(node)
+        return node
+
+    def update(self, changes: dict[Node, Any]):
+        """
+        Change the values of several input nodes at once.
+
+        An input set to a value equal to the current one invalidates nothing.
+
+        Args:
+            changes (dict[Node, Any]): The new value of every changed input.
+
+        Raises:
+            ValueError: If a node is not an input of this scene.
+        """
+        for node in changes:
+            if node.scene is not self or not node.isinput:
+                raise ValueError(f"{node!r} is not an input of this scene")
+
+        self._revision += 1
+        stack = []
+        for node, value in changes.items():
+            same = _same(value, node._value)
+            node._value = value
+            if not same:
+                node._changed = self._revision
+                stack.extend(node.dependents)
+
+        # Invalidate everything downstream, without recomputing anything yet
+        while stack:
+            node = stack.pop()
+            if not node._dirty:
+                node._dirty = True
+                self._invalidated.append(node)
+                stack.extend(node.dependents)
+
+        if len(self._invalidated) > 2 * len(self.nodes):
+            # Values read without refresh() leave recomputed nodes behind
+            self._invalidated = list(dict.fromkeys(node for node in self._invalidated if node._dirty))
+
+    def refresh(self) -> int:
+        """
+        Recompute every invalidated node now, e.g. once per frame.
+
+        Returns:
+            int: The number of nodes whose function was called.
+        """
+        before = self._computations
+        invalidated, self._invalidated = self._invalidated, []
+        for node in invalidated:
+            if node._dirty:
+                self._refresh(node)
+        return self._computations - before
+
+    def _refresh(self, target: Node):
+        # Bring a node up to date, its inputs first, without recursion so that long
+        # chains of constructions do not hit the recursion limit
+        stack = [target]
+        while stack:
+            node = stack[-1]
+            if not node._dirty:
+                stack.pop()
+                continue
+            pending = [parent for parent in node.inputs if isinstance(parent, Node) and parent._dirty]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            self._compute(node)
+
+    def _compute(self, node: Node):
+        # Every input of the node is up to date
+        node._dirty = False
+        seen = tuple(parent._changed for parent in node.inputs if isinstance(parent, Node))
+        if seen == node._seen:
+            # The inputs were invalidated but came back with the same values
+            return
+        node._seen = seen
+
+        error = next((parent._error for parent in node.inputs
+                      if isinstance(parent, Node) and parent._error is not None), None)
+        value = _MISSING
+        if error is None:
+            node.computations += 1
+            self._computations += 1
+            try:
+                value = node.function(*(parent._value if isinstance(parent, Node) else parent
+                                        for parent in node.inputs))
+            except Exception as exception:
+                error = exception
+
+        if error is None and node._error is None and _same(value, node._value):
+            # Equal to the previous value: the dependents do not need it
+            return
+        node._value, node._error = value, error
+        node._changed = self._revision
+
+    def point(self, x: Any, y: Any, backend: str | None = None, name: str | None = None) -> Node:
+        """
+        Declare an input Point, to be moved with node.set(Point(x, y)).
+        """
+        return self.input(Point(x, y, backend), name)
+
+    def segment(self, point1: Node | Point, point2: Node | Point, name: str | None = None) -> Node:
+        """
+        Declare the Segment between two points.
+        """
+        return self.derive(Segment, point1, point2, name=name)
+
+    def line(self, point1: Node | Point, point2: Node | Point, name: str | None = None) -> Node:
+        """
+        Declare the Line through two points (Line.findLine).
+        """
+        return self.derive(_find_line, point1, point2, name=name)
+
+    def middle(self, segment: Node | Segment, name: str | None = None) -> Node:
+        """
+        Declare the middle point of a segment.
+        """
+        return self.derive(_middle, segment, name=name)
+
+    def perpendicularBisector(self, segment: Node | Segment, name: str | None = None) -> Node:
+        """
+        Declare the perpendicular bisector of a segment.
+        """
+        return self.derive(_perpendicular_bisector, segment, name=name)
+
+    def findParallel(self, line: Node | Line, point: Node | Point, name: str | None = None) -> Node:
+        """
+        Declare the parallel to a line through a point (Line.findParallel).
+        """
+        return self.derive(Line.findParallel, line, point, name=name)
+
+    def findPerpendicular(self, line: Node | Line, point: Node | Point, name: str | None = None) -> Node:
+        """
+        Declare the perpendicular to a line through a point (Line.findPerpendicular).
+        """
+        return self.derive(Line.findPerpendicular, line, point, name=name)
+
+    def intersection(self, line1: Node | Line, line2: Node | Line, name: str | None = None) -> Node:
+        """
+        Declare the intersection of two lines (Line.intersection): a Point, None for
+        parallel lines or the line itself for coincident lines.
+        """
+        return self.derive(Line.intersection, line1, line2, name=name)
+
+
+def _same(value1: Any, value2: Any) -> bool:
+    # Whether a recomputed value can be kept in place of the previous one
+    if value1 is value2:
+        return True
+    elif isinstance(value1, Segment) and isinstance(value2, Segment):
+        return _same(value1.point1, value2.point1) and _same(value1.point2, value2.point2)
+    elif not isinstance(value1, (Point, Line)) or type(value1) is not type(value2):
+        return False
+    # Same backend and same coordinates or canonical coefficients
+    return value1 == value2
+
+
+def _find_line(point1: Point, point2: Point) -> Line:
+    return Line.findLine(point1, point2)
+
+
+def _middle(segment: Segment) -> Point:
+    return segment.middle
+
+
+def _perpendicular_bisector(segment: Segment) -> Line:
+    return segment.perpendicularBisector
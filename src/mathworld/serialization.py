@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'serialization.py'
+
+import io
+import json
+import struct
+from typing import BinaryIO, Iterable, Iterator
+
+from .backend import NUMERIC, SYMPY
+from .elements import (Point, Line, Segment, Circle, sp, _restore_point, _restore_line,
+                       _restore_segment, _restore_circle)
+
+# Start of the binary format, with its version
+MAGIC = b'MWE\x01'
+
+# Element kinds, in the order of their record codes, and their number of values
+_KINDS = ('point', 'line', 'segment', 'circle')
+_SIZES = (2, 3, 4, 3)
+
+_DOUBLES = {count: struct.Struct(f'<{count}d') for count in (2, 3, 4)}
+_INT64 = struct.Struct('<q')
+_LENGTH = struct.Struct('<I')
+
+# Tags of the exact values in the binary format
+_SMALL_INTEGER, _INTEGER, _RATIONAL, _EXPRESSION = b'i', b'I', b'r', b'e'
+
+
+def _values(element: Point | Line | Segment | Circle) -> tuple[str, list]:
+    # The kind and the canonical values of an element
+    if isinstance(element, Point):
+        return 'point', [element.x, element.y]
+    elif isinstance(element, Line):
+        return 'line', [element.a, element.b, element.c]
+    elif isinstance(element, Segment):
+        return 'segment', [element.point1.x, element.point1.y, element.point2.x, element.point2.y]
+    elif isinstance(element, Circle):
+        return 'circle', [element.center.x, element.center.y, element.radius]
+    raise ValueError(f"cannot serialize {type(element).__name__} objects")
+
+
+def _element(kind: str, values: list, backend: str) -> Point | Line | Segment | Circle:
+    # Rebuild an element from its canonical values, without converting or normalizing them again
+    if kind == 'point':
+        return _restore_point(*values, backend)
+    elif kind == 'line':
+        return _restore_line(*values, backend)
+    elif kind == 'segment':
+        return _restore_segment(_restore_point(*values[:2], backend), _restore_point(*values[2:], backend))
+    return _restore_circle(_restore_point(*values[:2], backend), values[2], backend)
+
+
+def _write_integer(value: int, output: list):
+    if -2 ** 63 <= value < 2 ** 63:
+        output.append(_SMALL_INTEGER + _INT64.pack(value))
+    else:
+        data = value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True)
+        output.append(_INTEGER + _LENGTH.pack(len(data)) + data)
+
+
+def _write_exact(value: sp.Expr, output: list):
+    if isinstance(value, sp.Integer):
+        _write_integer(int(value), output)
+    elif isinstance(value, sp.Rational):
+        output.append(_RATIONAL)
+        _write_integer(int(value.p), output)
+        _write_integer(int(value.q), output)
+    else:
+        data = sp.srepr(value).encode('utf-8')
+        output.append(_EXPRESSION + _LENGTH.pack(len(data)) + data)
+
+
+def _record(element: Point | Line | Segment | Circle) -> bytes:
+    kind, values = _values(element)
+    code = 2 * _KINDS.index(kind) + (element.backend == NUMERIC)
+    if element.backend == NUMERIC:
+        return bytes((code,)) + _DOUBLES[len(values)].pack(*values)
+
+    output = [bytes((code,))]
+    for value in values:
+        _write_exact(value, output)
+    return b''.join(output)
+
+
+def dump(elements: Iterable[Point | Line | Segment | Circle], file: BinaryIO) -> int:
+    """
+    Write elements to a binary file in the compact format.
+
+    Numeric values are stored as doubles, exact integers and rationals as
+    integers, other exact values as their SymPy representation.
+
+    Args:
+        elements (Iterable[Point | Line | Segment | Circle]): The elements, of any kind and backend.
+        file (BinaryIO): A file opened for binary writing.
+
+    Returns:
+        int: The number of elements written.
+
+    Raises:
+        ValueError: If an element is not a Point, Line, Segment or Circle.
+    """
+    file.write(MAGIC)
+    count = 0
+    for element in elements:
+        file.write(_record(element))
+        count += 1
+    return count
+
+
+def dumps(elements: Iterable[Point | Line | Segment | Circle]) -> bytes:
+    """
+    Serialize elements in the compact binary format. See dump.
+
+    Returns:
+        bytes: The serialized elements.
+    """
+    output = io.BytesIO()
+    dump(elements, output)
+    return output.getvalue()
+
+
+def _read(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("truncated data")
+    return data
+
+
+def _read_integer(file: BinaryIO) -> int:
+    tag = _read(file, 1)
+    if tag == _SMALL_INTEGER:
+        return _INT64.unpack(_read(file, 8))[0]
+    elif tag == _INTEGER:
+        return int.from_bytes(_read(file, _LENGTH.unpack(_read(file, 4))[0]), 'little', signed=True)
+    raise ValueError(f"invalid integer tag {tag!r}")
+
+
+def _read_exact(file: BinaryIO) -> sp.Expr:
+    tag = file.read(1)
+    if tag == _SMALL_INTEGER:
+        return sp.Integer(_INT64.unpack(_read(file, 8))[0])
+    elif tag == _INTEGER:
+        return sp.Integer(int.from_bytes(_read(file, _LENGTH.unpack(_read(file, 4))[0]), 'little', signed=True))
+    elif tag == _RATIONAL:
+        return sp.Rational(_read_integer(file), _read_integer(file))
+    elif tag == _EXPRESSION:
+        return sp.sympify(_read(file, _LENGTH.unpack(_read(file, 4))[0]).decode('utf-8'))
+    raise ValueError(f"invalid value tag {tag!r}")
+
+
+def load(file: BinaryIO) -> Iterator[Point | Line | Segment | Circle]:
+    """
+    Read elements lazily from a binary file written by dump.
+
+    Exact values that are not rationals are rebuilt with sympify: only load trusted data.
+
+    Args:
+        file (BinaryIO): A file opened for binary reading.
+
+    Returns:
+        Iterator[Point | Line | Segment | Circle]: The elements, in the order they were written.
+
+    Raises:
+        ValueError: If the data is not in the compact format or is truncated.
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a mathworld binary file")
+
+    def elements() -> Iterator[Point | Line | Segment | Circle]:
+        while code := file.read(1):
+            kind_index, numeric = divmod(code[0], 2)
+            if kind_index >= len(_KINDS):
+                raise ValueError(f"invalid record code {code[0]}")
+
+            kind = _KINDS[kind_index]
+            count = _SIZES[kind_index]
+            if numeric:
+                values = list(_DOUBLES[count].unpack(_read(file, 8 * count)))
+            else:
+                values = [_read_exact(file) for _ in range(count)]
+            yield _element(kind, values, NUMERIC if numeric else SYMPY)
+
+    return elements()
+
+
+def loads(data: bytes) -> list[Point | Line | Segment | Circle]:
+    """
+    Deserialize elements from the compact binary format. See load.
+
+    Returns:
+        list[Point | Line | Segment | Circle]: The elements.
+    """
+    return list(load(io.BytesIO(data)))
+
+
+def _json_value(value: sp.Expr | float) -> int | float | str | dict:
+    if isinstance(value, float):
+        return value
+    elif isinstance(value, sp.Integer):
+        return int(value)
+    elif isinstance(value, sp.Rational):
+        return f'{value.p}/{value.q}'
+    return {'srepr': sp.srepr(value)}
+
+
+def _exact_value(value: int | str | dict) -> sp.Expr:
+    if isinstance(value, int):
+        return sp.Integer(value)
+    elif isinstance(value, str):
+        return sp.Rational(value)
+    return sp.sympify(value['srepr'])
+
+
+def to_json(elements: Iterable[Point | Line | Segment | Circle], indent: int | None = None) -> str:
+    """
+    Serialize elements to JSON.
+
+    Every element is a list [kind, backend, *values], e.g. ["line", "sympy", 2, 1, "-3/2"].
+    Exact integers are JSON integers, rationals strings "p/q" and other exact
+    values objects {"srepr": ...}; numeric values are JSON numbers.
+
+    Args:
+        elements (Iterable[Point | Line | Segment | Circle]): The elements, of any kind and backend.
+        indent (int | None): The indentation of the output, None for a single line.
+
+    Returns:
+        str: The JSON document.
+
+    Raises:
+        ValueError: If an element is not a Point, Line, Segment or Circle.
+    """
+    records = []
+    for element in elements:
+        kind, values = _values(element)
+        records.append([kind, element.backend, *map(_json_value, values)])
+    return json.dumps(records, indent=indent)
+
+
+def from_json(text: str) -> list[Point | Line | Segment | Circle]:
+    """
+    Deserialize elements from JSON written by to_json.
+
+    Exact values given as {"srepr": ...} are rebuilt with sympify: only load trusted data.
+
+    Args:
+        text (str): The JSON document.
+
+    Returns:
+        list[Point | Line | Segment | Circle]: The elements.
+
+    Raises:
+        ValueError: If the document is not a list of elements.
+    """
+    elements = []
+    for record in json.loads(text):
+        if not isinstance(record, list) or len(record) < 2 or record[0] not in _KINDS:
+            raise ValueError(f"invalid element {record!r}")
+
+        kind, backend, *values = record
+        if len(values) != _SIZES[_KINDS.index(kind)] or backend not in (SYMPY, NUMERIC):
+            raise ValueError(f"invalid element {record!r}")
+        if backend == NUMERIC:
+            values = [float(value) for value in values]
+        else:
+            values = [_exact_value(value) for value in values]
+        elements.append(_element(kind, values, backend))
+    return elements
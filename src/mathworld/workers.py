@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+__author__ = 'Tobia Petrolini'
+__file__ = 'workers.py'
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from .backend import get_backend, get_tolerance, use_backend
+from .elements import Line, Point
+from .equations import sp, solve_equation, solve_system
+
+
+class SolveTimeout(TimeoutError):
+    # Raised when an operation run in a worker process exceeds its timeout
+    pass
+
+
+def _serve(connection):
+    # Main loop of a worker process: run the calls received until the pipe is closed
+    while True:
+        try:
+            function, args, kwargs, backend, tolerance = connection.recv()
+        except (EOFError, OSError):
+            return
+
+        try:
+            # The caller's backend settings, which are not inherited by the process
+            with use_backend(backend, tolerance):
+                result = (True, function(*args, **kwargs))
+        except Exception as error:
+            result = (False, error)
+
+        try:
+            connection.send(result)
+        except Exception as error:
+            # The result or the exception can not be pickled
+            connection.send((False, RuntimeError(f"the worker could not send back the result: {error}")))
+
+
+class _Worker():
+    # A worker process and the pipe used to send it calls.
+    def __init__(self, context):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def send(self, function: Callable, args: tuple, kwargs: dict):
+        self.connection.send((function, args, kwargs, get_backend(), get_tolerance()))
+
+    def receive(self) -> Any:
+        try:
+            ok, value = self.connection.recv()
+        except (EOFError, OSError):
+            self.kill()
+            raise RuntimeError("the worker process died during the call") from None
+        if ok:
+            return value
+        raise value
+
+    def kill(self):
+        # The pipe is left to the garbage collector: a thread may still be polling it
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _timed_out(function: Callable, timeout: float | None) -> SolveTimeout:
+    return SolveTimeout(f"{getattr(function, '__qualname__', function)} timed out after {timeout} s")
+
+
+class WorkerPool():
+    # Worker processes running operations that can be stopped, one call per worker at a time.
+    def __init__(self, max_idle: int | None = None, start_method: str | None = None,
+                 max_workers: int | None = None):
+        """
+        Initializes the pool. Processes are started on demand.
+
+        Args:
+            max_idle (int | None): The number of idle processes kept for later calls,
+                the number of CPUs if None.
+            start_method (str | None): The multiprocessing start method, the default one if None.
+            max_workers (int | None): The number of calls running at a time, the number of CPUs
+                if None. The other calls wait for a worker, within their timeout.
+
+        Raises:
+            ValueError: If max_workers is not positive.
+        """
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        if self.max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {self.max_workers}")
+        self.max_idle = self.max_workers if max_idle is None else max_idle
+        self._context = multiprocessing.get_context(start_method)
+        self._idle = []
+        self._lock = threading.Lock()
+
+        # Calls holding a worker, the synchronous calls waiting for one and the
+        # (loop, future) of the asynchronous ones
+        self._busy = 0
+        self._slots = threading.Condition(self._lock)
+        self._waiters = deque()
+        # Threads starting and waiting for the processes of the async calls, one per
+        # running call, so that they never queue behind other work of the event loop
+        self._threads = None
+
+    def _take(self) -> _Worker | None:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                worker.kill()
+        return None
+
+    def _release(self, worker: _Worker):
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(worker)
+                return
+        worker.connection.close()
+        worker.kill()
+
+    def _reserve(self, deadline: float | None) -> bool:
+        # Wait for a free slot until the deadline
+        with self._slots:
+            while self._busy >= self.max_workers:
+                remaining = _remaining(deadline)
+                if remaining == 0:
+                    return False
+                self._slots.wait(remaining)
+            self._busy += 1
+            return True
+
+    async def _areserve(self, deadline: float | None) -> bool:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._busy < self.max_workers:
+                self._busy += 1
+                return True
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+
+        try:
+            await asyncio.wait_for(waiter, _remaining(deadline))
+            return True
+        except BaseException as error:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, waiter))
+                    queued = True
+                except ValueError:
+                    queued = False
+            if not queued and waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait ended
+                self._free()
+            if isinstance(error, asyncio.TimeoutError):
+                return False
+            raise
+
+    def _free(self):
+        # Hand the slot over to the first async call waiting for one, or to a synchronous call
+        with self._slots:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._hand, waiter)
+                    return
+                except RuntimeError:
+                    # The event loop of the waiter is closed
+                    continue
+            self._busy -= 1
+            self._slots.notify()
+
+    def _hand(self, waiter: asyncio.Future):
+        # In the event loop of the waiter, which may have stopped waiting
+        if waiter.done():
+            self._free()
+        else:
+            waiter.set_result(None)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(self.max_workers, thread_name_prefix='mathworld-worker')
+            return self._threads
+
+    def run(self, function: Callable, *args, timeout: float | None = None, **kwargs) -> Any:
+        """
+        Call a function in a worker process.
+
+        Args:
+            function (Callable): The function to call, with the arguments that follow.
+                It, its arguments and its result must be picklable.
+            timeout (float | None): The seconds after which the call is abandoned and its
+                worker killed, including the wait for a worker, None to wait forever.
+
+        Returns:
+            Any: The value returned by the function.
+
+        Raises:
+            SolveTimeout: If the call takes longer than timeout.
+            RuntimeError: If the worker process dies during the call.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._reserve(deadline):
+            raise _timed_out(function, timeout)
+        try:
+            worker = self._take() or _Worker(self._context)
+            try:
+                worker.send(function, args, kwargs)
+            except BaseException:
+                self._release(worker)
+                raise
+            try:
+                ready = worker.connection.poll(_remaining(deadline))
+            except BaseException:
+                worker.kill()
+                raise
+            if not ready:
+                worker.kill()
+                raise _timed_out(function, timeout)
+            try:
+                return worker.receive()
+            finally:
+                if worker.process.is_alive():
+                    self._release(worker)
+        finally:
+            self._free()
+
+    async def arun(self, function: Callable, *args, timeout: float | None = None, **kwargs) -> Any:
+        """
+        Call a function in a worker process without blocking the event loop.
+
+        Cancelling the task kills the worker process.
+
+        Args:
+            function (Callable): The function to call, with the arguments that follow.
+                It, its arguments and its result must be picklable.
+            timeout (float | None): The seconds after which the call is abandoned and its
+                worker killed, including the wait for a worker, None to wait forever.
+
+        Returns:
+            Any: The value returned by the function.
+
+        Raises:
+            SolveTimeout: If the call takes longer than timeout.
+            RuntimeError: If the worker process dies during the call.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not await self._areserve(deadline):
+            raise _timed_out(function, timeout)
+
+        loop = asyncio.get_running_loop()
+        worker = self._take()
+        if worker is None:
+            # Starting a process blocks for milliseconds: not on the event loop
+            start = loop.run_in_executor(self._executor(), _Worker, self._context)
+            try:
+                worker = await asyncio.shield(start)
+            except BaseException:
+                # The process is started anyway: keep it, and the slot until then
+                start.add_done_callback(self._started)
+                raise
+
+        try:
+            try:
+                worker.send(function, args, kwargs)
+                # The wait runs in a thread of the pool, which returns as soon as the worker is killed
+                ready = await loop.run_in_executor(self._executor(), worker.connection.poll, _remaining(deadline))
+            except BaseException:
+                worker.kill()
+                raise
+            if not ready:
+                worker.kill()
+                raise _timed_out(function, timeout)
+            try:
+                return worker.receive()
+            finally:
+                if worker.process.is_alive():
+                    self._release(worker)
+        finally:
+            self._free()
+
+    def _started(self, start: asyncio.Future):
+        # A process started for a call that was cancelled meanwhile, or that failed to start
+        if not start.cancelled() and start.exception() is None:
+            self._release(start.result())
+        self._free()
+
+    def shutdown(self):
+        """
+        Stop the idle worker processes.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+            threads, self._threads = self._threads, None
+        for worker in idle:
+            worker.connection.close()
+            worker.kill()
+        if threads is not None:
+            threads.shutdown(wait=False)
+
+
+# The pool used by the timeout= arguments and the async functions
+POOL = WorkerPool()
+
+
+def run(function: Callable, *args, timeout: float | None = None, **kwargs) -> Any:
+    """
+    Call a function in a process of the default pool. See WorkerPool.run.
+    """
+    return POOL.run(function, *args, timeout=timeout, **kwargs)
+
+
+async def arun(function: Callable, *args, timeout: float | None = None, **kwargs) -> Any:
+    """
+    Call a function in a process of the default pool without blocking the event loop. See WorkerPool.arun.
+    """
+    return await POOL.arun(function, *args, timeout=timeout, **kwargs)
+
+
+async def aline(equation: str | sp.Equality, backend: str | None = None, timeout: float | None = None) -> Line:
+    """
+    Build a Line in a worker process. See Line.__init__.
+    """
+    return await arun(Line, equation, backend, timeout=timeout)
+
+
+async def aintersection(line1: Line, line2: Line, timeout: float | None = None) -> Point | Line | None:
+    """
+    Compute the intersection of two lines in a worker process. See Line.intersection.
+
+    Returns:
+        Point | Line | None: The intersection point, None if the lines are parallel
+        or line1 itself if the lines are coincident.
+    """
+    result = await arun(Line.intersection, line1, line2, timeout=timeout)
+    return line1 if isinstance(result, Line) else result
+
+
+async def afind_point(line: Line, point: Point, distance, timeout: float | None = None) -> tuple[Point, Point | None]:
+    """
+    Find the points at a distance from a point of a line in a worker process. See Point.findPoint.
+    """
+    return await arun(Point.findPoint, line, point, distance, timeout=timeout)
+
+
+async def asolve_equation(_equation: str, variable: str = 'x', timeout: float | None = None) -> tuple[sp.Expr] | None:
+    """
+    Solve an equation in a worker process. See solve_equation.
+    """
+    return await arun(solve_equation, _equation, variable, timeout=timeout)
+
+
+async def asolve_system(equations: list[str], variables: list[str],
+                        timeout: float | None = None) -> tuple[tuple[sp.Expr]] | None:
+    """
+    Solve a system of equations in a worker process. See solve_system.
+    """
+    return await arun(solve_system, equations, variables, timeout=timeout)
@@ -0,0 +1,191 @@
+import itertools
+import random
+
+import pytest
+from mathworld import Point, Segment, Polygon, Triangle, sp
+from mathworld.algorithms import segment_intersections, convex_hull, closest_pair, delaunay, \
+    delaunay_triangles, delaunay_edges
+
+
+def brute_force(segments):
+    return [(i, j) for i, j in itertools.combinations(range(len(segments)), 2)
+            if segments[i].line.intersection(segments[j].line) is not None
+            and _shares_point(segments[i], segments[j])]
+
+
+def _shares_point(s, t):
+    common = s.line.intersection(t.line)
+    if isinstance(common, Point):
+        return common.ison(s) and common.ison(t)
+    # Collinear segments: one of the endpoints lies on the other segment
+    return any(p.ison(t) for p in (s.point1, s.point2)) or any(p.ison(s) for p in (t.point1, t.point2))
+
+
+def test_segment_intersections():
+    segments = [
+        Segment(Point(0, 0), Point(4, 4)),  # 0
+        Segment(Point(0, 4), Point(4, 0)),  # 1: crosses 0 at (2, 2)
+        Segment(Point(2, -1), Point(2, 5)),  # 2: vertical through (2, 2)
+        Segment(Point(3, 3), Point(6, 6)),  # 3: overlaps 0
+        Segment(Point(5, 0), Point(7, 0)),  # 4: isolated
+        Segment(Point(6, 6), Point(8, 2)),  # 5: touches 3 at its endpoint
+        Segment(Point('1/2', 0), Point('1/2', 0)),  # 6: a single point, on nothing
+        Segment(Point(1, 1), Point(1, 1)),  # 7: a single point on 0
+    ]
+    assert segment_intersections(segments) == [
+        (0, 1), (0, 2), (0, 3), (0, 7), (1, 2), (3, 5)]
+
+
+def test_segment_intersections_random():
+    random.seed(0)
+    for _ in range(30):
+        segments = [Segment(Point(random.randint(0, 5), random.randint(0, 5)),
+                            Point(random.randint(0, 5), random.randint(0, 5)))
+                    for _ in range(8)]
+        segments = [s for s in segments if s.point1.cordinates != s.point2.cordinates]
+        assert segment_intersections(segments) == brute_force(segments)
+
+    floats = [Segment(Point(random.uniform(0, 10), random.uniform(0, 10), backend='numeric'),
+                      Point(random.uniform(0, 10), random.uniform(0, 10), backend='numeric'))
+              for _ in range(30)]
+    assert segment_intersections(floats) == brute_force([s.to_exact() for s in floats])
+
+
+def test_segment_intersections_symbolic():
+    with pytest.raises(ValueError):
+        segment_intersections([Segment(Point(0, 0), Point(sp.sqrt(2), 1))])
+
+
+def _hull_brute_force(points):
+    # The vertices with a supporting line leaving every other point strictly on one side
+    coordinates = [(float(p.x), float(p.y)) for p in points]
+    unique = sorted(set(coordinates))
+    if len(unique) < 3:
+        return set(unique)
+    vertices = set()
+    for a, b in itertools.permutations(unique, 2):
+        sides = [(b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]) for c in unique]
+        if all(side >= 0 for side in sides):
+            # Endpoints of a hull edge, except points in the middle of it
+            collinear = [c for c, side in zip(unique, sides) if side == 0]
+            vertices |= {min(collinear), max(collinear)}
+    return vertices
+
+
+def _delaunay_invariants(points, triangles):
+    # Counterclockwise triangles with empty circumcircles, covering the hull
+    points = [Point(sp.Rational(p.x), sp.Rational(p.y)) for p in points]
+    coordinates = [p.cordinates for p in points]
+    for i, j, k in triangles:
+        (ax, ay), (bx, by), (cx, cy) = coordinates[i], coordinates[j], coordinates[k]
+        assert i < j and i < k and (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) > 0
+        center = Triangle(points[i], points[j], points[k]).circumcenter
+        radius = (ax - center.x) ** 2 + (ay - center.y) ** 2
+        assert all((x - center.x) ** 2 + (y - center.y) ** 2 >= radius for x, y in coordinates)
+    hull = convex_hull(points)
+    if len(hull) >= 3:
+        area = sum(Triangle(*(points[index] for index in triangle)).area for triangle in triangles)
+        assert area == Polygon([points[index] for index in hull]).area
+
+
+def test_convex_hull():
+    points = [Point(0, 0), Point(2, 0), Point(1, 1), Point(2, 2), Point(0, 2), Point(1, 0), Point(2, 2)]
+    assert convex_hull(points) == [0, 1, 3, 4]
+    assert convex_hull([Point(1, 1)]) == [0]
+    assert convex_hull([Point(1, 1), Point(1, 1)]) == [0]
+    assert convex_hull([Point(0, 0), Point(1, 1), Point(2, 2), Point('1/2', '1/2')]) == [0, 2]
+    assert convex_hull([]) == []
+
+    random.seed(2)
+    for _ in range(30):
+        points = [Point(random.randint(0, 6), sp.Rational(random.randint(0, 12), 2)) for _ in range(random.randint(1, 25))]
+        hull = convex_hull(points)
+        assert {(float(points[i].x), float(points[i].y)) for i in hull} == _hull_brute_force(points)
+        if len(hull) >= 3:
+            assert Polygon([points[i] for i in hull]).signedArea > 0
+
+    with pytest.raises(ValueError):
+        convex_hull([Point(0, 0), Point(1, 0), Point(sp.sqrt(2), 1)])
+
+
+def test_closest_pair():
+    assert closest_pair([Point(0, 0), Point(5, 5), Point(1, 1), Point(5, 6)]) == (1, 3)
+    assert closest_pair([Point(3, 3), Point(0, 0), Point(3, 3)]) == (0, 2)
+
+    random.seed(3)
+    for _ in range(30):
+        points = [Point(random.randint(-40, 40), sp.Rational(random.randint(-80, 80), 3)) for _ in range(random.randint(2, 40))]
+        squared = lambda p, q: (p.x - q.x) ** 2 + (p.y - q.y) ** 2
+        i, j = closest_pair(points)
+        assert i < j
+        assert squared(points[i], points[j]) == min(squared(p, q) for p, q in itertools.combinations(points, 2))
+
+    with pytest.raises(ValueError):
+        closest_pair([Point(0, 0)])
+
+
+def test_delaunay():
+    # A square: two triangles on one of the diagonals, whose four points are cocircular
+    assert len(delaunay([Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)])) == 2
+    assert delaunay([Point(0, 0), Point(1, 1), Point(2, 2)]) == []
+    assert delaunay([Point(0, 0), Point(1, 0), Point(0, 0), Point(0, 1)]) == [(0, 1, 3)]
+
+    grid = [Point(i, j) for i in range(5) for j in range(5)]
+    triangles = delaunay(grid)
+    assert len(triangles) == 32
+    _delaunay_invariants(grid, triangles)
+
+    random.seed(4)
+    for _ in range(10):
+        points = [Point(random.randint(0, 8), random.randint(0, 8)) for _ in range(random.randint(3, 30))]
+        _delaunay_invariants(points, delaunay(points))
+    points = [Point(random.uniform(0, 1), random.uniform(0, 1), backend='numeric') for _ in range(40)]
+    _delaunay_invariants(points, delaunay(points))
+
+
+def test_point_array_algorithms():
+    np = pytest.importorskip('numpy')
+    from mathworld.arrays import PointArray
+
+    generator = np.random.default_rng(0)
+    for n in (2, 5, 50, 2000):
+        array = PointArray(generator.integers(0, 100, n), generator.integers(0, 100, n))
+        points = [Point(int(x), int(y)) for x, y in zip(array.x, array.y)]
+
+        hull = convex_hull(array)
+        assert isinstance(hull, np.ndarray) and hull.tolist() == convex_hull(points)
+
+        i, j = closest_pair(array)
+        k, m = closest_pair(points)
+        assert points[i].distancePoint(points[j]) == points[k].distancePoint(points[m])
+
+    array = PointArray(generator.uniform(0, 1, 300), generator.uniform(0, 1, 300))
+    triangles = delaunay(array)
+    assert triangles.shape[1] == 3
+    assert triangles.tolist() == [list(triangle) for triangle in delaunay(array.to_points())]
+    assert delaunay(array, exact=True).tolist() == triangles.tolist()
+
+    # Duplicates keep their first index and collinear points have no triangles, on both paths
+    for exact in (False, True):
+        array = PointArray([1, 0, 1, 0, 0, 1, 2], [1, 0, 0, 0, 1, 1, 3])
+        triangles = delaunay(array, exact=exact)
+        assert len(triangles) == 4 and not set(triangles.ravel().tolist()) & {3, 5}
+        _delaunay_invariants(array.to_points(), triangles.tolist())
+        assert delaunay(PointArray([0, 1, 2, 1], [0, 1, 2, 1]), exact=exact).shape == (0, 3)
+        assert delaunay(PointArray([], []), exact=exact).shape == (0, 3)
+
+
+def test_delaunay_triangles_edges():
+    points = [Point(0, 0), Point(2, 0), Point(1, 1), Point(2, 2), Point(0, 2), Point(1, 0)]
+    triangles = delaunay_triangles(points)
+    assert all(isinstance(triangle, Triangle) for triangle in triangles)
+    assert len(triangles) == 5 and sum(triangle.area for triangle in triangles) == 4
+    assert [tuple(points.index(p) for p in triangle.vertices) for triangle in triangles] == delaunay(points)
+
+    edges = delaunay_edges(points)
+    assert all(isinstance(edge, Segment) for edge in edges)
+    pairs = [(points.index(edge.point1), points.index(edge.point2)) for edge in edges]
+    assert pairs == sorted(pairs) and len(pairs) == 10
+    assert set(pairs) == {(min(u, v), max(u, v)) for i, j, k in delaunay(points)
+                          for u, v in ((i, j), (j, k), (k, i))}
+    assert delaunay_edges([Point(0, 0), Point(1, 1)]) == []
@@ -0,0 +1,155 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from mathworld import Point, Line, Segment, Polygon, sp
+from mathworld.arrays import PointArray, LineArray
+
+
+def test_point_array():
+    points = [Point(3, 4), Point(-3, -4), Point(0, 2), Point(1.5, -2)]
+    array = PointArray.from_points(points)
+
+    assert len(array) == 4
+    assert array.quadrant().tolist() == [1, 3, 0, 4]
+    assert str(array[0]) == "(3.0, 4.0)"
+    # A round trip keeps the float values in numeric points, as LineArray does for lines
+    assert array[0].backend == 'numeric' and array.to_points()[3] == Point(1.5, -2, backend='numeric')
+    assert len(array[1:]) == 3
+
+    origin = Point(0, 0)
+    expected = [float(point.distancePoint(origin)) for point in points]
+    assert np.allclose(array.distance_to_point(origin), expected)
+
+    line = Line("y = 2*x + 1")
+    expected = [float(point.distanceLine(line)) for point in points]
+    assert np.allclose(array.distance_to_line(line), expected)
+
+    with pytest.raises(ValueError):
+        PointArray([1, 2], [1])
+
+
+def test_point_array_incidence():
+    array = PointArray([0, 1, 3, 6, 9, 1], [1, 3, 7, 8, 19, 2])
+    line = Line("y = 2*x + 1")
+    assert array.on_line(line).tolist() == [True, True, True, False, True, False]
+
+    segment = Segment(Point(0, 1), Point(3, 7))
+    expected = [Point(x, y).ison(segment) for x, y in zip([0, 1, 3, 6, 9, 1], [1, 3, 7, 8, 19, 2])]
+    assert array.on_segment(segment).tolist() == expected == [True, True, True, False, False, False]
+
+    vertical = Line("x = 1")
+    assert array.on_line(vertical).tolist() == [False, True, False, False, False, True]
+    assert np.allclose(array.distance_to_line(vertical), [1, 0, 2, 5, 8, 0])
+
+    symbolic = Line.findLine(slope=sp.Symbol('k'), intercept=1)
+    with pytest.raises(ValueError):
+        array.distance_to_line(symbolic)
+
+
+def test_point_array_in_polygon():
+    generator = np.random.default_rng(0)
+    polygon = Polygon.from_coordinates([0, 4, 0, 1, -2], [0, 2, 4, 2, 1])
+    # Integer points, many of them on the boundary and on the horizontals through the vertices
+    array = PointArray(generator.integers(-3, 6, 300), generator.integers(-1, 6, 300))
+    expected = [polygon.contains(point) for point in array.to_points()]
+    assert array.in_polygon(polygon).tolist() == expected
+    assert array.in_polygon(polygon.to_numeric()).tolist() == expected
+
+    with pytest.raises(ValueError):
+        array.in_polygon(Polygon.from_coordinates([0, 1, sp.Symbol('t')], [0, 0, 1]))
+
+
+def random_lines(n: int) -> list[Line]:
+    # Few directions and offsets, so that there are many parallel and coincident lines
+    generator = np.random.default_rng(0)
+    directions = [(1, 0), (0, 1), (1, 1), (1, -1), (2, 1), (-1, 2), (3, 7)]
+    lines = []
+    for _ in range(n):
+        a, b = directions[generator.integers(len(directions))]
+        scale = float(generator.choice([1, -2, 0.5]))
+        lines.append(Line.from_coefficients(a * scale, b * scale, float(generator.integers(-3, 4)) * scale,
+                                            backend='numeric'))
+    return lines
+
+
+def test_line_array():
+    lines = [Line("y = 2*x + 1"), Line("x = 3"), Line.from_coefficients(-4, 2, -2)]
+    array = LineArray.from_lines(lines)
+
+    assert len(array) == 3
+    assert str(array) == "LineArray(3 lines)"
+    assert array[0] == Line.from_coefficients(-2, 1, -1, backend='numeric')
+    assert array[1] == lines[1].to_numeric()
+    assert [line == array[i] for i, line in enumerate(array.to_lines())] == [True] * 3
+    assert len(array[1:]) == 2
+    assert np.allclose(np.hypot(array.a, array.b), 1)
+
+    with pytest.raises(ValueError):
+        LineArray([0, 1], [0, 1], [1, 1])
+    with pytest.raises(ValueError):
+        LineArray([1], [1, 2], [0])
+
+
+def test_line_array_groups():
+    lines = random_lines(80)
+    array = LineArray.from_lines(lines)
+
+    labels = array.directions()
+    perpendicular = array.perpendicular_directions()
+    unique, inverse = array.unique()
+    for i, line1 in enumerate(lines):
+        for j, line2 in enumerate(lines):
+            assert (labels[i] == labels[j]) == line1.isParallel(line2)
+            assert (perpendicular[i] == labels[j]) == line1.isPerpendicular(line2)
+            assert (inverse[i] == inverse[j]) == (line1.intersection(line2) is line1)
+        assert np.allclose(unique[int(inverse[i])]._unit_coefficients(), line1._unit_coefficients())
+
+    groups = array.parallel_groups()
+    assert sorted(len(group) for group in groups) == sorted(np.bincount(labels).tolist())
+    assert all(len(set(labels[group].tolist())) == 1 for group in groups)
+    assert len(array.coincident_groups(min_size=1)) == len(unique)
+    assert all(len(group) >= 2 for group in array.coincident_groups())
+
+
+def test_line_array_wrap_around():
+    # Nearly vertical lines on both sides of x = 0, whose normals are opposite
+    array = LineArray([1, -1, 1, 0], [0, 1e-12, -1e-12, 1], [0, 0, 1, 2])
+    # Labels follow the angles of the normals, from the horizontal line
+    assert array.directions().tolist() == [1, 1, 1, 0]
+    assert array.perpendicular_directions().tolist() == [0, 0, 0, 1]
+    assert array.unique()[1].tolist() == [0, 0, 1, 2]
+
+
+def test_line_array_intersections():
+    lines = random_lines(60)
+    array = LineArray.from_lines(lines)
+
+    points = array.intersect(array[::-1])
+    for line1, line2, x, y in zip(lines, lines[::-1], points.x, points.y):
+        point = line1.intersection(line2)
+        if isinstance(point, Point):
+            assert np.allclose([x, y], [point.x, point.y])
+        else:
+            assert np.isnan(x) and np.isnan(y)
+
+    line = Line("y = x/2 - 1")
+    points = array.intersect(line)
+    assert np.array_equal(np.isnan(points.x), [line.isParallel(other) for other in lines])
+
+    found = {}
+    for i, j, points in array.intersections(block_size=7):
+        assert np.all(i < j)
+        found.update(((a, b), (x, y)) for a, b, x, y in zip(i.tolist(), j.tolist(), points.x, points.y))
+    for i, line1 in enumerate(lines):
+        for j in range(i + 1, len(lines)):
+            point = line1.intersection(lines[j])
+            assert ((i, j) in found) == isinstance(point, Point)
+            if isinstance(point, Point):
+                assert np.allclose(found[i, j], [point.x, point.y])
+
+    count = sum(len(i) for i, _, _ in array[:10].intersections(array[10:]))
+    assert count == sum(not line1.isParallel(line2) for line1 in lines[:10] for line2 in lines[10:])
+
+    with pytest.raises(ValueError):
+        array.intersect(array[:5])
@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+from mathworld import Point, Line, Segment, sp, SYMPY, NUMERIC, get_backend, set_backend, use_backend, get_tolerance
+
+
+def test_backend_selection():
+    assert get_backend() == SYMPY
+    assert Point(0.5, 1).x == sp.Rational(1, 2)
+    assert Point(0.5, 1, backend=NUMERIC).x == 0.5
+
+    with use_backend(NUMERIC, tolerance=1e-6):
+        assert get_tolerance() == 1e-6
+        point = Point(0.5, '1/4')
+        assert isinstance(point.x, float) and point.y == 0.25
+
+        # Other threads keep the default backend
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(get_backend()))
+        thread.start()
+        thread.join()
+        assert seen == [SYMPY]
+
+    assert get_backend() == SYMPY
+    set_backend(NUMERIC)
+    try:
+        assert Line("y = 2x + 1").backend == NUMERIC
+    finally:
+        set_backend(SYMPY)
+
+    with pytest.raises(ValueError):
+        set_backend('float')
+    with pytest.raises(ValueError):
+        Point('k', 1, backend=NUMERIC)
+
+
+def test_numeric_operations():
+    with use_backend(NUMERIC):
+        line1 = Line("y = 2*x + 3")
+        line2 = Line("y = -1*x/2 - 2")
+        point = Point(1, 2)
+
+        assert line1.slope == 2.0 and line1.intercept == 3.0
+        assert line1.isPerpendicular(line2)
+        assert line1.isParallel(Line("y = 2*x + 7"))
+        assert Line("x = 3").isVertical() and Line("y = 3").isHorizontal()
+
+        intersection = line1.intersection(line2)
+        assert intersection.x == pytest.approx(-2) and intersection.y == pytest.approx(-1)
+        assert line1.intersection(Line("y = 2*x")) is None
+        assert line1.intersection(Line("2*y = 4*x + 6")) is line1
+
+        assert line1.findParallel(point).intercept == pytest.approx(0)
+        assert line1.findPerpendicular(point).slope == pytest.approx(-0.5)
+        assert point.distanceLine(line1) == pytest.approx(3 / 5**0.5)
+
+        for bisector in line1.findBisector(line2):
+            assert bisector.isBisector(line1, line2)
+            assert intersection.ison(bisector)
+
+        first, second = Point.findPoint(Line("y = -x + 5"), Point(3, 2), 2)
+        assert first.distancePoint(Point(3, 2)) == pytest.approx(2)
+        assert second.ison(Line("y = -x + 5"))
+
+        segment = Segment(Point(0, 0), Point(6, 8))
+        assert segment.length == 10.0
+        assert segment.perpendicularBisector.isPerpendicularBisector(segment)
+        assert Point(3, 4.0000000001).ison(segment)
+
+
+def test_backend_conversion():
+    exact = Line.findLine(Point(1, 2), Point(4, 7))
+    numeric = exact.to_numeric()
+    assert numeric.backend == NUMERIC
+    assert numeric.slope == pytest.approx(5 / 3)
+    assert str(Line("y = x/4 + 1/2", backend=NUMERIC).to_exact()) == "y = x/4 + 1/2"
+
+    # Mixing backends computes with floats
+    point = Point(1, 1, backend=NUMERIC)
+    assert exact.findParallel(point).backend == NUMERIC
+    assert isinstance(point.distanceLine(exact), float)
+
+    segment = Segment(Point(0, 0), Point(6, 8, backend=NUMERIC))
+    assert segment.point1.backend == NUMERIC
+    assert segment.to_exact().length == 10
+    assert Point(0.1, 0.2, backend=NUMERIC).to_exact().x == sp.Rational(1, 10)
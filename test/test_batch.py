@@ -0,0 +1,58 @@
+import os
+
+import pytest
+from mathworld import solve_equation, solve_system
+from mathworld.batch import _batch, solve_equations_batch, solve_systems_batch
+
+
+def _square_or_crash(value):
+    if value == 13:
+        # A worker dying without an exception, as in a crash of native code
+        os._exit(1)
+    return value * value
+
+
+def test_solve_equation_without_solutions():
+    assert solve_equation('x = x + 1') is None
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_solve_equations_batch(workers):
+    equations = ['x**2 - 4 = 0', 'x = x + 1', 'x  **2 - 4 = 0', ('2*y = 6', 'y'), 'x = = 1', 3, 'x**2 - 4 = 0']
+    results = list(solve_equations_batch(equations, workers=workers, chunksize=2))
+
+    assert [result.index for result in results] == list(range(len(equations)))
+    assert set(results[0].value) == {-2, 2} and results[0].ok
+    assert results[1].value is None and results[1].ok
+    assert results[2].value == results[0].value == results[6].value
+    assert results[3].value == (3,)
+    assert not results[4].ok and results[4].value is None
+    assert results[5].error.startswith('AttributeError')
+
+
+def test_solve_systems_batch():
+    systems = [[f'x + y = {i % 3}', 'x - y = 1'] for i in range(12)] + [['x = 1', 'x = 2']]
+    results = list(solve_systems_batch(systems, ['x', 'y'], workers=2, chunksize=1, ordered=False))
+
+    assert sorted(result.index for result in results) == list(range(len(systems)))
+    for result in results:
+        assert result.value == solve_system(systems[result.index], ['x', 'y'])
+
+    pairs = [(['2*x = 1'], ['x']), (['x*y = 2', 'x + y = 3'], ['x', 'y'])]
+    assert [result.value for result in solve_systems_batch(pairs, workers=1)] == \
+        [solve_system(*pair) for pair in pairs]
+
+    with pytest.raises(ValueError):
+        solve_systems_batch(systems, workers=0)
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_batch_worker_crash(ordered):
+    results = list(_batch(_square_or_crash, range(40), lambda item: (item, (item,)),
+                          workers=2, chunksize=2, ordered=ordered))
+
+    assert sorted(result.index for result in results) == list(range(40))
+    failed = [result for result in results if not result.ok]
+    assert [result.index for result in failed] == [13]
+    assert failed[0].error.startswith('BrokenProcessPool')
+    assert all(result.value == result.index ** 2 for result in results if result.ok)
@@ -0,0 +1,189 @@
+import gc
+import threading
+import weakref
+
+import pytest
+from mathworld import sp, expression, equation, read, Line, Point, use_backend, memo_info, clear_memo, configure_memo
+from mathworld.cache import LRUCache, WeakLRUCache
+from mathworld.equations import PARSE_CACHE, parse_cache_info, clear_parse_cache, configure_parse_cache
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)  # evicts 'b', the least recently used entry
+
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 1, 2, 2)
+
+    cache.configure(maxsize=1)
+    assert len(cache) == 1
+    cache.configure(enabled=False)
+    cache.put('d', 4)
+    assert cache.get('d') is None and len(cache) == 0
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+
+
+def test_lru_cache_threads():
+    cache = LRUCache(maxsize=64)
+
+    def work(offset):
+        for i in range(1000):
+            cache.put((offset + i) % 100, i)
+            cache.get(i % 100)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 64
+    assert cache.info().hits + cache.info().misses == 8000
+
+
+@pytest.mark.parametrize('text', ['y = 2*x + 1', '3y - 1 = 2x/5', 'x = 0', 'sqrt(2)*x + k', '0.5*x'])
+def test_parse_cache_matches_uncached(text):
+    clear_parse_cache()
+    try:
+        cached = read(text)
+        again = read('  ' + text.replace(' ', '   ') + ' ')
+        configure_parse_cache(enabled=False)
+        uncached = read(text)
+    finally:
+        configure_parse_cache(enabled=True)
+
+    assert again is cached
+    assert sp.srepr(cached) == sp.srepr(uncached)
+
+
+def test_parse_cache_statistics():
+    clear_parse_cache()
+    Line("y = 0")
+    misses = parse_cache_info().misses
+    Line("y = 0")
+    Line("y  =  0")
+
+    info = parse_cache_info()
+    assert info.misses == misses
+    assert info.hits == 2
+    assert isinstance(expression("x + 1"), sp.Expr)
+    assert isinstance(equation("x + 1 = 0"), sp.Equality)
+
+    configure_parse_cache(maxsize=1)
+    try:
+        expression("x + 2")
+        expression("x + 3")
+        assert len(PARSE_CACHE) == 1
+    finally:
+        configure_parse_cache(maxsize=4096)
+
+
+def test_weak_lru_cache():
+    class Value:
+        pass
+
+    cache = WeakLRUCache(maxsize=1)
+    kept, dropped = Value(), Value()
+    cache.put('kept', kept)
+    cache.put('dropped', dropped)
+    cache.put('number', 3)
+    assert len(cache) == 1 and cache.get('number') == 3
+
+    # Evicted, but found again while referenced elsewhere
+    assert cache.get('kept') is kept
+    del dropped
+    gc.collect()
+    assert cache.get('dropped') is None
+    cache.put('other', Value())
+    assert cache.get('number') is None
+    assert cache.info().hits == 2
+
+    cache.configure(enabled=False)
+    assert cache.get('kept') is None
+    cache.configure(enabled=True)
+    assert cache.get('kept') is None
+
+
+@pytest.fixture
+def memo():
+    clear_memo()
+    configure_memo(enabled=True)
+    try:
+        yield
+    finally:
+        configure_memo(enabled=False, maxsize=1024)
+
+
+def test_memo_disabled_by_default():
+    line, point = Line("y = 2x + 1"), Point(1, 1)
+    assert line.findParallel(point) is not line.findParallel(point)
+    assert memo_info('Line.findParallel').hits == 0
+
+
+def test_memo(memo):
+    line, point = Line("y = 2x + 1"), Point(1, 1)
+    parallel = line.findParallel(point)
+    # Equal arguments built separately hit the same entry
+    assert Line("y = 2x + 1").findParallel(Point(1, 1)) is parallel
+    assert line.findPerpendicular(point) is line.findPerpendicular(point)
+    assert point.distanceLine(line) == Point(1, 1).distanceLine(line) == 2 * sp.sqrt(5) / 5
+    assert line.findBisector(Line("y = 0")) == line.findBisector(Line("y = 0"))
+
+    info = memo_info()
+    assert info['Line.findParallel'].hits == 1 and info['Line.findParallel'].misses == 1
+    assert info['Point.distanceLine'].hits == 1 and info['Line.findBisector'].hits == 1
+    assert info['Line.intersection'].hits == 0
+
+    # Numeric elements are keyed on their backend and on the tolerance
+    numeric = line.to_numeric()
+    assert numeric.findParallel(point).backend == 'numeric'
+    with use_backend(tolerance=1e-3):
+        assert numeric.findParallel(point) is not numeric.findParallel(Point(1, 1).to_numeric())
+    assert memo_info('Line.findParallel').currsize == 4
+
+    clear_memo('Line.findParallel')
+    assert memo_info('Line.findParallel').currsize == 0
+    with pytest.raises(ValueError):
+        memo_info('Line.unknown')
+
+
+def test_memo_intersection(memo):
+    line1, line2 = Line("y = x"), Line("y = -x + 2")
+    assert line1.intersection(line2) is line1.intersection(line2) == Point(1, 1)
+    assert line1.intersection(Line("y = x + 1")) is None
+    assert line1.intersection(Line("y = x + 1")) is None
+
+    # Coincident lines: the line itself, even when the entry was computed with an equal line
+    assert line1.intersection(Line("2y = 2x")) is line1
+    other = Line("y = x")
+    assert other.intersection(Line("2y = 2x")) is other
+    assert memo_info('Line.intersection').hits == 3
+
+    # Keyword arguments are not cached
+    line1.intersection(line2, timeout=None)
+    assert memo_info('Line.intersection').hits == 3
+
+
+def test_memo_weak_references(memo):
+    configure_memo(maxsize=1)
+    line = Line("y = 3x")
+    point = Point(2, 5)
+    reference = weakref.ref(point)
+    kept = line.findParallel(point)
+    line.findParallel(Point(0, 1))
+
+    # Evicted but referenced by the caller: found again
+    assert line.findParallel(Point(2, 5)) is kept
+    # The cache keeps neither the arguments nor the evicted results alive
+    evicted = weakref.ref(line.findPerpendicular(Point(7, 7)))
+    line.findPerpendicular(Point(8, 8))
+    del point, kept
+    gc.collect()
+    assert reference() is None and evicted() is None
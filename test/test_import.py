@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import mathworld
+from mathworld import elements
+
+
+def _run(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split()
+
+
+def test_import_does_not_load_sympy():
+    assert _run("import sys, mathworld; print('sympy' in sys.modules)") == ['False']
+    assert _run("import sys; from mathworld import use_backend, LRUCache; print('sympy' in sys.modules)") == ['False']
+    assert _run("import sys; from mathworld import Point; print('sympy' in sys.modules)") == ['True']
+
+
+def test_lazy_constants():
+    assert str(mathworld.X_AXIS) == "y = 0"
+    assert str(mathworld.Y_AXIS) == "x = 0"
+    assert str(mathworld.BISECTOR_1_3) == "y = x"
+    assert str(mathworld.BISECTOR_2_4) == "y = -x"
+    assert mathworld.ORIGIN.isorigin()
+
+    # Built once and shared
+    assert mathworld.X_AXIS is elements.X_AXIS is elements.X_AXIS
+    assert 'X_AXIS' in dir(mathworld) and 'ORIGIN' in dir(elements)
+
+    namespace = {}
+    exec("from mathworld import *", namespace)
+    assert namespace['Y_AXIS'] is mathworld.Y_AXIS and namespace['Point'] is mathworld.Point
+
+    # The elements and their constants, without the names the module imports
+    namespace = {}
+    exec("from mathworld.elements import *", namespace)
+    assert sorted(name for name in namespace if name != '__builtins__') == \
+        sorted(['Point', 'Line', 'Segment', 'Circle', 'ORIGIN', 'X_AXIS', 'Y_AXIS', 'BISECTOR_1_3', 'BISECTOR_2_4'])
@@ -0,0 +1,168 @@
+import math
+import random
+
+import pytest
+from mathworld import Point, Line, Segment
+from mathworld.index import PointIndex, SegmentIndex, LineIndex
+
+
+def _distance(point, segment):
+    # Brute force distance from a point to a segment, through the projection on its line
+    x, y = float(point.x), float(point.y)
+    x1, y1, x2, y2 = (float(value) for value in (segment.point1.x, segment.point1.y,
+                                                 segment.point2.x, segment.point2.y))
+    dx, dy = x2 - x1, y2 - y1
+    t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(x - x1 - t * dx, y - y1 - t * dy)
+
+
+def test_point_index():
+    random.seed(1)
+    points = [Point(random.randint(-50, 50), random.randint(-50, 50)) for _ in range(300)]
+    index = PointIndex(points[:200])
+    for point in points[200:]:
+        index.insert(point)
+    for point in points[::3]:
+        index.remove(point)
+    kept = [point for i, point in enumerate(points) if i % 3]
+    assert len(index) == len(kept) and points[0] not in index and points[1] in index
+
+    for _ in range(50):
+        query = Point(random.uniform(-60, 60), random.uniform(-60, 60), backend='numeric')
+        distances = sorted(float(query.distancePoint(point)) for point in kept)
+        nearest = index.nearest(query, k=5)
+        assert [float(query.distancePoint(point)) for point in nearest] == pytest.approx(distances[:5])
+
+        found = index.within_radius(query, 10)
+        assert len(found) == sum(distance <= 10 for distance in distances)
+        assert {id(point) for point in index.within_box(-10, -5, 20, 5)} == \
+            {id(point) for point in kept if -10 <= point.x <= 20 and -5 <= point.y <= 5}
+
+    assert all(point.ison(kept[0]) for point in index.locate(Point(kept[0].x, kept[0].y)))
+    assert index.locate(Point(0.5, 0.5)) == []
+
+
+def test_point_index_sorted_insertions():
+    # Points inserted in increasing order would make a chain of the tree
+    random.seed(5)
+    points = [Point(random.uniform(0, 1000), random.uniform(0, 1000), backend='numeric') for _ in range(3000)]
+    index = PointIndex(points)
+    chain = [Point(1000 + i, 1000 + i, backend='numeric') for i in range(3000)]
+    for point in chain:
+        index.insert(point)
+    for point in points[::2]:
+        index.remove(point)
+
+    depth, stack = 0, [(index._root, 1)]
+    while stack:
+        node, level = stack.pop()
+        if node is not None:
+            depth = max(depth, level)
+            stack.extend(((node.left, level + 1), (node.right, level + 1)))
+    assert depth <= 2 * math.log(len(index) + index._deleted, 1.5)
+
+    kept = points[1::2] + chain
+    for query in (Point(2500, 2500, backend='numeric'), Point(10, 990, backend='numeric')):
+        distances = sorted(math.hypot(float(p.x - query.x), float(p.y - query.y)) for p in kept)
+        assert [math.hypot(float(p.x - query.x), float(p.y - query.y)) for p in index.nearest(query, k=3)] == \
+            pytest.approx(distances[:3])
+    assert len(index.within_box(1500, 1500, 1600, 1600)) == 101
+
+
+def test_segment_index():
+    random.seed(2)
+    segments = []
+    for _ in range(200):
+        x, y = random.randint(-100, 100), random.randint(-100, 100)
+        segments.append(Segment(Point(x, y), Point(x + random.randint(-10, 10), y + random.randint(1, 10))))
+    index = SegmentIndex(segments)
+    removed = segments.pop(7)
+    index.remove(removed)
+    assert len(index) == len(segments) and removed not in index
+
+    for _ in range(50):
+        query = Point(random.uniform(-150, 150), random.uniform(-150, 150), backend='numeric')
+        distances = sorted(_distance(query, segment) for segment in segments)
+        nearest = index.nearest(query, k=3)
+        assert [_distance(query, segment) for segment in nearest] == pytest.approx(distances[:3])
+        assert len(index.within_radius(query, 15)) == sum(distance <= 15 for distance in distances)
+
+    # Incidence: the exact check runs only on the candidates of the cell
+    segment = segments[0]
+    middle = segment.middle
+    assert segment in index.locate(middle)
+    assert all(middle.ison(found) for found in index.locate(middle))
+
+    box = SegmentIndex([Segment(Point(0, 0), Point(10, 10))], cell_size=2)
+    assert len(box.within_box(4, 6, 5, 7)) == 0
+    assert len(box.within_box(4, 4, 5, 5)) == 1
+    with pytest.raises(ValueError):
+        box.insert(next(iter(box)))
+
+
+def test_segment_index_long_segments():
+    # Long diagonal roads among short segments: only the cells crossed are used
+    random.seed(4)
+    segments = [Segment(Point(x, y), Point(x + 1, y + 1))
+                for x, y in ((random.randint(0, 2000), random.randint(0, 2000)) for _ in range(1000))]
+    roads = [Segment(Point(0, 0), Point(20000, 20000)), Segment(Point(0, 20000), Point(20000, 0)),
+             Segment(Point(3, 7), Point(19001, 5002))]
+    cells = len(SegmentIndex(segments, cell_size=10)._cells)
+    index = SegmentIndex(segments + roads, cell_size=10)
+    # The bounding boxes of the roads cover about 10^7 cells
+    assert len(index._cells) < cells + 4 * 3 * 2000
+
+    for _ in range(20):
+        query = Point(random.uniform(0, 20000), random.uniform(0, 20000), backend='numeric')
+        distances = sorted(_distance(query, segment) for segment in segments + roads)
+        assert [_distance(query, segment) for segment in index.nearest(query, k=2)] == pytest.approx(distances[:2])
+        assert len(index.within_radius(query, 3)) == sum(distance <= 3 for distance in distances)
+    assert roads[0] in index.locate(Point(12345, 12345)) and roads[1] in index.locate(Point(10000, 10000))
+    assert roads[2] in index.within_box(19000, 5001.5, 19000.5, 5001.9)
+
+    for road in roads:
+        index.remove(road)
+    assert len(index._cells) == cells
+    # Far from every remaining segment
+    corner = Point(20000, 0)
+    assert index.nearest(corner) == [min(segments, key=lambda segment: _distance(corner, segment))]
+
+
+def test_line_index():
+    random.seed(3)
+    lines = [Line.from_coefficients(random.randint(-3, 3), random.randint(1, 3), random.randint(-20, 20))
+             for _ in range(100)] + [Line.from_coefficients(1, 0, random.randint(-20, 20)) for _ in range(10)]
+    index = LineIndex(lines)
+    index.remove(lines[-1])
+    lines.pop()
+
+    for _ in range(50):
+        query = Point(random.uniform(-30, 30), random.uniform(-30, 30), backend='numeric')
+        distances = sorted(query.distanceLine(line) for line in lines)
+        nearest = index.nearest(query, k=4)
+        assert [query.distanceLine(line) for line in nearest] == pytest.approx(distances[:4])
+        assert len(index.within_radius(query, 2)) == sum(distance <= 2 for distance in distances)
+
+    point = lines[0].intersection(lines[1])
+    if isinstance(point, Point):
+        located = index.locate(point)
+        assert lines[0] in located and lines[1] in located
+        assert all(point.ison(line) for line in located)
+
+
+def test_line_index_general_position():
+    # Lines with distinct directions, in buckets of nearby angles
+    random.seed(6)
+    lines = [Line.from_coefficients(random.uniform(-1, 1), random.uniform(-1, 1), random.uniform(-100, 100),
+                                    backend='numeric') for _ in range(500)]
+    index = LineIndex(lines)
+    for line in lines[::5]:
+        index.remove(line)
+    kept = [line for i, line in enumerate(lines) if i % 5]
+    assert len(index) == len(kept) and 1 < len(index._buckets) < len(kept)
+
+    for _ in range(30):
+        query = Point(random.uniform(-200, 200), random.uniform(-200, 200), backend='numeric')
+        distances = sorted(query.distanceLine(line) for line in kept)
+        assert [query.distanceLine(line) for line in index.nearest(query, k=5)] == pytest.approx(distances[:5])
+        assert len(index.within_radius(query, 5)) == sum(distance <= 5 for distance in distances)
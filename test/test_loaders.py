@@ -0,0 +1,49 @@
+import io
+import json
+
+import pytest
+from mathworld import Point, Line, Segment
+from mathworld.loaders import load_lines, load_points, load_segments, load_point_arrays
+
+
+def test_load_elements(tmp_path):
+    lines = tmp_path / 'lines.txt'
+    lines.write_text('# lines\ny = 2*x + 1\n\nx = = 3\n2*x + 3*y = 6\n')
+    results = list(load_lines(lines))
+    assert [result.index for result in results] == [2, 4, 5]
+    assert results[0].value == Line('y = 2*x + 1') and results[2].value == Line('2*x + 3*y = 6')
+    assert not results[1].ok and results[1].value is None
+
+    points = tmp_path / 'points.csv'
+    points.write_text('x,y\n1,2\n1.5,-3\nsqrt(2),1/3\nfoo\n')
+    for memory_map in (False, True):
+        results = list(load_points(points, memory_map=memory_map))
+        assert [result.value for result in results[:3]] == [Point(1, 2), Point(1.5, -3), Point('sqrt(2)', '1/3')]
+        assert results[3].index == 5 and results[3].error.startswith('KeyError')
+
+    segments = tmp_path / 'segments.jsonl'
+    segments.write_text('\n'.join([json.dumps([0, 0, 1, 1]), json.dumps({'x1': 0, 'y1': 1, 'x2': 2, 'y2': 3}),
+                                   '[[0, 0], [3, 4]]', '{bad']))
+    results = list(load_segments(segments, workers=2, chunksize=1))
+    assert [result.value.length for result in results[:3]] == [Point(0, 0).distancePoint(Point(1, 1)),
+                                                               Point(0, 1).distancePoint(Point(2, 3)), 5]
+    assert isinstance(results[0].value, Segment) and results[3].error.startswith('JSONDecodeError')
+
+    coefficients = list(load_lines(io.StringIO('a,b,c\n1,2,3\n'), format='csv', backend='numeric'))
+    assert coefficients[0].value == Line.from_coefficients(1, 2, 3, backend='numeric')
+    with pytest.raises(ValueError):
+        load_lines(lines, format='xml')
+
+
+def test_load_point_arrays():
+    pytest.importorskip('numpy')
+    rows = io.StringIO('1 2\n1.5, -3\nsqrt(2) 1/3\nfoo\n4 5\n')
+    with pytest.raises(ValueError):
+        list(load_point_arrays(rows))
+
+    errors = []
+    rows.seek(0)
+    blocks = list(load_point_arrays(rows, size=2, on_error=lambda number, error: errors.append(number)))
+    assert [len(block) for block in blocks] == [2, 2]
+    assert blocks[1].x.tolist() == pytest.approx([2 ** 0.5, 4]) and blocks[0].y.tolist() == [2, -3]
+    assert errors == [4]
@@ -1,5 +1,8 @@
+import gc
+import weakref
+
 import pytest
-from mathworld import Point, Line, Segment, sp
+from mathworld import Point, Line, Segment, Circle, sp
 
 
 def test_point():
@@ -61,5 +64,156 @@ def test_segment():
     assert str(segment.middle) == "(3, 4)"
     assert segment.line.slope == sp.Rational(4, 3)
 
-    perp_line = segment.axe
+    perp_line = segment.perpendicularBisector
     assert perp_line.isPerpendicular(segment.line)
+
+
+def test_line_from_coefficients():
+    # Coefficients are normalized the same way as equations
+    line = Line.from_coefficients(2, 4, 6)
+    assert (line.a, line.b, line.c) == (1, 2, 3)
+    assert line.slope == sp.Rational(-1, 2)
+    assert line.intercept == sp.Rational(-3, 2)
+
+    from_equation = Line("3*y - 1 = 2*x/5")
+    assert (from_equation.a, from_equation.b, from_equation.c) == (-2, 15, -5)
+    assert str(Line.from_coefficients(-2, 15, -5)) == str(from_equation)
+
+    vertical = Line.from_coefficients(-4, 0, 14)
+    assert vertical.isVertical()
+    assert (vertical.a, vertical.b, vertical.c) == (2, 0, -7)
+    assert vertical.intercept is None
+
+    with pytest.raises(ValueError):
+        Line("y = x**2")
+    with pytest.raises(ValueError):
+        Line.from_coefficients(0, 0, 1)
+
+
+def test_segment_lazy_properties():
+    segment = Segment(Point(0, 0), Point(6, 8))
+    assert 'line' not in vars(segment)
+
+    assert segment.perpendicularBisector.isPerpendicular(segment.line)
+    assert segment.line is segment.line
+    assert 'middle' in vars(segment) and 'length' not in vars(segment)
+
+    segments = Segment.precompute_all([Segment(Point(0, 0), Point(i, 1)) for i in range(1, 4)], 'length')
+    assert all('length' in vars(s) and 'line' not in vars(s) for s in segments)
+    assert segments[2].precompute().line.slope == sp.Rational(1, 3)
+
+    with pytest.raises(ValueError):
+        segment.precompute('axe')
+
+
+def test_line_intersection():
+    line = Line("y = 2*x + 3")
+    assert line.intersection(Line("y = 2*x - 1")) is None
+    assert line.intersection(Line("2*y - 4*x = 6")) is line
+
+    vertical = Line("x = 3/2")
+    point = vertical.intersection(line)
+    assert (point.x, point.y) == (sp.Rational(3, 2), 6)
+    assert vertical.intersection(Line("x = 5")) is None
+
+
+def test_circle():
+    circle = Circle(Point(0, 0), 5)
+    assert str(circle) == "x**2 + y**2 = 25"
+
+    points = circle.intersection(Line("y = 3"))
+    assert [str(p) for p in points] == ["(-4, 3)", "(4, 3)"]
+    assert [str(p) for p in circle.intersection(Line("x = 5"))] == ["(5, 0)"]
+    assert circle.intersection(Line("y = 6")) == ()
+
+    points = circle.intersection(Circle(Point(6, 0), 5))
+    assert sorted(str(p) for p in points) == ["(3, -4)", "(3, 4)"]
+    assert circle.intersection(Circle(Point(0, 0), 5)) is circle
+    assert circle.intersection(Circle(Point(0, 0), 2)) == ()
+
+    tangents = circle.tangents(Point(0, 10))
+    assert len(tangents) == 2
+    for tangent in tangents:
+        assert len(circle.intersection(tangent)) == 1
+        assert Point(0, 10).ison(tangent)
+    assert str(circle.tangents(Point(3, 4))[0]) == str(Line("3*x + 4*y = 25"))
+    assert circle.tangents(Point(1, 1)) == ()
+    assert Point(3, -4).ison(circle)
+
+    with pytest.raises(ValueError):
+        Circle(Point(0, 0), -1)
+
+
+def test_find_point_off_line():
+    line = Line("y = 2*x + 1")
+    point = Point(1, 2)
+    for found in Point.findPoint(line, point, sp.sqrt(2)):
+        assert found.ison(line)
+        assert sp.simplify(found.distancePoint(point) - sp.sqrt(2)) == 0
+
+    tangent, none = Point.findPoint(Line("y = 0"), Point(0, 1), 1)
+    assert str(tangent) == "(0, 0)" and none is None
+    with pytest.raises(ValueError):
+        Point.findPoint(line, Point(0, 5), 1)
+
+
+def test_line_bisectors():
+    line1, line2 = Line("y = 2*x + 1"), Line("y = -x/3 + 4")
+    bisectors = line1.findBisector(line2)
+    assert len(bisectors) == 2
+    assert bisectors[0].to_numeric().isPerpendicular(bisectors[1])
+    for bisector in bisectors:
+        assert bisector.isBisector(line1, line2)
+        assert line1.intersection(line2).ison(bisector)
+
+    assert [str(bisector) for bisector in Line("x = 0").findBisector(Line("y = 0"))] == ["y = x", "y = -x"]
+    assert not Line("y = 3").isBisector(Line("y = 0"), Line("x = 0"))
+
+    # Parallel lines have a single bisector, halfway between them
+    assert [str(bisector) for bisector in Line("x = 1").findBisector(Line("x = 5"))] == ["x = 3"]
+    assert Line("y = x + 2").isBisector(Line("y = x"), Line("y = x + 4"))
+    assert not Line("y = x + 3").isBisector(Line("y = x"), Line("y = x + 4"))
+
+    with pytest.raises(ValueError):
+        Line("y = x").findBisector(Line("2*y = 2*x"))
+    assert not Line("y = x").isBisector(Line("y = x"), Line("2*y = 2*x"))
+
+
+def test_symbolic_point():
+    a = sp.Symbol('a', positive=True)
+    point = Point(a, -a)
+    assert point.quadrant == 4
+    assert Point('t', 1).quadrant is None
+    assert Point(0, 5).quadrant is None
+    assert not point.isorigin()
+
+
+def test_equality_and_interning():
+    assert Point(1, 2) == Point(sp.Rational(2, 2), "2")
+    assert Point(1, 2) != Point(1, 2, backend='numeric')
+    assert len({Point(1, 2), Point(1, 2), Point(2, 1)}) == 2
+
+    # Lines are compared on their canonical coefficients
+    assert Line("y = x + 1") == Line.from_coefficients(-2, 2, -2)
+    assert hash(Line("2*y = 3*x + 1")) == hash(Line.from_coefficients(3, -2, 1))
+    assert Line("x = 2") != Line("x = 3")
+    assert {Line("y = x"): 1}[Line("2*y = 2*x")] == 1
+
+    # Float coefficients of an Equality are rationalized as in a string
+    x, y = sp.symbols('x y')
+    line = Line(sp.Eq(y, 0.5*x + 0.25))
+    assert (line.a, line.b, line.c) == (-2, 4, -1)
+    assert line == Line('y = x/2 + 1/4') and hash(line) == hash(Line('y = x/2 + 1/4'))
+
+    point = Point(5, 7)
+    assert point.intern() is point and Point(5, 7).intern() is point
+    line = Line("y = 4*x - 2")
+    assert Line("y = 4*x - 2").intern() is line.intern()
+
+    # The table does not keep the interned elements alive
+    references = [weakref.ref(Point(1, 2).intern()), weakref.ref(Line("y = 5*x + 3").intern())]
+    gc.collect()
+    assert [reference() for reference in references] == [None, None]
+
+    # Elements have no per-instance dictionary
+    assert not hasattr(point, '__dict__') and not hasattr(line, '__dict__')
@@ -0,0 +1,49 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from mathworld import Point, Line, Segment, X_AXIS
+from mathworld.arrays import PointArray
+from mathworld.parametric import Construction
+
+
+def test_construction():
+    reference = Line('y = 3 - x')
+
+    @Construction
+    def construction(t, k):
+        line = Line.findLine(point1=Point(t, 2 * t), slope=k)
+        point = line.intersection(reference)
+        segment = Segment(Point(t, 2 * t), point)
+        return {'point': point, 'parallel': line.findParallel(Point(0, 1)), 'bisectors': line.findBisector(X_AXIS),
+                'distances': (Point(0, 0).distanceLine(line), Point(0, 0).distancePoint(point)),
+                'segment': [segment.length, segment.middle]}
+
+    t, k = np.array([0.5, 1.0, 2.0, 3.0]), np.array([2.0, 3.0, 0.5, -1.0])
+    result = construction(t, k=k)
+    assert construction.parameters == ('t', 'k') and isinstance(result['point'], PointArray)
+    assert np.isinf(result['point'].x[3])
+
+    for i in range(3):
+        line = Line.findLine(point1=Point(t[i], 2 * t[i], backend='numeric'), slope=k[i], backend='numeric')
+        point = line.intersection(reference)
+        segment = Segment(Point(t[i], 2 * t[i], backend='numeric'), point)
+        assert (result['point'].x[i], result['point'].y[i]) == pytest.approx(point.cordinates)
+        assert tuple(array[i] for array in result['parallel']) == \
+            pytest.approx((line.findParallel(Point(0, 1)).a, line.findParallel(Point(0, 1)).b,
+                           line.findParallel(Point(0, 1)).c))
+        # Coefficient by coefficient, in the order of Line.findBisector
+        for compiled, bisector in zip(result['bisectors'], line.findBisector(X_AXIS)):
+            bisector = bisector.to_numeric()
+            assert tuple(array[i] for array in compiled) == pytest.approx((bisector.a, bisector.b, bisector.c))
+        assert result['distances'][0][i] == pytest.approx(Point(0, 0).distanceLine(line))
+        assert result['distances'][1][i] == pytest.approx(Point(0, 0).distancePoint(point))
+        assert result['segment'][0][i] == pytest.approx(segment.length)
+        assert result['segment'][1].x[i] == pytest.approx(segment.middle.x)
+
+    # Scalars broadcast against arrays
+    assert len(construction(1.0, k)['point']) == 4
+    with pytest.raises(TypeError):
+        construction(t)
+    with pytest.raises(ValueError):
+        Construction(lambda t: 'text')
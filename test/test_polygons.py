@@ -0,0 +1,128 @@
+import pickle
+import random
+
+import pytest
+from mathworld import Point, Line, Segment, Polygon, Triangle, sp
+
+
+def square(backend=None):
+    return Polygon([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)], backend)
+
+
+def test_polygon():
+    polygon = square()
+    assert len(polygon) == 4 and polygon.backend == 'sympy'
+    assert str(polygon) == "Polygon((0, 0), (4, 0), (4, 4), (0, 4))"
+    assert polygon[2] == Point(4, 4) and list(polygon) == list(polygon.vertices)
+    assert polygon.signedArea == 16 and polygon.area == 16 and polygon.perimeter == 16
+    assert polygon.centroid == Point(2, 2)
+    assert [side.length for side in polygon.sides] == [4, 4, 4, 4]
+
+    clockwise = Polygon(reversed(polygon.vertices))
+    assert clockwise.signedArea == -16 and clockwise.area == 16
+    assert clockwise.centroid == Point(2, 2)
+
+    with pytest.raises(ValueError):
+        Polygon([Point(0, 0), Point(1, 1)])
+    with pytest.raises(ValueError):
+        Polygon.from_coordinates([0, 1, 2], [0, 1])
+    with pytest.raises(ValueError):
+        Polygon.from_coordinates([0, 1, 2], [0, 1, 2]).centroid
+
+
+def test_polygon_exact_and_numeric():
+    random.seed(0)
+    for _ in range(20):
+        x = [sp.Rational(random.randint(-50, 50), random.randint(1, 6)) for _ in range(6)]
+        y = [sp.Rational(random.randint(-50, 50), random.randint(1, 6)) for _ in range(6)]
+        exact = Polygon.from_coordinates(x, y)
+        numeric = exact.to_numeric()
+        assert numeric.backend == 'numeric' and numeric.to_exact().backend == 'sympy'
+
+        # Rational fast path against the SymPy formula
+        area = sp.Add(*(x[i - 1] * y[i] - x[i] * y[i - 1] for i in range(6))) / 2
+        assert exact.signedArea == area
+        assert float(exact.signedArea) == pytest.approx(numeric.signedArea)
+        assert float(exact.perimeter) == pytest.approx(numeric.perimeter)
+        if area != 0:
+            assert float(exact.centroid.x) == pytest.approx(numeric.centroid.x)
+            assert float(exact.centroid.y) == pytest.approx(numeric.centroid.y)
+
+    radical = Polygon.from_coordinates([0, sp.sqrt(2), 0], [0, 0, sp.sqrt(2)])
+    assert radical.area == 1 and radical.centroid == Point(sp.sqrt(2) / 3, sp.sqrt(2) / 3)
+
+    assert Polygon([Point(0, 0), Point(1, 0, backend='numeric'), Point(0, 1)]).backend == 'numeric'
+
+
+def test_polygon_convexity():
+    assert square().isConvex() and square('numeric').isConvex()
+    # Collinear vertices on a side
+    assert Polygon.from_coordinates([0, 2, 4, 4, 0], [0, 0, 0, 4, 4]).isConvex()
+    # Concave arrow
+    arrow = Polygon.from_coordinates([0, 4, 0, 1], [0, 2, 4, 2])
+    assert not arrow.isConvex() and not arrow.to_numeric().isConvex()
+    # Pentagram: every turn in the same direction, but the boundary winds twice
+    star = [Point(sp.cos(2 * sp.pi * k / 5), sp.sin(2 * sp.pi * k / 5), backend='numeric') for k in (0, 2, 4, 1, 3)]
+    assert not Polygon(star).isConvex()
+
+
+def test_polygon_contains():
+    polygon = Polygon.from_coordinates([0, 4, 0, 1], [0, 2, 4, 2])
+    # (1, 2) is the reflex vertex and (9/10, 2) is in the notch
+    cases = {(1, 1): True, (sp.Rational(9, 10), 2): False, (2, 2): True, (0, 2): False, (1, 2): True, (0, 0): True,
+             (2, 1): True, (3, 3): False, (sp.Rational(1, 2), 1): True, (-1, 0): False}
+    for (x, y), expected in cases.items():
+        assert polygon.contains(Point(x, y)) == expected, (x, y)
+        assert polygon.to_numeric().contains(Point(x, y)) == expected, (x, y)
+        assert polygon.contains(Point(x, y, backend='numeric')) == expected, (x, y)
+
+
+def test_triangle():
+    triangle = Triangle(Point(0, 0), Point(4, 0), Point(0, 3))
+    assert str(triangle) == "Triangle((0, 0), (4, 0), (0, 3))"
+    assert triangle.area == 6 and triangle.perimeter == 12
+    assert triangle.circumcenter == Point(2, sp.Rational(3, 2))
+    assert triangle.orthocenter == Point(0, 0)
+    assert triangle.incenter == Point(1, 1)
+    assert triangle.centroid == Point(sp.Rational(4, 3), 1)
+
+    with pytest.raises(ValueError):
+        Triangle.from_coordinates([0, 1, 2, 3], [0, 1, 0, 1])
+    with pytest.raises(ValueError):
+        Triangle(Point(0, 0), Point(1, 1), Point(2, 2)).circumcenter
+    with pytest.raises(ValueError):
+        Triangle(Point(0, 0), Point(1, 1), Point(2, 2), backend='numeric').incenter
+
+
+def test_triangle_centers():
+    # The closed forms agree with the constructions by intersecting lines
+    random.seed(1)
+    for _ in range(10):
+        points = [Point(sp.Rational(random.randint(-20, 20), random.randint(1, 3)), random.randint(-20, 20))
+                  for _ in range(3)]
+        triangle = Triangle(*points)
+        if triangle.area == 0:
+            continue
+        sides = [Segment(points[i - 2], points[i - 1]) for i in range(3)]
+        bisectors = [side.perpendicularBisector for side in sides]
+        assert triangle.circumcenter == bisectors[0].intersection(bisectors[1])
+        altitudes = [side.line.findPerpendicular(point) for side, point in zip(sides, points)]
+        assert triangle.orthocenter == altitudes[0].intersection(altitudes[1])
+
+        numeric = triangle.to_numeric()
+        for name in ('circumcenter', 'orthocenter', 'incenter', 'centroid'):
+            exact, value = getattr(triangle, name), getattr(numeric, name)
+            assert (float(exact.x), float(exact.y)) == pytest.approx((value.x, value.y)), name
+
+    triangle = Triangle(Point(0, 0), Point(sp.sqrt(3), 1), Point(0, 2))
+    assert triangle.incenter == triangle.circumcenter == triangle.centroid
+    assert triangle.incenter.ison(Line.findLine(slope=0, intercept=1))
+
+
+def test_polygon_pickle():
+    for polygon in (square(), square('numeric'), Triangle(Point(0, 0), Point('1/2', 0), Point(0, sp.sqrt(2)))):
+        polygon.area
+        restored = pickle.loads(pickle.dumps(polygon))
+        assert type(restored) is type(polygon) and restored.backend == polygon.backend
+        assert list(restored.x) == list(polygon.x) and list(restored.y) == list(polygon.y)
+        assert 'area' not in vars(restored)
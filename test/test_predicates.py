@@ -0,0 +1,66 @@
+import random
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+from mathworld import Point, Line, Segment
+from mathworld.predicates import orientation, incident, parallel, perpendicular, compare, on_segment
+
+
+def _exact_orientation(*coordinates):
+    x1, y1, x2, y2, x3, y3 = map(Fraction, coordinates)
+    determinant = (x2 - x1) * (y3 - y1) - (y2 - y1) * (x3 - x1)
+    return (determinant > 0) - (determinant < 0)
+
+
+def test_orientation():
+    assert orientation(Point(0, 0), Point(1, 0), Point(0, 1)) == 1
+    assert orientation(Point(0, 0), Point(0, 1), Point(1, 0)) == -1
+    assert orientation(Point(0, 0), Point('1/3', '1/3'), Point(1, 1)) == 0
+    assert orientation(Point(0, 0), Point('sqrt(2)', 1), Point(2, 'sqrt(2)')) == 0
+    assert orientation(Point(0, 0), Point(1, 'sqrt(2)'), Point(1, '1414213562373095/1000000000000000')) == -1
+    with pytest.raises(ValueError):
+        orientation(Point(0, 0), Point(1, 0), Point(0, 'k'))
+
+
+def test_orientation_near_degenerate():
+    # Nearly collinear points, where the float determinant is dominated by rounding
+    generator = random.Random(1)
+    for _ in range(300):
+        scale = generator.choice([1, 2 ** 40, 2 ** 60, Fraction(1, 3)])
+        x1, y1 = generator.randint(-9, 9) * scale, generator.randint(-9, 9) * scale
+        dx, dy = generator.randint(1, 9), generator.randint(-9, 9)
+        t = generator.choice([Fraction(1, 3), 7, Fraction(10 ** 17 + 1, 10 ** 17)])
+        coordinates = [x1, y1, x1 + dx * scale, y1 + dy * scale,
+                       x1 + dx * scale * t + generator.choice([0, 1, -1]), y1 + dy * scale * t]
+        points = [Point(*(sp.Rational(value.numerator, value.denominator) if isinstance(value, Fraction) else value
+                          for value in coordinates[i:i + 2])) for i in (0, 2, 4)]
+        assert orientation(*points) == _exact_orientation(*coordinates)
+
+
+def test_lines():
+    vertical, horizontal = Line('x = 1'), Line('y = 2')
+    assert parallel(vertical, Line('2*x = 7')) and not parallel(vertical, horizontal)
+    assert perpendicular(vertical, horizontal) and not perpendicular(vertical, Line('x = 3'))
+    assert vertical.isPerpendicular(horizontal) and horizontal.isPerpendicular(vertical)
+    assert vertical.isParallel(Line('x = -5')) and not horizontal.isPerpendicular(Line('y = x'))
+    assert Line('y = sqrt(2)*x').isPerpendicular(Line('y = -x/sqrt(2) + 1'))
+    assert Line('y = sqrt(2)*x').isParallel(Line('y = 2*x/sqrt(2) + 1'))
+    assert perpendicular(Line('y = a*x'), Line('y = -x/a'))
+
+
+def test_incidence():
+    assert incident(Point(1, '(1 + sqrt(2))**2 - 2*sqrt(2)'), Line('y = 3'))
+    assert not incident(Point(1, 'sqrt(2)'), Line('y = 1.4142135623730951'))
+    assert incident(Point('k', '2*k + 1'), Line('y = 2*x + 1'))
+    assert Point(2 ** 70, 2 ** 71 + 1).ison(Line('y = 2*x + 1'))
+    assert not Point(2 ** 70, 2 ** 71 + 2).ison(Line('y = 2*x + 1'))
+
+
+def test_on_segment():
+    segment = Segment(Point(0, 0), Point(2, 2))
+    assert on_segment(Point('sqrt(2)', 'sqrt(2)'), segment) and Point('1/3', '1/3').ison(segment)
+    assert not on_segment(Point(3, 3), segment) and not Point('sqrt(5)', 'sqrt(5)').ison(segment)
+    assert Point(1, 2).ison(Segment(Point(1, 2), Point(1, 2))) and not Point(1, 3).ison(Segment(Point(1, 2), Point(1, 2)))
+    assert Point(1, 5).ison(Segment(Point(1, 2), Point(1, 7))) and not Point(1, 8).ison(Segment(Point(1, 2), Point(1, 7)))
+    assert compare(sp.pi, '355/113') == -1 and compare(0.1, '1/10') == 0 and compare(2, 1) == 1
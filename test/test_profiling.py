@@ -0,0 +1,46 @@
+from mathworld import Point, Line, clear_parse_cache, solve_system
+from mathworld.profiling import DIRECT, ProfileEvent, add_hook, profile, remove_hook, sympy_operation
+
+
+def test_profile_records_calls_and_operations():
+    clear_parse_cache()
+    with profile(slowest=2) as recording:
+        line = Line("y = 2*x + 1")
+        line.intersection(Line("y = -x + 4"))
+        solve_system(["x + y = 2", "x - y = 0"], ["x", "y"])
+    stats = recording.stats()
+
+    assert stats['Line.__init__']['count'] == 2
+    assert stats['Line.__init__']['operations']['parse_expr']['count'] >= 2
+    assert stats['Line.intersection']['count'] == 1
+    assert stats['solve_system']['operations']['solve']['count'] == 1
+    # Nested API calls are attributed to the outermost one
+    assert 'expression' not in stats and 'equation' not in stats
+    assert stats['solve_system']['self'] <= stats['solve_system']['total']
+
+    slowest = recording.slowest_calls()
+    assert len(slowest) == 2 and slowest[0][0] >= slowest[1][0]
+    assert 'parse_expr' in recording.report()
+
+    # Nothing is recorded outside of the block
+    Line("y = 3*x")
+    assert recording.stats()['Line.__init__']['count'] == 2
+
+
+def test_hooks():
+    events = []
+    add_hook(events.append)
+    try:
+        Point(1, 2).ison(Line("y = x + 1"))
+    finally:
+        remove_hook(events.append)
+    Point(1, 2).ison(Line("y = x + 1"))
+
+    assert all(isinstance(event, ProfileEvent) for event in events)
+    assert [event.api for event in events if event.operation is None] == ['Line.__init__', 'Point.ison']
+
+    # Operations called outside of an API call
+    double = sympy_operation('double', lambda value: 2 * value)
+    with profile() as recording:
+        assert double(3) == 6
+    assert recording.stats()[DIRECT]['operations']['double']['count'] == 1
@@ -0,0 +1,76 @@
+import random
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+import mathworld.elements as elements
+from mathworld import Point, Line, Segment, Circle
+from mathworld._rational import integers, to_sympy, canonical_coefficients
+
+
+def _values(seed: int, count: int) -> list:
+    generator = random.Random(seed)
+    choices = [lambda: generator.randint(-6, 6), lambda: sp.Rational(generator.randint(-9, 9), generator.randint(1, 4)),
+               lambda: generator.randint(-20, 20) / 4]
+    return [generator.choice(choices)() for _ in range(count)]
+
+
+def _operations(seed: int) -> list:
+    x1, y1, x2, y2, x3, y3, m, q = _values(seed, 8)
+    p1, p2, p3 = Point(x1, y1), Point(x2, y2), Point(x3, y3)
+    results = []
+    for line in (Line.findLine(p1, p2), Line.findLine(p1, slope=m), Line.findLine(slope=m, intercept=q),
+                 Line.findLine(p1, Point(x1, y2)), Line.from_coefficients(x3, y3, q)
+                 if x3 != 0 or y3 != 0 else Line('x = 1')):
+        other = Line.findLine(p3, slope=q)
+        results += [(line.a, line.b, line.c), (line.slope, line.intercept), line.intersection(other),
+                    line.intersection(line), line.findParallel(p3), line.findPerpendicular(p3),
+                    line.isParallel(other), line.isParallel(line.findParallel(p2)),
+                    line.isPerpendicular(line.findPerpendicular(p2)), line.isPerpendicular(other),
+                    p3.ison(line), line.intersection(other) is None or line.intersection(other).ison(line),
+                    p3.distanceLine(line)]
+    segment = Segment(p1, p2)
+    results += [p3.ison(segment), segment.middle.ison(segment), p1.ison(segment), p1.distancePoint(p3),
+                Point(x1, y1).ison(Segment(p1, p1)), p2.ison(Segment(p1, p1)),
+                p3.ison(Circle(p1, 5)), Point(x1 + 3, y1 + 4).ison(Circle(p1, 5))]
+    return results
+
+
+def _same(value1, value2) -> bool:
+    if isinstance(value1, (Point, Line)) or value1 is None:
+        return type(value1) is type(value2) and value1 == value2
+    elif isinstance(value1, tuple):
+        return all(_same(*values) for values in zip(value1, value2))
+    elif isinstance(value1, bool):
+        # SymPy comparisons returned SymPy booleans
+        return value1 == bool(value2)
+    return type(value1) is type(value2) and value1 == value2
+
+
+def test_integers():
+    assert integers(3, sp.Integer(-4), sp.S.One) == ([3, -4, 1], 1) and type(integers(sp.Integer(2))[0][0]) is int
+    assert integers(sp.Rational(3, 6), 0.1, Fraction(2, 3), 2) == ([15, 3, 20, 60], 30)
+    assert integers(1e300) == ([10 ** 300], 1) and integers(2.0) == ([2], 1)
+    assert integers(1, sp.sqrt(2)) is None and integers(sp.Symbol('k')) is None and integers(float('inf')) is None
+    assert integers(sp.Float(0.5)) is None and integers('1/2') is None and integers(True) is None
+    assert to_sympy(6, 4) == sp.Rational(3, 2) and to_sympy(-6, -3) == 2 and type(to_sympy(4, 2)) is sp.Integer
+    assert canonical_coefficients(-4, -6, 2) == (2, 3, -1) and canonical_coefficients(-4, 0, 6) == (2, 0, -3)
+    with pytest.raises(ValueError):
+        canonical_coefficients(0, 0, 1)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_fast_path_is_exact(seed, monkeypatch):
+    fast = _operations(seed)
+    monkeypatch.setattr(elements, 'integers', lambda *values: None)
+    assert all(_same(value1, value2) for value1, value2 in zip(fast, _operations(seed)))
+
+
+def test_fallback():
+    line = Line.findLine(Point('sqrt(2)', 1), Point(0, 0))
+    assert line.slope == sp.sqrt(2) / 2
+    assert (Line.from_coefficients(1.5, 2, '1/3').a, Line.from_coefficients(1.5, 2, '1/3').c) == (9, 2)
+    assert Line.from_coefficients(1.5, 2, 1) == Line('3*x + 4*y + 2 = 0')
+    assert Line.findLine(Point(1, 2), slope='oo') == Line('x = 1')
+    with pytest.raises(ValueError):
+        Line.findLine(Point(1, 2), intercept=3)
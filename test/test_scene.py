@@ -0,0 +1,72 @@
+import pytest
+from mathworld import Scene, Point, Line, Segment, X_AXIS
+
+
+def _scene():
+    scene = Scene()
+    a, b, c = scene.point(0, 0, name='A'), scene.point(4, 2, name='B'), scene.point(1, 5, name='C')
+    ab = scene.segment(a, b)
+    middle = scene.middle(ab, name='M')
+    bisector = scene.perpendicularBisector(ab)
+    ac = scene.line(a, c)
+    parallel = scene.findParallel(ac, b)
+    crossing = scene.intersection(bisector, ac, name='I')
+    return scene, (a, b, c, ab, middle, bisector, ac, parallel, crossing)
+
+
+def test_lazy_and_incremental():
+    scene, (a, b, c, ab, middle, bisector, ac, parallel, crossing) = _scene()
+    assert all(node.computations == 0 for node in scene)
+    assert crossing.value == Line('y = 5 - 2*x').intersection(Line.findLine(Point(0, 0), Point(1, 5)))
+    assert scene['M'].value == Point(2, 1) and middle.computations == 1 and parallel.computations == 0
+    assert scene.refresh() == 1 and scene.refresh() == 0
+
+    # Moving B recomputes the segment and what depends on it, not the line through A and C
+    b.set(Point(4, 0))
+    assert scene.refresh() == 5 and ac.computations == 1
+    assert middle.value == Point(2, 0) and parallel.value == Line('y = 5*x - 20')
+    assert crossing.value == Point(2, 10)
+
+    # An unchanged input invalidates nothing, a changed one only its own dependents
+    c.set(Point(1, 5))
+    assert scene.refresh() == 0
+    c.set(Point(2, 10))
+    # The line through A and C did not change: the parallel and the intersection are kept
+    assert scene.refresh() == 1 and ac.computations == 2
+    assert ac.value == Line('y = 5*x') and parallel.computations == 2 and crossing.computations == 2
+
+
+def test_errors_and_constants():
+    scene = Scene()
+    a, b = scene.point(1, 1, backend='numeric'), scene.point(2, 2, backend='numeric')
+    line = scene.line(a, b)
+    crossing = scene.intersection(line, X_AXIS)
+    distance = scene.derive(lambda point: point.distancePoint(Point(0, 0)), crossing)
+    assert crossing.value == Point(0, 0, backend='numeric') and distance.value == 0
+
+    # Equal numeric points do not define a line
+    scene.update({a: Point(1, 1, backend='numeric'), b: Point(1, 1, backend='numeric')})
+    with pytest.raises(ValueError):
+        line.value
+    with pytest.raises(ValueError):
+        distance.value
+
+    b.set(Point(3, 1, backend='numeric'))
+    assert crossing.value is None and line.value == Line('y = 1', backend='numeric')
+    with pytest.raises(ValueError):
+        scene.derive(Segment, a, Scene().point(0, 0))
+    with pytest.raises(ValueError):
+        line.set(X_AXIS)
+    with pytest.raises(ValueError):
+        scene.point(0, 0, name=None), scene.input(1, name='k'), scene.input(2, name='k')
+
+
+def test_long_chain():
+    scene = Scene()
+    start = scene.point(0, 0)
+    node = start
+    for _ in range(5000):
+        node = scene.derive(lambda point: Point(point.x + 1, point.y, backend='numeric'), node)
+    assert node.value == Point(5000.0, 0.0, backend='numeric')
+    start.set(Point(1, 0))
+    assert node.value == Point(5001.0, 0.0, backend='numeric')
@@ -0,0 +1,51 @@
+import io
+import pickle
+
+import pytest
+from mathworld import Point, Line, Segment, Circle
+from mathworld.serialization import dump, dumps, load, loads, to_json, from_json
+
+
+def _elements():
+    return [Point(3, '-1/2'), Point(1.5, 2, backend='numeric'), Point('sqrt(2)', 2 ** 70),
+            Line('y = 2*x/3 + 1'), Line('y = sqrt(3)*x'), Line('y = x + 1', backend='numeric'),
+            Segment(Point(0, 0), Point(1, 1)), Segment(Point(0, 0), Point(3, 4, backend='numeric')),
+            Circle(Point(1, 2), '1/2'), Circle(Point(1, 2), 2, backend='numeric')]
+
+
+def _same(element1, element2):
+    if isinstance(element1, Segment):
+        return element1.point1 == element2.point1 and element1.point2 == element2.point2
+    elif isinstance(element1, Circle):
+        return element1.center == element2.center and element1.radius == element2.radius
+    return element1 == element2
+
+
+def test_pickle():
+    elements = _elements()
+    elements[3].equation, elements[6].precompute()
+    restored = pickle.loads(pickle.dumps(elements))
+    assert all(map(_same, elements, restored))
+    assert restored[3]._equation is None and 'length' not in vars(restored[6])
+    assert restored[3].slope == elements[3].slope and restored[6].length == elements[6].length
+    assert str(restored[8]) == str(elements[8])
+
+
+def test_binary_and_json():
+    elements = _elements()
+    assert all(map(_same, elements, loads(dumps(elements))))
+    assert all(map(_same, elements, from_json(to_json(elements))))
+
+    file = io.BytesIO()
+    assert dump(iter(elements), file) == len(elements)
+    file.seek(0)
+    assert _same(next(load(file)), elements[0])
+
+    with pytest.raises(ValueError):
+        loads(b'not mathworld')
+    with pytest.raises(ValueError):
+        loads(dumps(elements)[:-3])
+    with pytest.raises(ValueError):
+        dumps([object()])
+    with pytest.raises(ValueError):
+        from_json('[["line", "sympy", 1, 2]]')
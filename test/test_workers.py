@@ -0,0 +1,88 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mathworld import Line, Point, solve_equation, solve_system, use_backend
+from mathworld.workers import SolveTimeout, WorkerPool, aintersection, asolve_system
+
+# Runs for minutes in SymPy
+_HARD = (['x**7 + 3*x**5*y - y**3*x + 17 = 0', 'x**5*y**3 + x*y - 9 = 0'], ['x', 'y'])
+
+
+def test_timeout_argument():
+    line1, line2 = Line('y = 2*x + 1'), Line('y = -x + 3')
+    assert line1.intersection(line2, timeout=30) == line1.intersection(line2)
+    assert line1.intersection(Line('2*y = 4*x + 2'), timeout=30) is line1
+    assert Line('y = 3*x/7 + 2', timeout=30) == Line('y = 3*x/7 + 2')
+    assert Point.findPoint(line1, Point(0, 1), 2, timeout=30) == Point.findPoint(line1, Point(0, 1), 2)
+    assert solve_equation('x = x + 1', timeout=30) is None
+    assert solve_system(['x + y = 1', 'x - y = 0'], ['x', 'y'], timeout=30) == solve_system(['x + y = 1', 'x - y = 0'], ['x', 'y'])
+    with use_backend('numeric'):
+        assert Line('y = x/3', timeout=30).backend == 'numeric'
+
+    with pytest.raises(SolveTimeout):
+        solve_system(*_HARD, timeout=0.2)
+    with pytest.raises(ValueError):
+        Point.findPoint(line1, Point(5, 5), 1, timeout=30)
+
+
+def test_async_cancellation():
+    pool = WorkerPool(max_idle=2)
+
+    async def main():
+        task = asyncio.create_task(pool.arun(solve_system, *_HARD))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with pytest.raises(SolveTimeout):
+            await asolve_system(*_HARD, timeout=0.2)
+        return await aintersection(Line('y = x'), Line('y = -x + 2'))
+
+    assert asyncio.run(main()) == Point(1, 1)
+    assert pool._idle == []
+    pool.shutdown()
+
+
+def test_concurrent_timeouts():
+    # More calls than workers: the wait for a worker counts against the timeout
+    pool = WorkerPool(max_workers=os.cpu_count())
+
+    async def call():
+        with pytest.raises(SolveTimeout):
+            await pool.arun(solve_system, *_HARD, timeout=0.5)
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(2 * os.cpu_count() + 4)))
+        return time.perf_counter() - start
+
+    assert asyncio.run(main()) < 1.5
+    assert pool._busy == 0
+    pool.shutdown()
+
+
+def test_queued_calls():
+    pool = WorkerPool(max_workers=2)
+    lines = [(Line(f'y = {i}*x'), Line('y = -x + 2')) for i in range(6)]
+
+    async def main():
+        # Cancelled while waiting for a worker
+        blocked = [asyncio.create_task(pool.arun(solve_system, *_HARD)) for _ in range(2)]
+        queued = asyncio.create_task(pool.arun(Line.intersection, *lines[0]))
+        await asyncio.sleep(0.1)
+        queued.cancel()
+        for task in blocked:
+            task.cancel()
+        await asyncio.gather(queued, *blocked, return_exceptions=True)
+        return await asyncio.gather(*(pool.arun(Line.intersection, *pair, timeout=30) for pair in lines))
+
+    assert asyncio.run(main()) == [line1.intersection(line2) for line1, line2 in lines]
+    with ThreadPoolExecutor(4) as threads:
+        results = list(threads.map(lambda pair: pool.run(Line.intersection, *pair, timeout=30), lines))
+    assert results == [line1.intersection(line2) for line1, line2 in lines]
+    assert pool._busy == 0 and len(pool._idle) <= 2
+    pool.shutdown()